@@ -0,0 +1,40 @@
+"""Compares collecting the values of a few properties from `Page` objects
+and building the columns directly from the raw pages.
+
+Run from the root of the repository with `python -m benchmarks.columns`.
+"""
+
+import copy
+import json
+import timeit
+from pathlib import Path
+
+from nopy.columns import Columns
+from nopy.objects.page import Page
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+NUMBER = 2000
+PROPS = ("Created number", "Date", "Status", "Multi select")
+
+
+def from_pages(pages: list[dict]) -> dict[str, list]:
+
+    parsed = [Page.from_dict(page) for page in pages]
+    return {name: [page.properties[name] for page in parsed] for name in PROPS}
+
+
+def main():
+
+    with open(DATA_DIR / "full-page.json") as f:
+        page = json.load(f)
+
+    # Parsing pages sets keys on the raw dictionaries, so every run gets
+    # its own copies.
+    for label, func in (("pages", from_pages), ("columns", Columns.from_raw_pages)):
+        pages = [copy.deepcopy(page) for _ in range(NUMBER)]
+        elapsed = timeit.timeit(lambda: func(pages), number=1)
+        print(f"{label:7} {elapsed / NUMBER * 1e6:8.2f}us per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compares the JSON codecs when encoding and decoding the recorded
+payloads, along with a query response of 100 wide pages.
+
+Run from the root of the repository with `python -m benchmarks.json_codec`.
+"""
+
+import json
+import timeit
+from pathlib import Path
+
+from nopy.codec import PREFERRED_CODECS
+from nopy.codec import get_codec
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+NUMBER = 200
+
+
+def load_payloads() -> dict[str, object]:
+
+    payloads: dict[str, object] = {}
+    for path in sorted(DATA_DIR.rglob("*.json")):
+        with open(path) as f:
+            payloads[path.name] = json.load(f)
+    payloads["query (100 pages)"] = {
+        "object": "list",
+        "results": [payloads["full-page.json"]] * 100,
+        "has_more": False,
+        "next_cursor": None,
+    }
+    return payloads
+
+
+def main():
+
+    payloads = load_payloads()
+    for name in PREFERRED_CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+
+        for label, payload in payloads.items():
+            encoded = codec.dumps(payload)
+            dumps = timeit.timeit(lambda: codec.dumps(payload), number=NUMBER)
+            loads = timeit.timeit(lambda: codec.loads(encoded), number=NUMBER)
+            print(
+                f"{name:6} {label:20} encode {dumps / NUMBER * 1e6:9.1f}us"
+                f"  decode {loads / NUMBER * 1e6:9.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
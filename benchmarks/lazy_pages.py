@@ -0,0 +1,34 @@
+"""Compares parsing pages eagerly and lazily when only a single property
+of each page is read.
+
+Run from the root of the repository with `python -m benchmarks.lazy_pages`.
+"""
+
+import copy
+import json
+import timeit
+from pathlib import Path
+
+from nopy.objects.page import Page
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+NUMBER = 2000
+
+
+def main():
+
+    with open(DATA_DIR / "full-page.json") as f:
+        page = json.load(f)
+
+    for lazy in (False, True):
+        pages = iter([copy.deepcopy(page) for _ in range(NUMBER)])
+        elapsed = timeit.timeit(
+            lambda: Page.from_dict(next(pages), lazy=lazy).properties["Status"],
+            number=NUMBER,
+        )
+        label = "lazy" if lazy else "eager"
+        print(f"{label:5} {elapsed / NUMBER * 1e6:8.2f}us per page")
+
+
+if __name__ == "__main__":
+    main()
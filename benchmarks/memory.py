@@ -0,0 +1,43 @@
+"""Measures the memory used to hold parsed pages.
+
+Run from the root of the repository with `python -m benchmarks.memory`.
+"""
+
+import copy
+import json
+import tracemalloc
+from pathlib import Path
+
+from nopy.objects.page import Page
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+NUMBER = 5000
+# The number of rich text segments in the text property of each page.
+SEGMENTS = 20
+
+
+def make_page(page: dict) -> dict:
+
+    page = copy.deepcopy(page)
+    rich_text = page["properties"]["Created text"]["rich_text"]
+    page["properties"]["Created text"]["rich_text"] = rich_text * SEGMENTS
+    return page
+
+
+def main():
+
+    with open(DATA_DIR / "full-page.json") as f:
+        page = json.load(f)
+    raw_pages = [make_page(page) for _ in range(NUMBER)]
+
+    tracemalloc.start()
+    pages = [Page.from_dict(raw) for raw in raw_pages]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{len(pages)} pages: {size / 1024 / 1024:.1f}MiB")
+    print(f"{size / len(pages) / 1024:.1f}KiB per page")
+
+
+if __name__ == "__main__":
+    main()
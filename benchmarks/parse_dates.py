@@ -0,0 +1,66 @@
+"""Compares the cost of parsing the timestamps of pages with `dateutil`
+and with `nopy.dates.parse_datetime`.
+
+Run from the root of the repository with `python -m benchmarks.parse_dates`.
+"""
+
+import copy
+import json
+import timeit
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+from dateutil.parser import parse
+
+from nopy.dates import parse_datetime
+from nopy.objects.page import Page
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+NUMBER = 2000
+
+TIMESTAMPS = [
+    "2022-12-06T04:52:00.000Z",
+    "2022-12-06T10:22:00.000+05:30",
+    "2022-12-06",
+]
+PATCHED = [
+    "nopy.utils.parse_datetime",
+    "nopy.props.common.parse_datetime",
+    "nopy.props.page_props.parse_datetime",
+]
+
+
+def per_call(stmt, number: int = NUMBER) -> float:
+    return timeit.timeit(stmt, number=number) / number * 1e6
+
+
+def main():
+
+    with open(DATA_DIR / "full-page.json") as f:
+        page = json.load(f)
+    pages = [copy.deepcopy(page) for _ in range(NUMBER)]
+
+    print("Per timestamp (us)")
+    for value in TIMESTAMPS:
+        before = per_call(lambda: parse(value))
+        # Clearing the cache to measure the cost of the actual parsing.
+        after = per_call(lambda: (parse_datetime.cache_clear(), parse_datetime(value)))
+        cached = per_call(lambda: parse_datetime(value))
+        print(
+            f"  {value:32} dateutil {before:6.2f}  fast {after:6.2f}  cached {cached:6.2f}"
+        )
+
+    print("Per page with Page.from_dict (us)")
+    dateutil_pages = iter(copy.deepcopy(pages))
+    with ExitStack() as stack:
+        for target in PATCHED:
+            stack.enter_context(mock.patch(target, parse))
+        before = per_call(lambda: Page.from_dict(next(dateutil_pages)))
+    fast_pages = iter(pages)
+    after = per_call(lambda: Page.from_dict(next(fast_pages)))
+    print(f"  dateutil {before:8.2f}  fast {after:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
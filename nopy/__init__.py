@@ -1,5 +1,6 @@
 # flake8: noqa
 
+from .async_client import AsyncNotionClient
 from .client import ClientConfig
 from .client import NotionClient
 from .properties import Properties
@@ -0,0 +1,746 @@
+import asyncio
+from types import TracebackType
+from typing import Any
+from typing import AsyncGenerator
+from typing import ClassVar
+from typing import Iterable
+from typing import Optional
+from typing import Set
+from typing import Type
+from typing import Union
+
+import httpx
+
+from nopy.blocks import aappend_blocks
+from nopy.blocks import awalk_blocks
+from nopy.bulk import BulkReport
+from nopy.bulk import arun_bulk
+from nopy.client import APIRequest
+from nopy.client import BaseClient
+from nopy.objects.block import Block
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.objects.user import Bot
+from nopy.objects.user import User
+from nopy.props.base import ObjectProperty
+from nopy.props.common import RichText
+from nopy.types import PageProps
+from nopy.utils import apaginate
+
+
+class AsyncNotionClient(BaseClient):
+    """The async client that can be used to interact with the Notion API.
+
+    It mirrors `NotionClient`, except that all the API calls are coroutines
+    and the paginated endpoints return async generators. Any `Database` or
+    `Page` bound to this client returns awaitables/async generators from
+    the methods that make API calls.
+    """
+
+    is_async: ClassVar[bool] = True
+
+    # ------ Database related endpoints ------
+
+    async def retrieve_db(self, db_id: str) -> Database:
+        """Retreives the database.
+
+        Attributes:
+            db_id: The id of the database to retrieve.
+
+        Returns:
+            A `Database` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._retrieve_db_request(db_id))
+
+    def query_db(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: Optional[bool] = None,
+    ) -> AsyncGenerator[Page, None]:
+        """Query a database.
+
+        Attributes:
+            db_id: The id of the database to query.
+            query: The query in the Notion format.
+            max_pages:
+                The maximum number of pages to return. If the value is 0,
+                then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+                If the value is 0, then nothing is fetched ahead.
+            lazy:
+                Whether the properties of the pages are only parsed when
+                they're first looked up. If `None`, then the `lazy_pages`
+                configuration option is used.
+
+        Returns:
+            An async generator that yields a single `Page` instance at a time.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return apaginate(
+            self._query_db_raw,
+            self._interned(Page.from_dict),
+            max_pages=max_pages,
+            map_args={"lazy": self._config.lazy_pages if lazy is None else lazy},
+            page_size=page_size,
+            prefetch=prefetch,
+            db_id=db_id,
+            client=self,
+            query=query,
+        )
+
+    async def create_db(self, db: dict[str, Any]) -> Database:
+        """Creates a database.
+
+        Attributes:
+            db: The database as a dictionary in the Notion format.
+
+        Returns:
+            The newly created `Database` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._create_db_request(db))
+
+    async def update_db(self, db_id: str, db: dict[str, Any]) -> Database:
+        """Updates the given database.
+
+        Attributes:
+            db_id: The database id.
+            db: The database as a dictionary in the Notion format.
+
+        Returns:
+            The updated `Database` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._update_db_request(db_id, db))
+
+    # ----- Page related endpoints -----
+
+    async def retrieve_page(self, page_id: str) -> Page:
+        """Retrieves a page.
+
+        Attributes:
+            page_id: The id of the page to retrieve.
+
+        Returns:
+            An instance of `Page`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._retrieve_page_request(page_id))
+
+    async def retrieve_page_property(
+        self, page_id: str, prop_id: str, page_size: int = 100
+    ) -> Union[PageProps, ObjectProperty, list[RichText]]:
+        """Retrieves the page property with all of its values.
+
+        The values of title, rich text, relation, people and rollup
+        properties are paginated by Notion, so they're retrieved in as many
+        requests as needed. For very long values, use
+        `stream_page_property` to avoid holding all of them at once.
+
+        Attributes:
+            page_id: The page id.
+            prop_id: The property id.
+            page_size:
+                The number of values to get from the Notion API per
+                API call.
+
+        Returns:
+            The page property such as `PRichtext` or `PRelation`. The title
+            is returned as a list of `RichText` instead.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Retrieving property '{prop_id}' of page {page_id}")
+        first = await self._page_prop_raw(page_id, prop_id, page_size=page_size)
+        items: list[dict[str, Any]] = list(first.get("results", []))
+        if first.get("has_more", False):
+            rest = apaginate(
+                self._page_prop_raw,
+                lambda item: item,
+                page_size=page_size,
+                page_id=page_id,
+                prop_id=prop_id,
+                start_cursor=first["next_cursor"],
+            )
+            items.extend([item async for item in rest])
+        return self._assemble_page_prop(first, items)
+
+    async def stream_page_property(
+        self, page_id: str, prop_id: str, page_size: int = 100
+    ) -> AsyncGenerator[Any, None]:
+        """Retrieves the values of the page property one at a time.
+
+        Attributes:
+            page_id: The page id.
+            prop_id: The property id.
+            page_size:
+                The number of values to get from the Notion API per
+                API call.
+
+        Returns:
+            An async generator that yields a `RichText` at a time for title
+            and rich text properties, a page id for relations, a `User` for
+            people and a property for each value of a rollup. For the
+            properties that aren't paginated, the property itself is the
+            only value.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        first = await self._page_prop_raw(page_id, prop_id, page_size=page_size)
+        if first["object"] == "property_item":
+            yield self._page_prop_from_dict(first)
+            return
+
+        for item in first["results"]:
+            yield self._page_prop_item(item)
+        if first["has_more"]:
+            rest = apaginate(
+                self._page_prop_raw,
+                self._page_prop_item,
+                page_size=page_size,
+                page_id=page_id,
+                prop_id=prop_id,
+                start_cursor=first["next_cursor"],
+            )
+            async for value in rest:
+                yield value
+
+    async def create_page(self, page: dict[str, Any]) -> Page:
+        """Creates a new page.
+
+        Attributes:
+            page: The page as a dictionary in the Notion format.
+
+        Returns:
+            The newly created `Page` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._create_page_request(page))
+
+    async def update_page(self, page_id: str, page: dict[str, Any]) -> Page:
+        """Updates a page.
+
+        Attributes:
+            page_id: The page id.
+            page: The page as a dictionary in the Notion format.
+
+        Returns:
+            The updated `Page` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._update_page_request(page_id, page))
+
+    # ----- Block related endpoints -----
+
+    async def retrieve_block(self, block_id: str) -> Block:
+        """Retrieves a block.
+
+        Attributes:
+            block_id: The id of the block to retrieve.
+
+        Returns:
+            An instance of `Block`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._retrieve_block_request(block_id))
+
+    def retrieve_block_children(
+        self,
+        block_id: str,
+        recursive: bool = False,
+        workers: int = 8,
+        page_size: int = 100,
+    ) -> AsyncGenerator[Block, None]:
+        """Retrieves the children of a block or a page.
+
+        Attributes:
+            block_id: The id of the block or page.
+            recursive:
+                If `True`, then the nested blocks are retrieved as well.
+                The children of sibling blocks are fetched concurrently.
+            workers:
+                The maximum number of concurrent requests when retrieving
+                the nested blocks.
+            page_size:
+                The number of blocks to get from the Notion API per
+                API call.
+
+        Returns:
+            An async generator that yields a single `Block` instance at a
+            time in the order they appear in the document, with each block
+            followed by its nested blocks.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Retrieving the children of block {block_id}")
+        if not recursive:
+            return apaginate(
+                self._block_children_raw,
+                Block.from_dict,
+                page_size=page_size,
+                client=self,
+                block_id=block_id,
+            )
+
+        async def fetch(parent_id: str, depth: int) -> list[Block]:
+            children = apaginate(
+                self._block_children_raw,
+                Block.from_dict,
+                map_args={"depth": depth},
+                page_size=page_size,
+                client=self,
+                block_id=parent_id,
+            )
+            return [block async for block in children]
+
+        return awalk_blocks(fetch, block_id, workers)
+
+    async def append_block_children(
+        self,
+        block_id: str,
+        blocks: Iterable[Union[Block, dict[str, Any]]],
+        workers: int = 8,
+    ) -> list[Block]:
+        """Appends the blocks, along with the blocks nested in them, to the
+        block or page.
+
+        Any number of blocks can be given. They're sent in batches of the
+        maximum size accepted by Notion, in order. The nested blocks are
+        appended breadth first, with the blocks of different parents being
+        appended concurrently.
+
+        Attributes:
+            block_id: The id of the block or page to append to.
+            blocks:
+                The blocks or the blocks in the Notion format. The nested
+                blocks are given in the 'children' of the content of their
+                parent, as in the Notion format.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The created blocks that were appended directly to the block.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Appending blocks to block {block_id}")
+
+        async def append(
+            parent_id: str, children: list[dict[str, Any]]
+        ) -> list[dict[str, Any]]:
+            request = self._append_children_request(parent_id, children)
+            return await self._call(request)
+
+        created = await aappend_blocks(append, block_id, blocks, workers)
+        return self._appended_blocks(created)
+
+    # ----- Bulk operations -----
+
+    async def bulk_update(
+        self, pages: Iterable[Page], workers: int = 8
+    ) -> BulkReport[Page]:
+        """Updates the pages concurrently.
+
+        Only the changes made to each page are sent, and the pages without
+        any changes are skipped. Failed requests are retried according to
+        the `retry_policy` of the client's configuration, or the default
+        `RetryPolicy` if there's none. The requests are rate limited by
+        the `rate_limit` of the client's configuration.
+
+        Attributes:
+            pages: The pages to update.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The report holding the updated page or the error for every page.
+            The errors are NOT raised.
+        """
+
+        async def update(page: Page) -> Page:
+            body = page._serialize_changes()  # type: ignore
+            return await self.update_page(page.id, body) if body else page
+
+        return await arun_bulk(pages, update, workers, self._bulk_retry_policy)
+
+    async def bulk_archive(
+        self, pages: Iterable[Union[Page, str]], workers: int = 8
+    ) -> BulkReport[Page]:
+        """Archives the pages concurrently.
+
+        Failed requests are retried the same way as in `bulk_update`.
+
+        Attributes:
+            pages: The pages or their ids.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The report holding the archived page or the error for every page.
+            The errors are NOT raised.
+        """
+
+        async def archive(page: Union[Page, str]) -> Page:
+            page_id = page if isinstance(page, str) else page.id
+            return await self.update_page(page_id, {"archived": True})
+
+        return await arun_bulk(pages, archive, workers, self._bulk_retry_policy)
+
+    # ----- User related endpoints -----
+
+    async def retrieve_user(self, user_id: str) -> User:
+        """Retrieves the user with the given id.
+
+        Attributes:
+            user_id: The id of the user being retrieved.
+
+        Returns:
+            An instance of `User` or one of it's subclasses.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._retrieve_user_request(user_id))
+
+    def list_users(self) -> AsyncGenerator[User, None]:
+        """Lists all the users.
+
+        Returns:
+            An async generator that yields an instance of a `User` or one
+            of it's sbuclasses.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info("Listing users...")
+        return apaginate(self._list_users_raw, User.from_dict)
+
+    async def retrieve_me(self) -> Bot:
+        """Retrieves the user associated with the given `NOTION_TOKEN`.
+
+        Returns:
+            An instance of `Bot`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return await self._call(self._retrieve_me_request())
+
+    # ----- Search -----
+
+    def search(
+        self,
+        query: str = "",
+        filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        max_results: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: Optional[bool] = None,
+    ) -> AsyncGenerator[Union[Page, Database], None]:
+        """Searches the pages and databases shared with the integration.
+
+        Attributes:
+            query:
+                The text to match against the titles. If empty, then every
+                page and database is returned.
+            filter:
+                Either 'page' or 'database' to only return objects of that
+                type. If `None`, then both are returned.
+            sort:
+                Either 'ascending' or 'descending' to sort the results by
+                the time they were last edited. If `None`, then the results
+                are sorted by relevance.
+            max_results:
+                The maximum number of results to return. If the value is 0,
+                then all results are returned.
+            page_size:
+                The number of results to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of results to fetch ahead in the
+                background while the current batch is being consumed.
+            lazy:
+                Whether the properties of the pages are only parsed when
+                they're first looked up. If `None`, then the `lazy_pages`
+                configuration option is used.
+
+        Returns:
+            An async generator that yields a single `Page` or `Database`
+            instance at a time.
+
+        Raises:
+            ValueError: Raised if the filter or sort isn't valid.
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return apaginate(
+            self._search_raw,
+            self._search_result,
+            max_pages=max_results,
+            map_args={"lazy": self._config.lazy_pages if lazy is None else lazy},
+            page_size=page_size,
+            prefetch=prefetch,
+            client=self,
+            body=self._search_body(query, filter, sort),
+        )
+
+    async def index_dbs(self, query: str = "") -> dict[str, str]:
+        """Walks through the workspace once and records every database
+        shared with the integration.
+
+        Attributes:
+            query: The text to match against the titles of the databases.
+
+        Returns:
+            The titles of the databases keyed by their ids.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info("Indexing the databases...")
+        entries = apaginate(
+            self._search_raw,
+            self._db_index_entry,
+            body=self._search_body(query, "database", None),
+        )
+        return {db_id: title async for db_id, title in entries}
+
+    # ----- Miscellaneous -----
+
+    async def aclose(self):
+        """Closes the client and cleans up all the resources."""
+
+        for task in list(self._background_tasks):
+            task.cancel()
+        await self._client.aclose()
+
+    # ----- Private Methods -----
+
+    async def _query_db_raw(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+
+        return await self._call(
+            self._query_db_request(db_id, query, start_cursor, page_size)
+        )
+
+    async def _search_raw(
+        self,
+        body: dict[str, Any],
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+
+        return await self._call(self._search_request(body, start_cursor, page_size))
+
+    async def _block_children_raw(
+        self,
+        block_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+
+        return await self._call(
+            self._block_children_request(block_id, start_cursor, page_size)
+        )
+
+    async def _page_prop_raw(
+        self,
+        page_id: str,
+        prop_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+
+        return await self._call(
+            self._page_prop_request(page_id, prop_id, start_cursor, page_size)
+        )
+
+    async def _list_users_raw(self, start_cursor: Optional[str] = None):
+
+        return await self._call(self._list_users_request(start_cursor))
+
+    async def _call(self, api_request: APIRequest) -> Any:
+
+        if api_request.cached is not None:
+            return api_request.cached
+        resp = await self._make_request(
+            api_request.endpoint,
+            api_request.method,
+            api_request.data,
+            api_request.query_params,
+        )
+        return api_request.parse(resp)
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        method: str = "get",
+        data: Optional[dict[Any, Any]] = None,
+        query_params: Optional[dict[str, str]] = None,
+    ):
+
+        request = self._build_request(
+            self._client, endpoint, method, data, query_params
+        )
+        cached, store = self._cached_response(request)
+        if cached is not None:
+            return cached
+        return store(await self._send(request))
+
+    async def _send(self, request: httpx.Request) -> dict[str, Any]:
+
+        attempt = 0
+        while True:
+            if self._rate_limiter:
+                await self._rate_limiter.acquire_async()
+            try:
+                resp = await self._client.send(request)
+            except httpx.TransportError:
+                delay = self._retry_delay(request, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request, attempt, resp)
+                if delay is None:
+                    return self._parse_response(resp)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _revalidate(self, request: httpx.Request, version: int):
+
+        cache: Any = self._config.response_cache
+        path, params = request.url.path, request.url.query.decode()
+
+        async def revalidate():
+            try:
+                response = await self._send(request)
+            except asyncio.CancelledError:
+                cache.revalidation_failed(path, params)
+                raise
+            except Exception as error:
+                self._logger.warning(f" Revalidating {request.url} failed: {error}")
+                cache.revalidation_failed(path, params)
+            else:
+                cache.put(path, params, response, version=version)
+
+        # Keeping a reference to the task so that it's not garbage collected.
+        task = asyncio.ensure_future(revalidate())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _configure_client(self):
+
+        super()._configure_client()
+        self._background_tasks: Set["asyncio.Future[None]"] = set()
+
+        # Configuring the httpx client
+        transport = httpx.AsyncHTTPTransport(
+            retries=self._config.retries,
+            limits=self._limits(),
+            http2=self._config.http2,
+        )
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=self._timeout(),
+            headers=self._base_headers(),
+            base_url=self._config.base_url,
+        )
+
+    # ----- Context Managers -----
+
+    async def __aenter__(self):
+
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_value: BaseException,
+        traceback: TracebackType,
+    ):
+
+        await self._client.__aexit__(exc_type, exc_value, traceback)
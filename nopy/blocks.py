@@ -0,0 +1,242 @@
+"""Traversing and uploading the trees of blocks of pages while making the
+requests for different parent blocks concurrently."""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Generator
+from typing import Iterable
+from typing import Set
+from typing import Union
+
+from nopy.objects.block import Block
+
+FETCH_CHILDREN = Callable[[str, int], list[Block]]
+AFETCH_CHILDREN = Callable[[str, int], Awaitable[list[Block]]]
+APPEND_CHILDREN = Callable[[str, list[dict[str, Any]]], list[dict[str, Any]]]
+AAPPEND_CHILDREN = Callable[
+    [str, list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]
+]
+
+# The maximum number of blocks Notion accepts in a single append request.
+MAX_APPEND_BLOCKS = 100
+
+
+def walk_blocks(
+    fetch: FETCH_CHILDREN, block_id: str, workers: int = 8
+) -> Generator[Block, None, None]:
+    """Yields every block nested under the block in document order.
+
+    As soon as the children of a block are known, the children of each of
+    them are fetched on a pool of threads. So the subtrees of siblings are
+    fetched concurrently while the blocks are yielded one at a time.
+
+    Args:
+        fetch:
+            The function returning all the children of the block with the
+            given id, created with the given depth.
+        block_id: The id of the block or page to start from.
+        workers: The maximum number of concurrent requests.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="nopy-blocks")
+
+    def walk(future: "Future[list[Block]]") -> Generator[Block, None, None]:
+
+        children = future.result()
+        pending = {
+            child.id: executor.submit(fetch, child.id, child.depth + 1)
+            for child in children
+            if child.has_children
+        }
+        for child in children:
+            yield child
+            if child.id in pending:
+                yield from walk(pending[child.id])
+
+    try:
+        yield from walk(executor.submit(fetch, block_id, 0))
+    finally:
+        # The subtrees that weren't reached are dropped if the caller
+        # stopped iterating early.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def awalk_blocks(
+    fetch: AFETCH_CHILDREN, block_id: str, workers: int = 8
+) -> AsyncGenerator[Block, None]:
+    """The async counterpart of `walk_blocks`, where the children are
+    fetched on tasks of which at most `workers` make requests at a time."""
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    semaphore = asyncio.Semaphore(workers)
+    tasks: Set["asyncio.Future[list[Block]]"] = set()
+
+    async def bounded(block_id: str, depth: int) -> list[Block]:
+        async with semaphore:
+            return await fetch(block_id, depth)
+
+    def schedule(block_id: str, depth: int) -> "asyncio.Future[list[Block]]":
+        task = asyncio.ensure_future(bounded(block_id, depth))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+
+    async def walk(task: "asyncio.Future[list[Block]]") -> AsyncGenerator[Block, None]:
+        children = await task
+        pending = {
+            child.id: schedule(child.id, child.depth + 1)
+            for child in children
+            if child.has_children
+        }
+        for child in children:
+            yield child
+            if child.id in pending:
+                async for block in walk(pending[child.id]):
+                    yield block
+
+    try:
+        async for block in walk(schedule(block_id, 0)):
+            yield block
+    finally:
+        for task in list(tasks):
+            task.cancel()
+
+
+def append_blocks(
+    append: APPEND_CHILDREN,
+    block_id: str,
+    blocks: Iterable[Union[Block, dict[str, Any]]],
+    workers: int = 8,
+) -> list[dict[str, Any]]:
+    """Appends the blocks, along with the blocks nested in them, to the
+    block or page.
+
+    The blocks are sent in batches of up to `MAX_APPEND_BLOCKS`. The
+    batches of the same parent are sent one after the other so that they
+    keep their order. The nested blocks are appended breadth first, on a
+    pool of threads, as soon as the ids of their parents are returned.
+
+    Args:
+        append:
+            The function appending the blocks to the block with the given
+            id and returning the created blocks in the Notion format.
+        block_id: The id of the block or page to append to.
+        blocks: The blocks or the blocks in the Notion format.
+        workers: The maximum number of concurrent requests.
+
+    Returns:
+        The created blocks that were appended directly to the block.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="nopy-blocks")
+    pending: Deque["Future[list[dict[str, Any]]]"] = deque()
+
+    def upload(parent_id: str, blocks: Iterable[Any]) -> list[dict[str, Any]]:
+
+        created: list[dict[str, Any]] = []
+        for chunk in _chunks(map(_split_children, blocks)):
+            results = append(parent_id, [body for body, _ in chunk])
+            for result, (_, children) in zip(_created(results, chunk), chunk):
+                created.append(result)
+                if children:
+                    pending.append(executor.submit(upload, result["id"], children))
+        return created
+
+    try:
+        top_level = executor.submit(upload, block_id, blocks)
+        pending.append(top_level)
+        # Every upload queues the uploads of the nested blocks before it's
+        # done, so nothing is missed once the queue is empty.
+        while pending:
+            pending.popleft().result()
+        return top_level.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+async def aappend_blocks(
+    append: AAPPEND_CHILDREN,
+    block_id: str,
+    blocks: Iterable[Union[Block, dict[str, Any]]],
+    workers: int = 8,
+) -> list[dict[str, Any]]:
+    """The async counterpart of `append_blocks`, where the nested blocks
+    are appended on tasks of which at most `workers` make requests at a
+    time."""
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    semaphore = asyncio.Semaphore(workers)
+    pending: Deque["asyncio.Future[list[dict[str, Any]]]"] = deque()
+
+    async def upload(parent_id: str, blocks: Iterable[Any]) -> list[dict[str, Any]]:
+
+        created: list[dict[str, Any]] = []
+        for chunk in _chunks(map(_split_children, blocks)):
+            async with semaphore:
+                results = await append(parent_id, [body for body, _ in chunk])
+            for result, (_, children) in zip(_created(results, chunk), chunk):
+                created.append(result)
+                if children:
+                    task = asyncio.ensure_future(upload(result["id"], children))
+                    pending.append(task)
+        return created
+
+    try:
+        top_level = await upload(block_id, blocks)
+        while pending:
+            await pending.popleft()
+        return top_level
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _split_children(
+    block: Union[Block, dict[str, Any]]
+) -> tuple[dict[str, Any], list[Any]]:
+
+    # The nested blocks are taken out so that they're appended once the
+    # id of their parent is known.
+    if isinstance(block, Block):
+        block = block.serialize()
+    block_type = block["type"]
+    content = dict(block[block_type])
+    children = content.pop("children", None) or []
+    return {**block, block_type: content}, children
+
+
+def _chunks(items: Iterable[Any]) -> Generator[list[Any], None, None]:
+
+    chunk: list[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == MAX_APPEND_BLOCKS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _created(results: list[dict[str, Any]], chunk: list[Any]) -> list[dict[str, Any]]:
+
+    # The appended blocks are the last ones in case the response holds
+    # the existing children of the parent as well.
+    start = len(results) - len(chunk)
+    return results[start:] if start > 0 else results
@@ -0,0 +1,195 @@
+"""Running many writes concurrently while collecting the outcome of each."""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Set
+from typing import TypeVar
+
+from nopy.retry import RetryPolicy
+from nopy.retry import fallback_policy
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """The outcome of a single item of a bulk operation.
+
+    Attributes:
+        index: The position of the item in the given items.
+        item: The item.
+        result: The result of the operation, such as the created page.
+        error: The error raised if the operation failed.
+        latency: The number of seconds the operation took.
+    """
+
+    index: int
+    item: Any
+    result: Optional[T] = None
+    error: Optional[Exception] = None
+    latency: float = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkReport(Generic[T]):
+    """The outcome of a bulk operation.
+
+    The failures of individual items don't stop the operation. They're
+    recorded in the report instead.
+
+    Attributes:
+        results: The outcome of every item in the order of the items.
+        elapsed: The number of seconds the whole operation took.
+    """
+
+    results: list[BulkResult[T]] = field(default_factory=list)
+    elapsed: float = 0
+
+    @property
+    def succeeded(self) -> list[BulkResult[T]]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[BulkResult[T]]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def latencies(self) -> list[float]:
+        return [result.latency for result in self.results]
+
+    def raise_for_errors(self):
+        """Raises the error of the first item that failed, if any."""
+
+        for result in self.results:
+            if result.error is not None:
+                raise result.error
+
+    def __len__(self) -> int:
+
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[BulkResult[T]]:
+
+        return iter(self.results)
+
+
+def _run_one(
+    index: int,
+    item: Any,
+    func: Callable[[Any], T],
+    retry_policy: Optional[RetryPolicy],
+) -> BulkResult[T]:
+
+    start = time.perf_counter()
+    try:
+        with fallback_policy(retry_policy):
+            result = func(item)
+    except Exception as error:
+        return BulkResult(index, item, error=error, latency=time.perf_counter() - start)
+    return BulkResult(index, item, result, latency=time.perf_counter() - start)
+
+
+def run_bulk(
+    items: Iterable[Any],
+    func: Callable[[Any], T],
+    workers: int = 8,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> BulkReport[T]:
+    """Calls the function on every item using a pool of threads.
+
+    Only a bounded number of items are in flight at a time, so the items
+    can be a generator of any length.
+
+    Args:
+        items: The items to call the function on.
+        func: The function making the request for a single item.
+        workers: The maximum number of concurrent calls.
+        retry_policy:
+            The policy used to retry the failed requests of every item
+            when the client has no retry policy configured.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    start = time.perf_counter()
+    report: BulkReport[T] = BulkReport()
+    with ThreadPoolExecutor(workers) as executor:
+        pending: Set["Future[BulkResult[T]]"] = set()
+        for index, item in enumerate(items):
+            if len(pending) >= workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                report.results.extend(future.result() for future in done)
+            pending.add(executor.submit(_run_one, index, item, func, retry_policy))
+        report.results.extend(future.result() for future in pending)
+
+    report.results.sort(key=lambda result: result.index)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def arun_bulk(
+    items: Iterable[Any],
+    func: Callable[[Any], Awaitable[T]],
+    workers: int = 8,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> BulkReport[T]:
+    """Awaits the function on every item with a bounded number of
+    concurrent tasks.
+
+    Args:
+        items: The items to call the function on.
+        func: The coroutine function making the request for a single item.
+        workers: The maximum number of concurrent calls.
+        retry_policy:
+            The policy used to retry the failed requests of every item
+            when the client has no retry policy configured.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    start = time.perf_counter()
+    report: BulkReport[T] = BulkReport()
+    # The workers share the iterator, so each item is taken exactly once.
+    iterator = enumerate(items)
+
+    async def worker():
+        for index, item in iterator:
+            item_start = time.perf_counter()
+            try:
+                # Every worker runs in its own task, so the policy only
+                # applies to the requests of the items.
+                with fallback_policy(retry_policy):
+                    result = await func(item)
+            except Exception as error:
+                latency = time.perf_counter() - item_start
+                report.results.append(
+                    BulkResult(index, item, error=error, latency=latency)
+                )
+            else:
+                latency = time.perf_counter() - item_start
+                report.results.append(BulkResult(index, item, result, latency=latency))
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    report.results.sort(key=lambda result: result.index)
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,368 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections import defaultdict
+from typing import Any
+from typing import ClassVar
+from typing import Optional
+from typing import Union
+
+from nopy.constants import APIEndpoints
+from nopy.constants import endpoint_template
+
+
+def canonical_json(value: Any) -> str:
+    """Serializes the value to JSON in a canonical form so that equal
+    dictionaries give the same string regardless of the key order."""
+
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _normalize_id(db_id: str) -> str:
+
+    # Notion accepts ids both with and without the dashes.
+    return db_id.replace("-", "")
+
+
+class QueryCache:
+    """An in-memory cache of the results of database queries.
+
+    Each response of the Notion API to a database query is cached with
+    the id of the database and the canonical JSON of the query, including
+    the cursor and the page size, as the key. Entries expire after their
+    TTL and the least recently used entries are evicted once the total
+    size of the cached responses exceeds `max_bytes`.
+
+    The cache is safe to share between threads and between clients.
+    Clients configured with the cache invalidate the entries of a database
+    when pages in it are created or updated, or when it's updated.
+
+    Attributes:
+        ttl: The default number of seconds an entry is valid for.
+        max_bytes: The maximum total size of the cached responses as JSON.
+        hits: The number of lookups that were served from the cache.
+        misses: The number of lookups that weren't served from the cache.
+    """
+
+    def __init__(self, ttl: float = 60, max_bytes: int = 64 * 1024 * 1024):
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # The keys mapped to the expiry time and the JSON of the response.
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        # The number of times each database has been invalidated. This is
+        # used to discard the responses to the requests that were in
+        # flight during an invalidation.
+        self._versions: defaultdict[str, int] = defaultdict(int)
+        # The number of times all the databases were invalidated.
+        self._epoch = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached responses in bytes."""
+
+        return self._size
+
+    def version(self, db_id: str) -> int:
+        """Gets the current version of the cached entries of a database."""
+
+        with self._lock:
+            return self._epoch + self._versions[_normalize_id(db_id)]
+
+    def get(self, db_id: str, query: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Gets the cached response to the query, if present and not expired.
+
+        A new copy of the response is returned on each call, so it can be
+        modified freely.
+        """
+
+        key = (_normalize_id(db_id), canonical_json(query))
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(entry[1])
+
+    def put(
+        self,
+        db_id: str,
+        query: dict[str, Any],
+        response: dict[str, Any],
+        ttl: Optional[float] = None,
+        version: Optional[int] = None,
+    ):
+        """Caches the response to the query.
+
+        Args:
+            db_id: The id of the database that was queried.
+            query: The query that was sent to Notion.
+            response: The response returned by Notion.
+            ttl:
+                The number of seconds the entry is valid for. If not
+                provided, then the default TTL is used.
+            version:
+                The version of the database, as given by `version()`,
+                before the request was made. The response isn't cached
+                if the database was invalidated since then.
+        """
+
+        db_id = _normalize_id(db_id)
+        key = (db_id, canonical_json(query))
+        value = json.dumps(response, separators=(",", ":"))
+        if len(value) > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            current = self._epoch + self._versions[db_id]
+            if version is not None and version != current:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, db_id: Optional[str] = None):
+        """Removes the cached entries of the database or of all the
+        databases if `db_id` isn't provided."""
+
+        with self._lock:
+            if db_id is None:
+                self._epoch += 1
+                self._entries.clear()
+                self._size = 0
+                return
+
+            db_id = _normalize_id(db_id)
+            self._versions[db_id] += 1
+            for key in [key for key in self._entries if key[0] == db_id]:
+                self._remove(key)
+
+    def clear(self):
+        """Removes all the cached entries."""
+
+        self.invalidate()
+
+    def _remove(self, key: tuple[str, str]):
+
+        _, value = self._entries.pop(key)
+        self._size -= len(value)
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+
+class ResponseCache:
+    """An in-memory cache of the responses to GET requests.
+
+    Only the endpoints with a TTL are cached. An entry is fresh until its
+    TTL passes. For `stale_while_revalidate` seconds after that, the stale
+    response is still returned while the client fetches a new one in the
+    background. The least recently used entries are evicted once the total
+    size of the cached responses exceeds `max_bytes`.
+
+    Clients configured with the cache invalidate the entries of databases
+    and pages when they're updated through the client.
+
+    Attributes:
+        ttls:
+            The endpoints mapped to the number of seconds their responses
+            are fresh for.
+        stale_while_revalidate:
+            The number of seconds after the TTL during which a stale
+            response is returned while it's revalidated.
+        max_bytes: The maximum total size of the cached responses as JSON.
+        hits: The number of lookups that were served from the cache.
+        misses: The number of lookups that weren't served from the cache.
+    """
+
+    DEFAULT_TTLS: ClassVar[dict[APIEndpoints, float]] = {
+        APIEndpoints.DB_RETRIEVE: 300,
+        APIEndpoints.PAGE_RETRIEVE: 30,
+        APIEndpoints.USER_RETRIEVE: 3600,
+        APIEndpoints.USER_TOKEN_BOT: 3600,
+        APIEndpoints.USER_LIST: 300,
+    }
+
+    def __init__(
+        self,
+        ttls: Optional[dict[Union[APIEndpoints, str], float]] = None,
+        stale_while_revalidate: float = 0,
+        max_bytes: int = 16 * 1024 * 1024,
+    ):
+        """
+        Args:
+            ttls:
+                The TTL in seconds of the responses of each endpoint. The
+                endpoints can be given as `APIEndpoints` or as their values.
+                These are merged with `DEFAULT_TTLS`. A TTL of 0 disables
+                caching for the endpoint.
+            stale_while_revalidate:
+                The number of seconds after the TTL during which a stale
+                response is returned while it's revalidated.
+            max_bytes: The maximum total size of the cached responses.
+        """
+
+        merged: dict[Union[APIEndpoints, str], float] = {**self.DEFAULT_TTLS}
+        merged.update(ttls or {})
+        self.ttls: dict[str, float] = {
+            endpoint.value if isinstance(endpoint, APIEndpoints) else endpoint: ttl
+            for endpoint, ttl in merged.items()
+        }
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # The keys mapped to the time the response was stored and its JSON.
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._revalidating: set[str] = set()
+        # The number of invalidations so far. Used to discard the responses
+        # to the requests that were in flight during an invalidation.
+        self._version = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached responses in bytes."""
+
+        return self._size
+
+    @property
+    def version(self) -> int:
+        """The number of invalidations made so far."""
+
+        return self._version
+
+    def ttl(self, path: str) -> float:
+        """Gets the TTL of the responses of the endpoint of the URL path."""
+
+        return self.ttls.get(endpoint_template(path), 0)
+
+    def get(self, path: str, params: str = "") -> Optional[tuple[dict[str, Any], bool]]:
+        """Gets the cached response for the URL path and query string.
+
+        Returns:
+            A tuple of a copy of the response and whether it's stale, or
+            `None` if there's no usable response. A stale response is only
+            returned if it isn't already being revalidated, in which case
+            the caller is expected to revalidate it.
+        """
+
+        key = self._key(path, params)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            age = time.monotonic() - entry[0]
+            ttl = self.ttl(path)
+            if age > ttl + self.stale_while_revalidate:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            stale = age > ttl
+            if stale:
+                if key in self._revalidating:
+                    # Someone else is already revalidating the entry.
+                    stale = False
+                else:
+                    self._revalidating.add(key)
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(entry[1]), stale
+
+    def put(
+        self,
+        path: str,
+        params: str,
+        response: dict[str, Any],
+        version: Optional[int] = None,
+    ):
+        """Caches the response for the URL path and query string.
+
+        Args:
+            path: The path of the URL that was requested.
+            params: The query string of the URL that was requested.
+            response: The response returned by Notion.
+            version:
+                The value of `version` before the request was made. The
+                response isn't cached if there was an invalidation since.
+        """
+
+        key = self._key(path, params)
+        value = json.dumps(response, separators=(",", ":"))
+        with self._lock:
+            self._revalidating.discard(key)
+            if not self.ttl(path) or len(value) > self.max_bytes:
+                return
+            if version is not None and version != self._version:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def revalidation_failed(self, path: str, params: str = ""):
+        """Allows the entry to be revalidated again after a failed attempt."""
+
+        with self._lock:
+            self._revalidating.discard(self._key(path, params))
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Removes the cached responses of the endpoint, such as
+        'pages/some-id', along with the responses of the endpoints under
+        it. All the responses are removed if no endpoint is given."""
+
+        with self._lock:
+            self._version += 1
+            if endpoint is None:
+                self._entries.clear()
+                self._size = 0
+                return
+
+            suffix = "/" + endpoint.strip("/").replace("-", "")
+            for key in list(self._entries):
+                path = key.split("?", 1)[0]
+                if path.endswith(suffix) or suffix + "/" in path:
+                    self._remove(key)
+
+    def clear(self):
+        """Removes all the cached responses."""
+
+        self.invalidate()
+
+    def _key(self, path: str, params: str) -> str:
+
+        # Notion accepts ids both with and without the dashes.
+        key = path.rstrip("/").replace("-", "")
+        return f"{key}?{params}" if params else key
+
+    def _remove(self, key: str):
+
+        _, value = self._entries.pop(key)
+        self._size -= len(value)
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
@@ -1,29 +1,58 @@
+import importlib
+import itertools
 import logging
 import os
+import threading
+import time
 from dataclasses import dataclass
-from json import JSONDecodeError
-from pprint import pprint
 from types import TracebackType
 from typing import Any
+from typing import Callable
+from typing import ClassVar
 from typing import Generator
+from typing import Iterable
 from typing import Optional
 from typing import Type
+from typing import TypeVar
 from typing import Union
 
 import httpx
 
+from nopy.blocks import append_blocks
+from nopy.blocks import walk_blocks
+from nopy.bulk import BulkReport
+from nopy.bulk import run_bulk
+from nopy.cache import QueryCache
+from nopy.cache import ResponseCache
+from nopy.codec import get_codec
 from nopy.constants import API_BASE_URL
 from nopy.constants import API_VERSION
 from nopy.constants import APIEndpoints
 from nopy.errors import APIResponseError
 from nopy.errors import HTTPError
 from nopy.errors import TokenNotFoundError
+from nopy.intern import InternPool
+from nopy.objects.block import Block
 from nopy.objects.database import Database
 from nopy.objects.page import Page
 from nopy.objects.user import Bot
 from nopy.objects.user import User
+from nopy.props.base import ObjectProperty
+from nopy.props.common import RichText
+from nopy.rate_limit import RateLimiter
+from nopy.retry import RetryPolicy
+from nopy.retry import get_fallback_policy
+from nopy.types import PageProps
+from nopy.types import Props
 from nopy.utils import make_logger
 from nopy.utils import paginate
+from nopy.utils import rich_text_list
+
+T = TypeVar("T")
+
+# The accepted values of the 'filter' and 'sort' arguments of `search`.
+SEARCH_FILTERS = ("page", "database")
+SEARCH_SORTS = ("ascending", "descending")
 
 
 @dataclass
@@ -34,11 +63,64 @@ class ClientConfig:
         base_url: The base url.
         api_version: The version of the Notion API.
         timeout:
-            The number of seconds to wait before raising an error.
+            The number of seconds to wait before raising an error. It's
+            used for every phase of a request that isn't given its own
+            timeout below.
+        connect_timeout:
+            The number of seconds to wait for a connection to be made.
+        read_timeout:
+            The number of seconds to wait for a chunk of the response.
+        write_timeout:
+            The number of seconds to wait for a chunk of the request to
+            be sent.
+        pool_timeout:
+            The number of seconds to wait for a connection from the pool.
         retries:
             The number of retries to make before raising an error.
         log_level: The level of the logging.
         logger: The logger to use when logging.
+        rate_limit:
+            The maximum average number of requests per second. The limit
+            is shared by all the clients, sync or async, using the same
+            token. If the value is 0, then requests are not rate limited.
+        rate_limit_burst:
+            The maximum number of requests that can be made in a single
+            burst when rate limiting is enabled.
+        retry_policy:
+            The policy used to retry requests that failed due to rate
+            limiting, server errors or transport errors. If not provided,
+            then failed requests are not retried, except for the requests
+            of bulk operations which use the default `RetryPolicy`.
+        query_cache:
+            The cache used to serve repeated database queries from memory.
+            The same cache can be shared by several clients. If not
+            provided, then every query is sent to Notion.
+        response_cache:
+            The cache used for the responses to GET requests such as
+            retrieving databases, pages and users. If not provided, then
+            every request is sent to Notion.
+        lazy_pages:
+            Whether the properties of the pages returned by the client
+            are only parsed when they're first looked up.
+        intern_pool:
+            The pool used to share a single instance of the users, options
+            and annotations that repeat across the retrieved pages and
+            databases. The shared instances can't be modified. If not
+            provided, then every object is a separate instance.
+        json_codec:
+            The JSON codec used for request and response bodies.
+        max_connections:
+            The maximum number of concurrent connections. If None, then
+            there's no limit.
+        max_keepalive_connections:
+            The maximum number of idle connections kept open for reuse.
+            If None, then there's no limit.
+        keepalive_expiry:
+            The number of seconds an idle connection is kept open for.
+        http2:
+            Whether to use HTTP/2, so that concurrent requests are
+            multiplexed over a single connection. Requires the 'h2'
+            package, which is installed by `pip install httpx[http2]`.
     """
 
     base_url: str = API_BASE_URL
@@ -47,10 +129,58 @@ class ClientConfig:
     retries: int = 0
     log_level: int = logging.WARNING
     logger: Optional[logging.Logger] = None
+    rate_limit: float = 0
+    rate_limit_burst: int = 3
+    retry_policy: Optional[RetryPolicy] = None
+    query_cache: Optional[QueryCache] = None
+    response_cache: Optional[ResponseCache] = None
+    lazy_pages: bool = False
+    intern_pool: Optional[InternPool] = None
+    json_codec: str = "auto"
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+
+
+def _identity(resp: dict[str, Any]) -> Any:
+    return resp
 
 
-class NotionClient:
-    """The client that can be used to interact with the Notion API."""
+@dataclass
+class APIRequest:
+    """A request to the Notion API along with how its response is parsed.
+
+    The requests are built by `BaseClient` and sent by either of the clients,
+    so that the clients only differ in how the requests are sent.
+
+    Attributes:
+        endpoint: The endpoint relative to the base url.
+        method: The HTTP method.
+        data: The body of the request.
+        query_params: The query parameters.
+        parse: The function returning the result from the response.
+        cached:
+            The response that was found from a cache. If it's given, then
+            it's returned as is without making the request.
+    """
+
+    endpoint: str
+    method: str = "get"
+    data: Optional[dict[str, Any]] = None
+    query_params: Optional[dict[str, str]] = None
+    parse: Callable[[dict[str, Any]], Any] = _identity
+    cached: Optional[dict[str, Any]] = None
+
+
+class BaseClient:
+    """The base class holding the logic shared by the sync and async clients."""
+
+    is_async: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -85,6 +215,449 @@ class NotionClient:
 
         self._configure_client()
 
+    def _parse_response(self, resp: httpx.Response) -> dict[str, Any]:
+
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            try:
+                body = self._codec.loads(error.response.content)
+            except ValueError:
+                raise HTTPError(error.response)
+            raise APIResponseError(error.response, body["code"], body["message"])
+
+        response_dict = self._codec.loads(resp.content)
+        self._logger.debug(f" Response: {response_dict}")
+        return response_dict
+
+    def _interned(self, from_dict: Callable[..., T]) -> Callable[..., T]:
+
+        # Wraps the parsing function so that the objects created within it
+        # are shared through the intern pool, if one's configured.
+        pool = self._config.intern_pool
+        return from_dict if pool is None else pool.wrap(from_dict)
+
+    def _search_body(
+        self, query: str, filter: Optional[str], sort: Optional[str]
+    ) -> dict[str, Any]:
+
+        body: dict[str, Any] = {}
+        if query:
+            body["query"] = query
+        if filter is not None:
+            if filter not in SEARCH_FILTERS:
+                raise ValueError(
+                    f"filter must be one of {SEARCH_FILTERS}, not '{filter}'"
+                )
+            body["filter"] = {"property": "object", "value": filter}
+        if sort is not None:
+            if sort not in SEARCH_SORTS:
+                raise ValueError(f"sort must be one of {SEARCH_SORTS}, not '{sort}'")
+            body["sort"] = {"direction": sort, "timestamp": "last_edited_time"}
+        return body
+
+    def _search_result(
+        self, obj: dict[str, Any], lazy: bool = False
+    ) -> Union[Page, Database]:
+
+        if obj["object"] == "database":
+            return self._interned(Database.from_dict)(obj)
+        return self._interned(Page.from_dict)(obj, lazy=lazy)
+
+    @staticmethod
+    def _db_index_entry(obj: dict[str, Any]) -> tuple[str, str]:
+
+        # Built from the raw result so that the schema of the database
+        # isn't parsed only to read its title.
+        title = "".join(rich_text["plain_text"] for rich_text in obj["title"])
+        return obj["id"], title
+
+    def _page_prop_from_dict(self, args: dict[str, Any]) -> Props:
+
+        prop_class = Page._REVERSE_MAP.get(args["type"], ObjectProperty)
+        return prop_class.from_dict(args)  # type: ignore
+
+    def _page_prop_item(self, item: dict[str, Any]) -> Any:
+
+        # The value of a single item of a paginated property.
+        prop_type = item["type"]
+        value = item[prop_type]
+        if prop_type in ("title", "rich_text"):
+            return RichText.from_dict(value)
+        if prop_type == "relation":
+            return value["id"]
+        if prop_type == "people":
+            return User.from_dict(value)
+        # The items of rollups are properties of their own.
+        return self._page_prop_from_dict(item)
+
+    def _assemble_page_prop(
+        self, first: dict[str, Any], items: Iterable[dict[str, Any]]
+    ) -> Union[Props, list[RichText]]:
+
+        # Properties with a single value aren't paginated.
+        if first["object"] == "property_item":
+            return self._page_prop_from_dict(first)
+
+        # The items are put back in the format of the properties of a
+        # page, so that they're parsed the same way.
+        prop_item = first["property_item"]
+        prop_type = prop_item["type"]
+        args: dict[str, Any] = {"id": prop_item["id"], "type": prop_type}
+        if prop_type == "rollup":
+            rollup = dict(prop_item["rollup"])
+            if rollup["type"] == "array":
+                rollup["array"] = list(items)
+            args["rollup"] = rollup
+        else:
+            args[prop_type] = [item[prop_type] for item in items]
+        if prop_type == "relation":
+            args["has_more"] = False
+        if prop_type == "title":
+            return rich_text_list(args["title"])
+        return self._page_prop_from_dict(args)
+
+    # ----- Requests -----
+
+    def _bound(self, obj: T) -> T:
+
+        obj.set_client(self)  # type: ignore
+        return obj
+
+    @staticmethod
+    def _page_params(start_cursor: Optional[str], page_size: int) -> dict[str, str]:
+
+        query_params = {"page_size": str(page_size)}
+        if start_cursor:
+            query_params["start_cursor"] = start_cursor
+        return query_params
+
+    def _retrieve_db_request(self, db_id: str) -> APIRequest:
+
+        self._logger.info(f"Retrieving database {db_id}")
+        return APIRequest(
+            APIEndpoints.DB_RETRIEVE.value.format(db_id),
+            parse=lambda resp: self._bound(self._interned(Database.from_dict)(resp)),
+        )
+
+    def _query_db_request(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]],
+        start_cursor: Optional[str],
+        page_size: int,
+    ) -> APIRequest:
+
+        self._logger.info(f" Querying '{db_id}'")
+
+        query = query or {}
+        query["page_size"] = page_size
+        if start_cursor:
+            query["start_cursor"] = start_cursor
+
+        request = APIRequest(APIEndpoints.DB_QUERY.value.format(db_id), "post", query)
+        cache = self._config.query_cache
+        if cache is None:
+            return request
+
+        request.cached = cache.get(db_id, query)
+        if request.cached is not None:
+            self._logger.info(f" Serving the query on '{db_id}' from the cache")
+            return request
+
+        version = cache.version(db_id)
+
+        def parse(resp: dict[str, Any]) -> dict[str, Any]:
+            cache.put(db_id, query, resp, version=version)  # type: ignore
+            return resp
+
+        request.parse = parse
+        return request
+
+    def _create_db_request(self, db: dict[str, Any]) -> APIRequest:
+
+        return APIRequest(
+            APIEndpoints.DB_CREATE.value,
+            "post",
+            db,
+            parse=lambda resp: self._bound(Database.from_dict(resp)),
+        )
+
+    def _update_db_request(self, db_id: str, db: dict[str, Any]) -> APIRequest:
+
+        self._logger.info(f"Updating '{db_id}' database")
+        endpoint = APIEndpoints.DB_UPDATE.value.format(db_id)
+
+        def parse(resp: dict[str, Any]) -> Database:
+            self._invalidate_queries(db_id)
+            self._invalidate_responses(endpoint)
+            return self._bound(Database.from_dict(resp))
+
+        return APIRequest(endpoint, "patch", db, parse=parse)
+
+    def _retrieve_page_request(self, page_id: str) -> APIRequest:
+
+        self._logger.info(f"Retrieving page {page_id}")
+        from_dict = self._interned(Page.from_dict)
+        return APIRequest(
+            APIEndpoints.PAGE_RETRIEVE.value.format(page_id),
+            parse=lambda resp: self._bound(
+                from_dict(resp, lazy=self._config.lazy_pages)
+            ),
+        )
+
+    def _page_prop_request(
+        self,
+        page_id: str,
+        prop_id: str,
+        start_cursor: Optional[str],
+        page_size: int,
+    ) -> APIRequest:
+
+        return APIRequest(
+            APIEndpoints.PAGE_PROP.value.format(page_id, prop_id),
+            query_params=self._page_params(start_cursor, page_size),
+        )
+
+    def _create_page_request(self, page: dict[str, Any]) -> APIRequest:
+        def parse(resp: dict[str, Any]) -> Page:
+            self._invalidate_queries(page=resp)
+            return self._bound(Page.from_dict(resp))
+
+        return APIRequest(APIEndpoints.PAGE_CREATE.value, "post", page, parse=parse)
+
+    def _update_page_request(self, page_id: str, page: dict[str, Any]) -> APIRequest:
+
+        endpoint = APIEndpoints.PAGE_UPDATE.value.format(page_id)
+
+        def parse(resp: dict[str, Any]) -> Page:
+            self._invalidate_queries(page=resp)
+            self._invalidate_responses(endpoint)
+            return self._bound(Page.from_dict(resp))
+
+        return APIRequest(endpoint, "patch", page, parse=parse)
+
+    def _retrieve_block_request(self, block_id: str) -> APIRequest:
+
+        self._logger.info(f"Retrieving block {block_id}")
+        return APIRequest(
+            APIEndpoints.BLOCK_RETRIEVE.value.format(block_id),
+            parse=lambda resp: self._bound(Block.from_dict(resp)),
+        )
+
+    def _block_children_request(
+        self, block_id: str, start_cursor: Optional[str], page_size: int
+    ) -> APIRequest:
+
+        return APIRequest(
+            APIEndpoints.BLOCK_CHILDREN_RETRIEVE.value.format(block_id),
+            query_params=self._page_params(start_cursor, page_size),
+        )
+
+    def _append_children_request(
+        self, block_id: str, children: list[dict[str, Any]]
+    ) -> APIRequest:
+
+        endpoint = APIEndpoints.BLOCK_CHILDREN_APPEND.value.format(block_id)
+
+        def parse(resp: dict[str, Any]) -> list[dict[str, Any]]:
+            self._invalidate_responses(endpoint)
+            return resp["results"]
+
+        return APIRequest(endpoint, "patch", {"children": children}, parse=parse)
+
+    def _appended_blocks(self, created: Iterable[dict[str, Any]]) -> list[Block]:
+
+        return [self._bound(Block.from_dict(block)) for block in created]
+
+    def _retrieve_user_request(self, user_id: str) -> APIRequest:
+
+        self._logger.info(f"Retrieving user '{user_id}'")
+        return APIRequest(
+            APIEndpoints.USER_RETRIEVE.value.format(user_id), parse=User.from_dict
+        )
+
+    def _list_users_request(self, start_cursor: Optional[str]) -> APIRequest:
+
+        query_params = {"start_cursor": start_cursor} if start_cursor else {}
+        return APIRequest(APIEndpoints.USER_LIST.value, query_params=query_params)
+
+    def _retrieve_me_request(self) -> APIRequest:
+
+        self._logger.info("Retreiving 'me'")
+        return APIRequest(APIEndpoints.USER_TOKEN_BOT.value, parse=Bot.from_dict)
+
+    def _search_request(
+        self, body: dict[str, Any], start_cursor: Optional[str], page_size: int
+    ) -> APIRequest:
+
+        body = {**body, "page_size": page_size}
+        if start_cursor:
+            body["start_cursor"] = start_cursor
+        return APIRequest(APIEndpoints.SEARCH.value, "post", body)
+
+    def _build_request(
+        self,
+        client: Union[httpx.Client, httpx.AsyncClient],
+        endpoint: str,
+        method: str,
+        data: Optional[dict[Any, Any]],
+        query_params: Optional[dict[str, str]],
+    ) -> httpx.Request:
+
+        # The body is encoded here rather than by httpx so that the
+        # configured codec is used.
+        content, headers = None, None
+        if data is not None:
+            content = self._codec.dumps(data)
+            headers = {"Content-Type": "application/json"}
+        request = client.build_request(
+            method, endpoint, content=content, params=query_params, headers=headers
+        )
+
+        self._logger.info(f" {request.method} request to {request.url}")
+        self._logger.debug(f" Data: {data}")
+        self._logger.debug(f" Query Params: {query_params}")
+        return request
+
+    def _cached_response(
+        self, request: httpx.Request
+    ) -> tuple[Optional[dict[str, Any]], Callable[[dict[str, Any]], dict[str, Any]]]:
+
+        # Returns the response from the response cache, if there's one,
+        # and the function that caches the response once it's sent.
+        cache = self._config.response_cache
+        if cache is None or request.method != "GET":
+            return None, _identity
+
+        path, params = request.url.path, request.url.query.decode()
+        version = cache.version
+        cached = cache.get(path, params)
+        if cached is not None:
+            response, stale = cached
+            self._logger.info(" Serving the response from the cache")
+            if stale:
+                self._revalidate(request, version)
+            return response, _identity
+
+        def store(response: dict[str, Any]) -> dict[str, Any]:
+            cache.put(path, params, response, version=version)  # type: ignore
+            return response
+
+        return None, store
+
+    def _revalidate(self, request: httpx.Request, version: int):
+        raise NotImplementedError("to be implemented by subclass")
+
+    def _timeout(self) -> httpx.Timeout:
+
+        # httpx treats None as no timeout, so only the phases that were
+        # given their own timeout override the shared one.
+        config = self._config
+        phases = {
+            "connect": config.connect_timeout,
+            "read": config.read_timeout,
+            "write": config.write_timeout,
+            "pool": config.pool_timeout,
+        }
+        overrides = {
+            phase: value for phase, value in phases.items() if value is not None
+        }
+        return httpx.Timeout(config.timeout, **overrides)
+
+    def _limits(self) -> httpx.Limits:
+
+        return httpx.Limits(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+        )
+
+    def _configure_client(self):
+
+        if self._config.http2:
+            # httpx only fails on the first request if `h2` is missing.
+            try:
+                importlib.import_module("h2")
+            except ImportError:
+                msg = "'h2' is required for HTTP/2, install it with 'pip install httpx[http2]'"
+                raise ImportError(msg) from None
+
+        self._codec = get_codec(self._config.json_codec)
+
+        # Configuring the logger
+        if self._config.logger:
+            self._logger = self._config.logger
+        else:
+            self._logger = make_logger(self._config.log_level)
+
+        # The transient failures of bulk operations are retried even if
+        # the client doesn't retry requests otherwise.
+        self._bulk_retry_policy: Optional[RetryPolicy] = None
+        if self._config.retry_policy is None:
+            self._bulk_retry_policy = RetryPolicy()
+
+        # Configuring the rate limiter
+        self._rate_limiter: Optional[RateLimiter] = None
+        if self._config.rate_limit:
+            self._rate_limiter = RateLimiter.for_token(
+                self.token, self._config.rate_limit, self._config.rate_limit_burst
+            )
+
+    def _retry_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        resp: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+
+        policy = self._config.retry_policy or get_fallback_policy()
+        if policy is None:
+            return None
+
+        delay = policy.get_delay(request, attempt, resp)
+        if delay is not None:
+            reason = "transport error" if resp is None else resp.status_code
+            self._logger.warning(
+                f" Retrying {request.method} request to {request.url} "
+                f"in {delay:.2f}s ({reason})"
+            )
+        return delay
+
+    def _invalidate_queries(
+        self, db_id: str = "", page: Optional[dict[str, Any]] = None
+    ):
+
+        cache = self._config.query_cache
+        if cache is None:
+            return
+
+        # The cached queries of the database the page belongs to are
+        # no longer valid once the page is created or updated.
+        parent = (page or {}).get("parent", None) or {}
+        if parent.get("type", None) == "database_id":
+            db_id = parent["database_id"]
+        if db_id:
+            self._logger.info(f" Invalidating the cached queries of '{db_id}'")
+            cache.invalidate(db_id)
+
+    def _invalidate_responses(self, endpoint: str):
+
+        cache = self._config.response_cache
+        if cache is not None:
+            cache.invalidate(endpoint)
+
+    def _base_headers(self) -> dict[str, str]:
+
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Notion-Version": self._config.api_version,
+        }
+
+
+class NotionClient(BaseClient):
+    """The client that can be used to interact with the Notion API."""
+
     # ------ Database related endpoints ------
 
     def retrieve_db(self, db_id: str) -> Database:
@@ -102,16 +675,16 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        self._logger.info(f"Retrieving database {db_id}")
-        endpoint = APIEndpoints.DB_RETRIEVE.value.format(db_id)
-        db_dict = self._make_request(endpoint)
-
-        db = Database.from_dict(db_dict)
-        db._client = self  # type: ignore
-        return db
+        return self._call(self._retrieve_db_request(db_id))
 
     def query_db(
-        self, db_id: str, query: dict[str, Any], max_pages: int = 0
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: Optional[bool] = None,
     ) -> Generator[Page, None, None]:
         """Query a database.
 
@@ -121,6 +694,17 @@ class NotionClient:
             max_pages:
                 The maximum number of pages to return. If the value is 0,
                 then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+                If the value is 0, then nothing is fetched ahead.
+            lazy:
+                Whether the properties of the pages are only parsed when
+                they're first looked up. If `None`, then the `lazy_pages`
+                configuration option is used.
 
         Returns:
             A generator that yields a single `Page` instance at a time.
@@ -133,8 +717,11 @@ class NotionClient:
 
         return paginate(
             self._query_db_raw,  # type: ignore
-            Page.from_dict,
+            self._interned(Page.from_dict),
             max_pages=max_pages,
+            map_args={"lazy": self._config.lazy_pages if lazy is None else lazy},
+            page_size=page_size,
+            prefetch=prefetch,
             db_id=db_id,
             client=self,
             query=query,
@@ -155,10 +742,7 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        new_db_dict = self._make_request(APIEndpoints.DB_CREATE.value, "POST", db)
-        new_db = Database.from_dict(new_db_dict)
-        new_db.set_client(self)
-        return new_db
+        return self._call(self._create_db_request(db))
 
     def update_db(self, db_id: str, db: dict[str, Any]) -> Database:
         """Updates the given database.
@@ -175,12 +759,8 @@ class NotionClient:
                 that's not 2xx.
             HTTPError: Raised when there's some error when making the API call.
         """
-        self._logger.info(f"Updating '{db_id}' database")
-        endpoint = APIEndpoints.DB_UPDATE.value.format(db_id)
-        updated_db_dict = self._make_request(endpoint, "PATCH", db)
-        updated_db = Database.from_dict(updated_db_dict)
-        updated_db.set_client(self)
-        return updated_db
+
+        return self._call(self._update_db_request(db_id, db))
 
     # ----- Page related endpoints -----
 
@@ -199,23 +779,28 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        self._logger.info(f"Retrieving page {page_id}")
-        endpoint = APIEndpoints.PAGE_RETRIEVE.value.format(page_id)
-        page_dict = self._make_request(endpoint)
-        pprint(page_dict)
-        page = Page.from_dict(page_dict)
-        page.set_client(self)
-        return page
+        return self._call(self._retrieve_page_request(page_id))
+
+    def retrieve_page_property(
+        self, page_id: str, prop_id: str, page_size: int = 100
+    ) -> Union[PageProps, ObjectProperty, list[RichText]]:
+        """Retrieves the page property with all of its values.
 
-    def retrieve_page_property(self, page_id: str, prop_id: str) -> Any:
-        """Retrieves the page property.
+        The values of title, rich text, relation, people and rollup
+        properties are paginated by Notion, so they're retrieved in as many
+        requests as needed. For very long values, use
+        `stream_page_property` to avoid holding all of them at once.
 
         Attributes:
             page_id: The page id.
             prop_id: The property id.
+            page_size:
+                The number of values to get from the Notion API per
+                API call.
 
         Returns:
-            The raw dictionary as returned by Notion.
+            The page property such as `PRichtext` or `PRelation`. The title
+            is returned as a list of `RichText` instead.
 
         Raises:
             APIResponseError: Raised when the Notion API returns a status code
@@ -223,8 +808,62 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        endpoint = APIEndpoints.PAGE_PROP.value.format(page_id, prop_id)
-        return self._make_request(endpoint)
+        self._logger.info(f"Retrieving property '{prop_id}' of page {page_id}")
+        first = self._page_prop_raw(page_id, prop_id, page_size=page_size)
+        items: list[dict[str, Any]] = first.get("results", [])
+        if first.get("has_more", False):
+            rest = paginate(
+                self._page_prop_raw,
+                lambda item: item,
+                page_size=page_size,
+                page_id=page_id,
+                prop_id=prop_id,
+                start_cursor=first["next_cursor"],
+            )
+            items = itertools.chain(items, rest)  # type: ignore
+        return self._assemble_page_prop(first, items)
+
+    def stream_page_property(
+        self, page_id: str, prop_id: str, page_size: int = 100
+    ) -> Generator[Any, None, None]:
+        """Retrieves the values of the page property one at a time.
+
+        Attributes:
+            page_id: The page id.
+            prop_id: The property id.
+            page_size:
+                The number of values to get from the Notion API per
+                API call.
+
+        Returns:
+            A generator that yields a `RichText` at a time for title and
+            rich text properties, a page id for relations, a `User` for
+            people and a property for each value of a rollup. For the
+            properties that aren't paginated, the property itself is the
+            only value.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        first = self._page_prop_raw(page_id, prop_id, page_size=page_size)
+        if first["object"] == "property_item":
+            yield self._page_prop_from_dict(first)
+            return
+
+        for item in first["results"]:
+            yield self._page_prop_item(item)
+        if first["has_more"]:
+            yield from paginate(
+                self._page_prop_raw,
+                self._page_prop_item,
+                page_size=page_size,
+                page_id=page_id,
+                prop_id=prop_id,
+                start_cursor=first["next_cursor"],
+            )
 
     def create_page(self, page: dict[str, Any]) -> Page:
         """Creates a new page.
@@ -241,10 +880,7 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        new_page_dict = self._make_request(APIEndpoints.PAGE_CREATE.value, "post", page)
-        new_page = Page.from_dict(new_page_dict)
-        new_page.set_client(self)
-        return new_page
+        return self._call(self._create_page_request(page))
 
     def update_page(self, page_id: str, page: dict[str, Any]) -> Page:
         """Updates a page.
@@ -262,9 +898,171 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        endpoint = APIEndpoints.PAGE_UPDATE.value.format(page_id)
-        page_dict = self._make_request(endpoint, "PATCH", page)
-        return Page.from_dict(page_dict)
+        return self._call(self._update_page_request(page_id, page))
+
+    # ----- Block related endpoints -----
+
+    def retrieve_block(self, block_id: str) -> Block:
+        """Retrieves a block.
+
+        Attributes:
+            block_id: The id of the block to retrieve.
+
+        Returns:
+            An instance of `Block`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return self._call(self._retrieve_block_request(block_id))
+
+    def retrieve_block_children(
+        self,
+        block_id: str,
+        recursive: bool = False,
+        workers: int = 8,
+        page_size: int = 100,
+    ) -> Generator[Block, None, None]:
+        """Retrieves the children of a block or a page.
+
+        Attributes:
+            block_id: The id of the block or page.
+            recursive:
+                If `True`, then the nested blocks are retrieved as well.
+                The children of sibling blocks are fetched concurrently.
+            workers:
+                The maximum number of concurrent requests when retrieving
+                the nested blocks.
+            page_size:
+                The number of blocks to get from the Notion API per
+                API call.
+
+        Returns:
+            A generator that yields a single `Block` instance at a time in
+            the order they appear in the document, with each block followed
+            by its nested blocks.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Retrieving the children of block {block_id}")
+        if not recursive:
+            return paginate(
+                self._block_children_raw,
+                Block.from_dict,
+                page_size=page_size,
+                client=self,
+                block_id=block_id,
+            )
+
+        def fetch(parent_id: str, depth: int) -> list[Block]:
+            return list(
+                paginate(
+                    self._block_children_raw,
+                    Block.from_dict,
+                    map_args={"depth": depth},
+                    page_size=page_size,
+                    client=self,
+                    block_id=parent_id,
+                )
+            )
+
+        return walk_blocks(fetch, block_id, workers)
+
+    def append_block_children(
+        self,
+        block_id: str,
+        blocks: Iterable[Union[Block, dict[str, Any]]],
+        workers: int = 8,
+    ) -> list[Block]:
+        """Appends the blocks, along with the blocks nested in them, to the
+        block or page.
+
+        Any number of blocks can be given. They're sent in batches of the
+        maximum size accepted by Notion, in order. The nested blocks are
+        appended breadth first, with the blocks of different parents being
+        appended concurrently.
+
+        Attributes:
+            block_id: The id of the block or page to append to.
+            blocks:
+                The blocks or the blocks in the Notion format. The nested
+                blocks are given in the 'children' of the content of their
+                parent, as in the Notion format.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The created blocks that were appended directly to the block.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Appending blocks to block {block_id}")
+
+        def append(
+            parent_id: str, children: list[dict[str, Any]]
+        ) -> list[dict[str, Any]]:
+            return self._call(self._append_children_request(parent_id, children))
+
+        created = append_blocks(append, block_id, blocks, workers)
+        return self._appended_blocks(created)
+
+    # ----- Bulk operations -----
+
+    def bulk_update(self, pages: Iterable[Page], workers: int = 8) -> BulkReport[Page]:
+        """Updates the pages concurrently.
+
+        Only the changes made to each page are sent, and the pages without
+        any changes are skipped. Failed requests are retried according to
+        the `retry_policy` of the client's configuration, or the default
+        `RetryPolicy` if there's none. The requests are rate limited by
+        the `rate_limit` of the client's configuration.
+
+        Attributes:
+            pages: The pages to update.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The report holding the updated page or the error for every page.
+            The errors are NOT raised.
+        """
+
+        def update(page: Page) -> Page:
+            body = page._serialize_changes()  # type: ignore
+            return self.update_page(page.id, body) if body else page
+
+        return run_bulk(pages, update, workers, self._bulk_retry_policy)
+
+    def bulk_archive(
+        self, pages: Iterable[Union[Page, str]], workers: int = 8
+    ) -> BulkReport[Page]:
+        """Archives the pages concurrently.
+
+        Failed requests are retried the same way as in `bulk_update`.
+
+        Attributes:
+            pages: The pages or their ids.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The report holding the archived page or the error for every page.
+            The errors are NOT raised.
+        """
+
+        def archive(page: Union[Page, str]) -> Page:
+            page_id = page if isinstance(page, str) else page.id
+            return self.update_page(page_id, {"archived": True})
+
+        return run_bulk(pages, archive, workers, self._bulk_retry_policy)
 
     # ----- User related endpoints -----
 
@@ -283,10 +1081,7 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        self._logger.info(f"Retrieving user '{user_id}'")
-        endpoint = APIEndpoints.USER_RETRIEVE.value.format(user_id)
-        user_dict = self._make_request(endpoint)
-        return User.from_dict(user_dict)
+        return self._call(self._retrieve_user_request(user_id))
 
     def list_users(self) -> Generator[User, None, None]:
         """Lists all the users.
@@ -316,14 +1111,93 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
-        self._logger.info("Retreiving 'me'")
-        bot_dict = self._make_request(APIEndpoints.USER_TOKEN_BOT.value)
-        return Bot.from_dict(bot_dict)
+        return self._call(self._retrieve_me_request())
 
     # ----- Search -----
 
-    def search(self) -> dict[str, Any]:
-        raise NotImplementedError()
+    def search(
+        self,
+        query: str = "",
+        filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        max_results: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: Optional[bool] = None,
+    ) -> Generator[Union[Page, Database], None, None]:
+        """Searches the pages and databases shared with the integration.
+
+        Attributes:
+            query:
+                The text to match against the titles. If empty, then every
+                page and database is returned.
+            filter:
+                Either 'page' or 'database' to only return objects of that
+                type. If `None`, then both are returned.
+            sort:
+                Either 'ascending' or 'descending' to sort the results by
+                the time they were last edited. If `None`, then the results
+                are sorted by relevance.
+            max_results:
+                The maximum number of results to return. If the value is 0,
+                then all results are returned.
+            page_size:
+                The number of results to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of results to fetch ahead in the
+                background while the current batch is being consumed.
+            lazy:
+                Whether the properties of the pages are only parsed when
+                they're first looked up. If `None`, then the `lazy_pages`
+                configuration option is used.
+
+        Returns:
+            A generator that yields a single `Page` or `Database` instance
+            at a time.
+
+        Raises:
+            ValueError: Raised if the filter or sort isn't valid.
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        return paginate(
+            self._search_raw,  # type: ignore
+            self._search_result,
+            max_pages=max_results,
+            map_args={"lazy": self._config.lazy_pages if lazy is None else lazy},
+            page_size=page_size,
+            prefetch=prefetch,
+            client=self,
+            body=self._search_body(query, filter, sort),
+        )
+
+    def index_dbs(self, query: str = "") -> dict[str, str]:
+        """Walks through the workspace once and records every database
+        shared with the integration.
+
+        Attributes:
+            query: The text to match against the titles of the databases.
+
+        Returns:
+            The titles of the databases keyed by their ids.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info("Indexing the databases...")
+        return dict(
+            paginate(
+                self._search_raw,
+                self._db_index_entry,
+                body=self._search_body(query, "database", None),
+            )
+        )
 
     # ----- Miscellaneous -----
     def close(self):
@@ -341,22 +1215,55 @@ class NotionClient:
         page_size: int = 100,
     ) -> dict[str, Any]:
 
-        self._logger.info(f" Querying '{db_id}'")
+        return self._call(self._query_db_request(db_id, query, start_cursor, page_size))
 
-        query = query or {}
-        query["page_size"] = page_size
-        if start_cursor:
-            query["start_cursor"] = start_cursor
+    def _search_raw(
+        self,
+        body: dict[str, Any],
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
 
-        endpoint = APIEndpoints.DB_QUERY.value.format(db_id)
-        return self._make_request(endpoint, "post", data=query)
+        return self._call(self._search_request(body, start_cursor, page_size))
+
+    def _block_children_raw(
+        self,
+        block_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+
+        return self._call(
+            self._block_children_request(block_id, start_cursor, page_size)
+        )
+
+    def _page_prop_raw(
+        self,
+        page_id: str,
+        prop_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+
+        return self._call(
+            self._page_prop_request(page_id, prop_id, start_cursor, page_size)
+        )
 
     def _list_users_raw(self, start_cursor: Optional[str] = None):
 
-        query_params = {"start_cursor": start_cursor} if start_cursor else {}
-        return self._make_request(
-            APIEndpoints.USER_LIST.value, query_params=query_params
+        return self._call(self._list_users_request(start_cursor))
+
+    def _call(self, api_request: APIRequest) -> Any:
+
+        if api_request.cached is not None:
+            return api_request.cached
+        resp = self._make_request(
+            api_request.endpoint,
+            api_request.method,
+            api_request.data,
+            api_request.query_params,
         )
+        return api_request.parse(resp)
 
     def _make_request(
         self,
@@ -366,51 +1273,63 @@ class NotionClient:
         query_params: Optional[dict[str, str]] = None,
     ):
 
-        request = self._client.build_request(
-            method, endpoint, json=data, params=query_params
+        request = self._build_request(
+            self._client, endpoint, method, data, query_params
         )
+        cached, store = self._cached_response(request)
+        if cached is not None:
+            return cached
+        return store(self._send(request))
 
-        log_msg = f" {request.method} request to {request.url}"
-        self._logger.info(log_msg)
-        self._logger.debug(f" Data: {data}")
-        self._logger.debug(f" Query Params: {query_params}")
-
-        resp = self._client.send(request)
-        return self._parse_response(resp)
-
-    def _parse_response(self, resp: httpx.Response) -> dict[str, Any]:
+    def _send(self, request: httpx.Request) -> dict[str, Any]:
 
-        try:
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as error:
+        attempt = 0
+        while True:
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
             try:
-                body = error.response.json()
-                raise APIResponseError(error.response, body["code"], body["message"])
-            except JSONDecodeError:
-                raise HTTPError(error.response)
+                resp = self._client.send(request)
+            except httpx.TransportError:
+                delay = self._retry_delay(request, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request, attempt, resp)
+                if delay is None:
+                    return self._parse_response(resp)
+            time.sleep(delay)
+            attempt += 1
+
+    def _revalidate(self, request: httpx.Request, version: int):
+
+        cache: Any = self._config.response_cache
+        path, params = request.url.path, request.url.query.decode()
+
+        def revalidate():
+            try:
+                response = self._send(request)
+            except Exception as error:
+                self._logger.warning(f" Revalidating {request.url} failed: {error}")
+                cache.revalidation_failed(path, params)
+            else:
+                cache.put(path, params, response, version=version)
 
-        response_dict = resp.json()
-        self._logger.debug(f" Response: {response_dict}")
-        return response_dict
+        threading.Thread(target=revalidate, daemon=True).start()
 
     def _configure_client(self):
 
-        # Configuring the logger
-        if self._config.logger:
-            self._logger = self._config.logger
-        else:
-            self._logger = make_logger(self._config.log_level)
+        super()._configure_client()
 
         # Configuring the httpx client
-        base_headers: dict[str, str] = {
-            "Authorization": f"Bearer {self.token}",
-            "Notion-Version": self._config.api_version,
-        }
-        transport = httpx.HTTPTransport(retries=self._config.retries)
+        transport = httpx.HTTPTransport(
+            retries=self._config.retries,
+            limits=self._limits(),
+            http2=self._config.http2,
+        )
         self._client = httpx.Client(
             transport=transport,
-            timeout=self._config.timeout,
-            headers=base_headers,
+            timeout=self._timeout(),
+            headers=self._base_headers(),
             base_url=self._config.base_url,
         )
 
@@ -0,0 +1,87 @@
+"""The JSON encoders and decoders used for request and response bodies."""
+
+import importlib
+import json
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Union
+
+# The codecs tried, in order, when the codec is 'auto'.
+PREFERRED_CODECS = ("orjson", "ujson", "json")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """A JSON encoder and decoder.
+
+    Attributes:
+        name: The name of the module doing the encoding and decoding.
+        dumps: Encodes an object to UTF-8 encoded JSON.
+        loads: Decodes JSON given as bytes or a string.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib_codec() -> JSONCodec:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    return JSONCodec("json", dumps, json.loads)
+
+
+def _orjson_codec() -> JSONCodec:
+
+    orjson: Any = importlib.import_module("orjson")
+    return JSONCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _ujson_codec() -> JSONCodec:
+
+    ujson: Any = importlib.import_module("ujson")
+
+    def dumps(obj: Any) -> bytes:
+        return ujson.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False
+        ).encode()
+
+    return JSONCodec("ujson", dumps, ujson.loads)
+
+
+_FACTORIES: dict[str, Callable[[], JSONCodec]] = {
+    "json": _stdlib_codec,
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+}
+
+
+def get_codec(name: str = "auto") -> JSONCodec:
+    """Gets the JSON codec with the given name.
+
+    Args:
+        name:
+            One of 'orjson', 'ujson' or 'json' for the standard library
+            module. If 'auto', then the fastest installed codec is used,
+            falling back to the standard library.
+
+    Raises:
+        ValueError: Raised if the codec is unknown.
+        ImportError: Raised if the module of the codec isn't installed.
+    """
+
+    if name == "auto":
+        for preferred in PREFERRED_CODECS:
+            try:
+                return _FACTORIES[preferred]()
+            except ImportError:
+                continue
+
+    try:
+        factory = _FACTORIES[name]
+    except KeyError:
+        choices = ", ".join(["auto", *_FACTORIES])
+        raise ValueError(f"unknown JSON codec '{name}', expected one of: {choices}")
+    return factory()
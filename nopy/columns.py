@@ -0,0 +1,513 @@
+"""A column oriented layout of database pages for analytics."""
+
+import importlib
+from array import array
+from datetime import datetime
+from datetime import timezone
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+from nopy.dates import parse_datetime
+from nopy.enums import PropTypes
+from nopy.utils import plain_text
+
+# The value stored in date columns for missing dates. This is the value
+# NumPy uses for `NaT` as well.
+NAT = -(2**63)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _require(module: str) -> ModuleType:
+
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        msg = f"'{module}' is required for this conversion, install it with 'pip install {module}'"
+        raise ImportError(msg) from None
+
+
+def _micros(value: Optional[str]) -> int:
+
+    if value is None:
+        return NAT
+    parsed = parse_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    delta = parsed - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class Column:
+    """The base class for a column holding the values of a property."""
+
+    def append(self, value: Any):
+        """Appends the raw property value returned by Notion."""
+
+        raise NotImplementedError("to be implemented by subclass")
+
+    def __len__(self) -> int:
+        raise NotImplementedError("to be implemented by subclass")
+
+    def to_list(self) -> list[Any]:
+        """Gets the values as a list of Python objects."""
+
+        raise NotImplementedError("to be implemented by subclass")
+
+    def to_numpy(self) -> Any:
+        """Gets the values as a NumPy array."""
+
+        return _require("numpy").array(self.to_list(), dtype=object)
+
+    def to_pandas(self) -> Any:
+        """Gets the values as a pandas series."""
+
+        return _require("pandas").Series(self.to_numpy())
+
+    def to_arrow(self) -> Any:
+        """Gets the values as a PyArrow array."""
+
+        return _require("pyarrow").array(self.to_list())
+
+
+class NumberColumn(Column):
+    """A column of numbers stored as doubles, with NaN for missing numbers.
+
+    Attributes:
+        values: The numbers.
+    """
+
+    def __init__(self):
+
+        self.values = array("d")
+
+    def append(self, value: Optional[float]):
+
+        self.values.append(float("nan") if value is None else value)
+
+    def __len__(self) -> int:
+
+        return len(self.values)
+
+    def to_list(self) -> list[Optional[float]]:
+
+        return [None if v != v else v for v in self.values]
+
+    def to_numpy(self) -> Any:
+
+        return _require("numpy").frombuffer(self.values, dtype="float64")
+
+    def to_arrow(self) -> Any:
+
+        np = _require("numpy")
+        values = self.to_numpy()
+        return _require("pyarrow").array(values, mask=np.isnan(values))
+
+
+class DateColumn(Column):
+    """A column of timestamps stored as microseconds since the epoch in
+    UTC, with `NAT` for missing timestamps.
+
+    Date properties store their start dates. Dates without a time are
+    treated as midnight in UTC.
+
+    Attributes:
+        values: The timestamps.
+    """
+
+    def __init__(self, key: Optional[str] = "start"):
+
+        self.values = array("q")
+        self._key = key
+
+    def append(self, value: Any):
+
+        if value is not None and self._key is not None:
+            value = value[self._key]
+        self.values.append(_micros(value))
+
+    def __len__(self) -> int:
+
+        return len(self.values)
+
+    def to_list(self) -> list[Optional[datetime]]:
+
+        return [
+            None if v == NAT else datetime.fromtimestamp(v / 1_000_000, timezone.utc)
+            for v in self.values
+        ]
+
+    def to_numpy(self) -> Any:
+
+        np = _require("numpy")
+        return np.frombuffer(self.values, dtype="int64").view("datetime64[us]")
+
+    def to_pandas(self) -> Any:
+
+        pd = _require("pandas")
+        return pd.Series(self.to_numpy()).dt.tz_localize("UTC")
+
+    def to_arrow(self) -> Any:
+
+        np = _require("numpy")
+        values = self.to_numpy()
+        return _require("pyarrow").array(values, mask=np.isnat(values))
+
+
+class CategoricalColumn(Column):
+    """A column of select or status options stored as codes into the
+    categories, with -1 for missing options.
+
+    Attributes:
+        codes: The codes of the options.
+        categories: The names of the options.
+    """
+
+    def __init__(self, categories: Iterable[str] = ()):
+
+        self.codes = array("i")
+        self.categories: list[str] = []
+        self._lookup: dict[str, int] = {}
+        for category in categories:
+            self._code(category)
+
+    def _code(self, name: str) -> int:
+
+        code = self._lookup.get(name, None)
+        if code is None:
+            code = self._lookup[name] = len(self.categories)
+            self.categories.append(name)
+        return code
+
+    def append(self, value: Optional[dict[str, Any]]):
+
+        self.codes.append(-1 if value is None else self._code(value["name"]))
+
+    def __len__(self) -> int:
+
+        return len(self.codes)
+
+    def to_list(self) -> list[Optional[str]]:
+
+        return [None if c == -1 else self.categories[c] for c in self.codes]
+
+    def to_numpy(self) -> Any:
+
+        return _require("numpy").frombuffer(self.codes, dtype="int32")
+
+    def to_pandas(self) -> Any:
+
+        pd = _require("pandas")
+        return pd.Series(pd.Categorical.from_codes(self.to_numpy(), self.categories))
+
+    def to_arrow(self) -> Any:
+
+        pa = _require("pyarrow")
+        codes = self.to_numpy()
+        indices = pa.array(codes, mask=codes == -1)
+        return pa.DictionaryArray.from_arrays(
+            indices, pa.array(self.categories, pa.string())
+        )
+
+
+class MultiCategoricalColumn(CategoricalColumn):
+    """A column of multi select options stored as the codes of all the
+    rows one after the other, along with the offset at which the codes of
+    each row start.
+
+    Attributes:
+        codes: The codes of the options.
+        offsets:
+            The offsets into the codes. The codes of the `i`th row are
+            `codes[offsets[i]:offsets[i + 1]]`.
+        categories: The names of the options.
+    """
+
+    def __init__(self, categories: Iterable[str] = ()):
+
+        super().__init__(categories)
+        self.offsets = array("i", [0])
+
+    def append(self, value: list[dict[str, Any]]):
+
+        self.codes.extend(self._code(option["name"]) for option in value)
+        self.offsets.append(len(self.codes))
+
+    def __len__(self) -> int:
+
+        return len(self.offsets) - 1
+
+    def to_list(self) -> list[list[str]]:
+
+        return [
+            [self.categories[c] for c in self.codes[start:end]]
+            for start, end in zip(self.offsets, self.offsets[1:])
+        ]
+
+    def to_numpy(self) -> Any:
+
+        np = _require("numpy")
+        codes = np.frombuffer(self.codes, dtype="int32")
+        rows = np.empty(len(self), dtype=object)
+        for i, (start, end) in enumerate(zip(self.offsets, self.offsets[1:])):
+            rows[i] = codes[start:end]
+        return rows
+
+    def to_pandas(self) -> Any:
+
+        return _require("pandas").Series(self.to_list(), dtype=object)
+
+    def to_arrow(self) -> Any:
+
+        pa = _require("pyarrow")
+        codes = pa.array(self.codes, pa.int32())
+        values = pa.DictionaryArray.from_arrays(
+            codes, pa.array(self.categories, pa.string())
+        )
+        return pa.ListArray.from_arrays(pa.array(self.offsets, pa.int32()), values)
+
+
+class BoolColumn(Column):
+    """A column of checkboxes.
+
+    Attributes:
+        values: The values stored as 0 or 1.
+    """
+
+    def __init__(self):
+
+        self.values = array("b")
+
+    def append(self, value: Optional[bool]):
+
+        self.values.append(1 if value else 0)
+
+    def __len__(self) -> int:
+
+        return len(self.values)
+
+    def to_list(self) -> list[bool]:
+
+        return [bool(v) for v in self.values]
+
+    def to_numpy(self) -> Any:
+
+        return _require("numpy").frombuffer(self.values, dtype="bool")
+
+
+class ObjectColumn(Column):
+    """A column of Python objects for the properties without a compact
+    representation.
+
+    Attributes:
+        values: The values of the property.
+    """
+
+    def __init__(self, extractor: Callable[[Any], Any] = lambda value: value):
+
+        self.values: list[Any] = []
+        self._extractor = extractor
+
+    def append(self, value: Any):
+
+        self.values.append(None if value is None else self._extractor(value))
+
+    def __len__(self) -> int:
+
+        return len(self.values)
+
+    def to_list(self) -> list[Any]:
+
+        return list(self.values)
+
+
+def _formula(value: dict[str, Any]) -> Any:
+    result = value[value["type"]]
+    if value["type"] == "date" and result is not None:
+        return result["start"]
+    return result
+
+
+def _ids(values: list[dict[str, Any]]) -> list[str]:
+    return [value["id"] for value in values]
+
+
+# The functions creating the column for each property type. The property
+# types that aren't listed get an `ObjectColumn` of the raw values.
+_COLUMN_FACTORIES: dict[PropTypes, Callable[[list[str]], Column]] = {
+    PropTypes.CHECKBOX: lambda _: BoolColumn(),
+    PropTypes.CREATED_BY: lambda _: ObjectColumn(lambda user: user["id"]),
+    PropTypes.CREATED_TIME: lambda _: DateColumn(key=None),
+    PropTypes.DATE: lambda _: DateColumn(),
+    PropTypes.FILES: lambda _: ObjectColumn(lambda files: [f["name"] for f in files]),
+    PropTypes.FORMULA: lambda _: ObjectColumn(_formula),
+    PropTypes.LAST_EDITED_BY: lambda _: ObjectColumn(lambda user: user["id"]),
+    PropTypes.LAST_EDITED_TIME: lambda _: DateColumn(key=None),
+    PropTypes.MULTI_SELECT: MultiCategoricalColumn,
+    PropTypes.NUMBER: lambda _: NumberColumn(),
+    PropTypes.PEOPLE: lambda _: ObjectColumn(_ids),
+    PropTypes.RELATION: lambda _: ObjectColumn(_ids),
+    PropTypes.RICH_TEXT: lambda _: ObjectColumn(plain_text),
+    PropTypes.SELECT: CategoricalColumn,
+    PropTypes.STATUS: CategoricalColumn,
+}
+
+
+def _prop_type(prop_type: str) -> PropTypes:
+
+    # Property types added to Notion after `PropTypes` get the column of
+    # the raw values.
+    try:
+        return PropTypes(prop_type)
+    except ValueError:
+        return PropTypes.UNSUPPORTED
+
+
+def make_column(prop_type: PropTypes, categories: Iterable[str] = ()) -> Column:
+    """Creates the column for the property type.
+
+    Args:
+        prop_type: The type of the property.
+        categories:
+            The names of the known options of select, status and multi
+            select properties. These get the first codes in the given
+            order.
+    """
+
+    factory = _COLUMN_FACTORIES.get(prop_type, None)
+    if factory is None:
+        return ObjectColumn()
+    return factory(list(categories))
+
+
+class Columns:
+    """The pages of a database in a column oriented layout.
+
+    Every property gets a single column holding its values for all the
+    pages, in the order in which the pages were added.
+
+    Attributes:
+        ids: The ids of the pages.
+        titles: The titles of the pages.
+        columns: The columns mapped by the names of the properties.
+    """
+
+    def __init__(self, columns: Optional[dict[str, Column]] = None):
+
+        self.ids: list[str] = []
+        self.titles: list[Optional[str]] = []
+        self.columns: dict[str, Column] = dict(columns or {})
+
+    def add_page(self, page: dict[str, Any]):
+        """Appends the values of the raw page returned by Notion.
+
+        Properties that don't have a column yet get one, which is padded
+        with missing values for the pages added before.
+        """
+
+        title: Optional[str] = None
+        for name, prop in page["properties"].items():
+            prop_type = prop["type"]
+            if prop_type == "title":
+                title = plain_text(prop["title"])
+                continue
+
+            column = self.columns.get(name, None)
+            if column is None:
+                column = self.columns[name] = make_column(_prop_type(prop_type))
+                self._pad(column, len(self.ids))
+            column.append(prop[prop_type])
+
+        self.ids.append(page["id"])
+        self.titles.append(title)
+        # Pages missing some of the properties, such as the pages created
+        # before a property was added, are padded as well.
+        for column in self.columns.values():
+            self._pad(column, len(self.ids))
+
+    @staticmethod
+    def _pad(column: Column, length: int):
+
+        missing: Any = [] if isinstance(column, MultiCategoricalColumn) else None
+        while len(column) < length:
+            column.append(missing)
+
+    @classmethod
+    def from_raw_pages(
+        cls,
+        pages: Iterable[dict[str, Any]],
+        columns: Optional[dict[str, Column]] = None,
+    ) -> "Columns":
+        """Builds the columns from the raw pages returned by Notion.
+
+        Args:
+            pages: The raw pages.
+            columns: The empty columns to fill in, if known beforehand.
+        """
+
+        result = cls(columns)
+        for page in pages:
+            result.add_page(page)
+        return result
+
+    def __len__(self) -> int:
+
+        return len(self.ids)
+
+    def __getitem__(self, name: str) -> Column:
+
+        return self.columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+
+        return iter(self.columns)
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Gets the columns as lists of Python objects."""
+
+        data: dict[str, list[Any]] = {"id": list(self.ids), "title": list(self.titles)}
+        for name, column in self.columns.items():
+            data[name] = column.to_list()
+        return data
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Gets the columns as NumPy arrays mapped by the property names.
+
+        Numbers are float arrays, dates and timestamps are datetime64
+        arrays and select and status options are arrays of the codes.
+        """
+
+        np = _require("numpy")
+        data = {
+            "id": np.array(self.ids, dtype=object),
+            "title": np.array(self.titles, dtype=object),
+        }
+        for name, column in self.columns.items():
+            data[name] = column.to_numpy()
+        return data
+
+    def to_pandas(self) -> Any:
+        """Gets the columns as a pandas data frame indexed by the page ids."""
+
+        pd = _require("pandas")
+        data = {"title": pd.Series(self.titles, dtype=object)}
+        for name, column in self.columns.items():
+            data[name] = column.to_pandas()
+        frame = pd.DataFrame(data)
+        frame.index = pd.Index(self.ids, name="id")
+        return frame
+
+    def to_arrow(self) -> Any:
+        """Gets the columns as a PyArrow table."""
+
+        pa = _require("pyarrow")
+        arrays = [pa.array(self.ids, pa.string()), pa.array(self.titles, pa.string())]
+        names = ["id", "title"]
+        for name, column in self.columns.items():
+            arrays.append(column.to_arrow())
+            names.append(name)
+        return pa.Table.from_arrays(arrays, names=names)
@@ -1,4 +1,6 @@
+import re
 from enum import Enum
+from typing import Pattern
 
 API_VERSION = "2022-06-28"
 API_BASE_URL = "https://api.notion.com/v1/"
@@ -23,7 +25,7 @@ class APIEndpoints(Enum):
     BLOCK_RETRIEVE = "blocks/{}"
     BLOCK_UPDATE = "blocks/{}"
     BLOCK_CHILDREN_RETRIEVE = "blocks/{}/children"
-    BLOCK_CHILDREN_APPEND = "blocks/{}"
+    BLOCK_CHILDREN_APPEND = "blocks/{}/children"
 
     # Comment related endpoints
     COMMENT = "comment"
@@ -35,3 +37,30 @@ class APIEndpoints(Enum):
 
     # Search
     SEARCH = "search"
+
+
+def _endpoint_patterns() -> list[tuple[Pattern[str], str]]:
+
+    # Endpoints without ids are matched first so that an endpoint
+    # such as 'users/me' isn't mistaken for 'users/{}'.
+    endpoints = sorted(APIEndpoints, key=lambda e: e.value.count("{}"))
+
+    patterns: list[tuple[Pattern[str], str]] = []
+    for endpoint in endpoints:
+        regex = re.escape(endpoint.value).replace(re.escape("{}"), "[^/]+")
+        patterns.append((re.compile(f"(?:^|/){regex}/?$"), endpoint.value))
+    return patterns
+
+
+_ENDPOINT_PATTERNS = _endpoint_patterns()
+
+
+def endpoint_template(path: str) -> str:
+    """Gets the endpoint of the URL path without the ids in it, such as
+    'pages/{}' for '/v1/pages/some-id'. The path is returned as it is if
+    it doesn't match any of the endpoints."""
+
+    for pattern, endpoint in _ENDPOINT_PATTERNS:
+        if pattern.search(path):
+            return endpoint
+    return path
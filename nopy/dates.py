@@ -0,0 +1,23 @@
+from datetime import datetime
+from functools import lru_cache
+
+from dateutil.parser import parse
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime:
+    """Parses the ISO 8601 timestamps and dates returned by Notion.
+
+    The formats used by Notion, such as '2022-12-06T04:52:00.000Z' and
+    '2022-12-06', are parsed with `datetime.fromisoformat`. Anything else
+    falls back to `dateutil.parser.parse`. Since Notion rounds timestamps
+    to the minute, the same values repeat a lot, so the results are cached.
+    """
+
+    try:
+        # `fromisoformat` only understands 'Z' from Python 3.11.
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse(value)
@@ -0,0 +1,203 @@
+"""Interning of the small objects that repeat across pages, such as users,
+options and annotations."""
+
+import copy
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import FrozenInstanceError
+from dataclasses import fields
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_current_pool: ContextVar[Optional["InternPool"]] = ContextVar(
+    "nopy_intern_pool", default=None
+)
+# The classes mapped to their frozen variants.
+_frozen_classes: dict[type, type] = {}
+_frozen_lock = threading.Lock()
+
+
+class InternPool:
+    """A bounded table of shared instances of repeated objects.
+
+    While the pool is active, parsing an object that's equal to one parsed
+    before returns the same instance. The shared instances are frozen
+    variants of their classes, so modifying them raises a
+    `FrozenInstanceError`. Use `copy.copy` or `dataclasses.replace` to get
+    a modifiable copy.
+
+    Attributes:
+        max_size:
+            The maximum number of instances kept. The least recently used
+            instances are dropped once the limit is reached.
+        hits: The number of times a shared instance was reused.
+        misses: The number of times a new instance was created.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._instances: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def intern(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Gets the shared instance for the key, creating it if needed.
+
+        Args:
+            key: The key identifying the object, such as its id and type.
+            factory: The function that creates the object.
+        """
+
+        with self._lock:
+            instance = self._instances.get(key, None)
+            if instance is not None:
+                self._instances.move_to_end(key)
+                self.hits += 1
+                return instance
+
+        instance = freeze(factory())
+        with self._lock:
+            self.misses += 1
+            # Another thread may have interned the same key meanwhile.
+            instance = self._instances.setdefault(key, instance)
+            self._instances.move_to_end(key)
+            while len(self._instances) > self.max_size:
+                self._instances.popitem(last=False)
+        return instance
+
+    @contextmanager
+    def activate(self) -> Generator["InternPool", None, None]:
+        """Interns the objects parsed within the context with this pool."""
+
+        token = _current_pool.set(self)
+        try:
+            yield self
+        finally:
+            _current_pool.reset(token)
+
+    def wrap(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Wraps the function so that it's always called with this pool
+        active."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with self.activate():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def clear(self):
+        """Drops all the shared instances."""
+
+        with self._lock:
+            self._instances.clear()
+
+    def __len__(self) -> int:
+
+        return len(self._instances)
+
+
+def current_pool() -> Optional[InternPool]:
+    """Gets the active pool, if any."""
+
+    return _current_pool.get()
+
+
+def interned(key: Hashable, factory: Callable[[], T]) -> T:
+    """Gets the shared instance from the active pool or creates a new
+    instance if there's no active pool."""
+
+    pool = _current_pool.get()
+    if pool is None:
+        return factory()
+    return pool.intern(key, factory)
+
+
+def freeze(obj: T) -> T:
+    """Turns the dataclass instance into an instance of the frozen variant
+    of its class."""
+
+    obj.__class__ = frozen_class(type(obj))
+    return obj
+
+
+def frozen_class(cls: type) -> type:
+    """Gets the frozen variant of the dataclass.
+
+    Instances of the variant can't be modified, are hashable and are equal
+    to the instances of the original class with the same values. Copying
+    an instance or creating a new one gives an instance of the original
+    class.
+    """
+
+    if cls in _frozen_classes.values():
+        return cls
+    with _frozen_lock:
+        if cls not in _frozen_classes:
+            _frozen_classes[cls] = _make_frozen_class(cls)
+        return _frozen_classes[cls]
+
+
+def _values(obj: Any) -> tuple[Any, ...]:
+    return tuple(getattr(obj, field.name) for field in fields(obj))
+
+
+def _make_frozen_class(cls: type) -> type:
+    def __new__(frozen_cls: type, *args: Any, **kwargs: Any):
+        # `dataclasses.replace` and the like create modifiable instances.
+        return cls(*args, **kwargs)
+
+    def __setattr__(self: Any, name: str, value: Any):
+        raise FrozenInstanceError(
+            f"cannot assign to field '{name}' of a shared instance"
+        )
+
+    def __delattr__(self: Any, name: str):
+        raise FrozenInstanceError(f"cannot delete field '{name}' of a shared instance")
+
+    def __eq__(self: Any, other: Any):
+        if type(other) in (cls, frozen):
+            return _values(self) == _values(other)
+        return NotImplemented
+
+    def __hash__(self: Any) -> int:
+        return hash(_values(self))
+
+    def __copy__(self: Any):
+        return cls(**{field.name: getattr(self, field.name) for field in fields(self)})
+
+    def __deepcopy__(self: Any, memo: dict[int, Any]):
+        return cls(
+            **{
+                field.name: copy.deepcopy(getattr(self, field.name), memo)
+                for field in fields(self)
+            }
+        )
+
+    def __reduce_ex__(self: Any, protocol: int):
+        return (copy.copy, (self.__copy__(),))
+
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__qualname__": cls.__qualname__,
+        "__module__": cls.__module__,
+        "__new__": __new__,
+        "__setattr__": __setattr__,
+        "__delattr__": __delattr__,
+        "__eq__": __eq__,
+        "__hash__": __hash__,
+        "__copy__": __copy__,
+        "__deepcopy__": __deepcopy__,
+        "__reduce_ex__": __reduce_ex__,
+    }
+    frozen = type(cls)(f"Frozen{cls.__name__}", (cls,), namespace)
+    return frozen
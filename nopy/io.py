@@ -0,0 +1,222 @@
+"""Streaming export and import of pages as JSON Lines.
+
+Every line of the file holds a single page as the raw dictionary returned
+by Notion. The pages are written as they're fetched and read one line at a
+time, so exports and imports of large databases use constant memory.
+Files whose names end with '.gz' are compressed with gzip.
+"""
+
+import gzip
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterable
+from typing import Generator
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+from nopy.errors import NoClientFoundError
+from nopy.errors import PropertyNotFoundError
+from nopy.errors import UnuspportedError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.query import Query
+from nopy.types import SyncAsync
+
+Target = Union[str, Path, IO[str]]
+
+
+@contextmanager
+def _open(target: Target, mode: str) -> Generator[IO[str], None, None]:
+
+    if not isinstance(target, (str, Path)):
+        yield target
+        return
+
+    path = Path(target)
+    if path.suffix == ".gz":
+        file: IO[str] = gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore
+    else:
+        file = open(path, mode, encoding="utf-8", newline="\n")
+    with file:
+        yield file
+
+
+def _line(page: dict[str, Any]) -> str:
+    return json.dumps(page, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def dump_pages(pages: Iterable[dict[str, Any]], target: Target) -> int:
+    """Writes the raw pages to the file, one page per line.
+
+    Args:
+        pages: The raw pages as returned by Notion.
+        target: The path to the file or a file opened in text mode.
+
+    Returns:
+        The number of pages written.
+    """
+
+    count = 0
+    with _open(target, "w") as file:
+        for page in pages:
+            file.write(_line(page))
+            count += 1
+    return count
+
+
+async def adump_pages(pages: AsyncIterable[dict[str, Any]], target: Target) -> int:
+    """Writes the raw pages from the async iterable to the file, one page
+    per line.
+
+    Args:
+        pages: The raw pages as returned by Notion.
+        target: The path to the file or a file opened in text mode.
+
+    Returns:
+        The number of pages written.
+    """
+
+    count = 0
+    with _open(target, "w") as file:
+        async for page in pages:
+            file.write(_line(page))
+            count += 1
+    return count
+
+
+def export_db(
+    db: Database,
+    target: Target,
+    query: Optional[Union[Query, dict[str, Any]]] = None,
+    page_size: int = 100,
+    prefetch: int = 0,
+) -> SyncAsync[int]:
+    """Exports the pages of the database to the file as they're fetched.
+
+    Args:
+        db: The database whose pages are exported.
+        target: The path to the file or a file opened in text mode.
+        query: An optional query to apply on the database.
+        page_size:
+            The number of pages to get from the Notion API per
+            API call.
+        prefetch:
+            The number of batches of pages to fetch ahead in the
+            background while the current batch is being written.
+
+    Returns:
+        The number of pages exported. If the database is bound to an
+        `AsyncNotionClient`, then this is an awaitable.
+
+    Raises:
+        NoClientFoundError: Raised if the database has no client.
+    """
+
+    if not db._client:  # type: ignore
+        raise NoClientFoundError("database")
+
+    pages = db.get_raw_pages(query, page_size=page_size, prefetch=prefetch)
+    if db._client.is_async:  # type: ignore
+        return adump_pages(pages, target)  # type: ignore
+    return dump_pages(pages, target)  # type: ignore
+
+
+def read_pages(target: Target) -> Generator[dict[str, Any], None, None]:
+    """Reads the raw pages from the file one line at a time.
+
+    Args:
+        target: The path to the file or a file opened in text mode.
+    """
+
+    with _open(target, "r") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_pages(target: Target, lazy: bool = False) -> Generator[Page, None, None]:
+    """Reads the pages from the file one line at a time.
+
+    Args:
+        target: The path to the file or a file opened in text mode.
+        lazy:
+            Whether the properties of the pages are only parsed when
+            they're first looked up.
+    """
+
+    for page in read_pages(target):
+        yield Page.from_dict(page, lazy=lazy)
+
+
+def import_pages(
+    db: Database, target: Target
+) -> Union[Generator[Page, None, None], AsyncGenerator[Page, None]]:
+    """Creates the pages read from the file in the database.
+
+    The pages are read and created one at a time. The properties are
+    matched to the properties of the database by their names, so the pages
+    can be imported into a database other than the one they were exported
+    from. Properties missing from the database and properties that can't
+    be set via the Notion API, such as formulas and rollups, are skipped.
+
+    Args:
+        db: The database to create the pages in.
+        target: The path to the file or a file opened in text mode.
+
+    Returns:
+        A generator that yields the created pages. If the database is
+        bound to an `AsyncNotionClient`, then an async generator is
+        returned instead.
+
+    Raises:
+        NoClientFoundError: Raised if the database has no client.
+        ValueError:
+            Raised if a property has a different type in the database.
+    """
+
+    if not db._client:  # type: ignore
+        raise NoClientFoundError("database")
+
+    if db._client.is_async:  # type: ignore
+        return _aimport_pages(db, target)
+    return _import_pages(db, target)
+
+
+def _import_pages(db: Database, target: Target) -> Generator[Page, None, None]:
+
+    for page in load_pages(target):
+        yield db.create_page(_import_body(db, page))  # type: ignore
+
+
+async def _aimport_pages(db: Database, target: Target) -> AsyncGenerator[Page, None]:
+
+    for page in load_pages(target):
+        yield await db.create_page(_import_body(db, page))  # type: ignore
+
+
+def _import_body(db: Database, page: Page) -> dict[str, Any]:
+
+    # The ids of the properties belong to the database the page was
+    # exported from, so the properties are keyed by the ids in `db`.
+    body = page.serialize()
+    properties: dict[str, Any] = {"title": body["properties"]["title"]}
+    for prop in page.properties:
+        try:
+            db_prop = db.properties.get(prop.name)
+        except PropertyNotFoundError:
+            continue
+        if db_prop.type != prop.type:
+            msg = f"'{prop.name}' is a '{db_prop.type.value}' property in the database"
+            raise ValueError(f"{msg}, not a '{prop.type.value}' property")
+        try:
+            properties[db_prop.id] = prop.serialize()
+        except UnuspportedError:
+            continue
+
+    body["properties"] = properties
+    return body
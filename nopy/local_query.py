@@ -0,0 +1,473 @@
+"""Evaluates queries locally against pages that were already fetched."""
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import cmp_to_key
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+from nopy.dates import parse_datetime
+from nopy.enums import PropTypes
+from nopy.errors import NoClientFoundError
+from nopy.errors import PropertyNotFoundError
+from nopy.errors import UnsupportedByLibraryError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.props.common import Date
+from nopy.props.common import Option
+from nopy.query import Query
+from nopy.store import SQLiteStore
+
+QueryLike = Union[Query, dict[str, Any]]
+
+# The relative date conditions mapped to the range of days from today.
+_RELATIVE_DATES = {
+    "past_week": (-7, 0),
+    "past_month": (-30, 0),
+    "past_year": (-365, 0),
+    "next_week": (0, 7),
+    "next_month": (0, 30),
+    "next_year": (0, 365),
+}
+
+
+def evaluate(
+    query: QueryLike, pages: Iterable[Page], now: Optional[datetime] = None
+) -> list[Page]:
+    """Applies the query to the given pages the same way Notion would.
+
+    Args:
+        query: The query as a `Query` or as a dictionary in the Notion format.
+        pages: The pages to filter and sort.
+        now:
+            The time relative to which filters such as `past_week` are
+            evaluated. By default, this is the current time.
+
+    Returns:
+        The pages that match the filter, sorted by the sorts of the query.
+
+    Raises:
+        UnsupportedByLibraryError:
+            Raised if the query contains a filter condition that can't be
+            evaluated locally, or a filter on a property the pages don't
+            have, which Notion rejects.
+    """
+
+    serialized = query.serialize() if isinstance(query, Query) else query
+    now = now or datetime.now(timezone.utc)
+
+    query_filter = serialized.get("filter", None) or {}
+    results = [page for page in pages if matches(page, query_filter, now)]
+    sorts = serialized.get("sorts", None) or []
+    if sorts:
+        results.sort(key=cmp_to_key(lambda a, b: _compare(a, b, sorts)))
+    return results
+
+
+def matches(
+    page: Page, query_filter: dict[str, Any], now: Optional[datetime] = None
+) -> bool:
+    """Checks whether the page matches the filter in the Notion format.
+
+    An empty filter matches every page.
+    """
+
+    now = now or datetime.now(timezone.utc)
+    if not query_filter:
+        return True
+    # Every condition is evaluated without short-circuiting, so the ones
+    # that can't be evaluated locally are always found.
+    if "and" in query_filter:
+        return all([matches(page, sub, now) for sub in query_filter["and"]])
+    if "or" in query_filter:
+        return any([matches(page, sub, now) for sub in query_filter["or"]])
+
+    if "timestamp" in query_filter:
+        timestamp = query_filter["timestamp"]
+        value = getattr(page, timestamp, None)
+        return _match_date(value, query_filter[timestamp], now)
+
+    prop_type, conditions = _condition(query_filter)
+    value = _prop_value(page, query_filter["property"], prop_type)
+    return _match(prop_type, value, conditions, now)
+
+
+# ----- Planner -----
+
+
+class QueryPlanner:
+    """Decides whether a query is run against a local mirror or by Notion.
+
+    Queries are evaluated locally when the database was written to the
+    store within `max_age` and sent to Notion otherwise.
+
+    Attributes:
+        store: The store holding the mirrors of the databases.
+        max_age: The age after which a mirror is no longer considered fresh.
+    """
+
+    def __init__(self, store: SQLiteStore, max_age: timedelta = timedelta(minutes=5)):
+
+        self.store = store
+        self.max_age = max_age
+
+    def is_fresh(self, db_id: str) -> bool:
+        """Checks whether the mirror of the database can be used."""
+
+        synced_at = self.store.synced_at(db_id)
+        if synced_at is None:
+            return False
+        return datetime.now(timezone.utc) - synced_at <= self.max_age
+
+    def run(
+        self, db: Database, query: Optional[QueryLike] = None
+    ) -> Generator[Page, None, None]:
+        """Runs the query on the database.
+
+        Args:
+            db: The database to query.
+            query: The query to run. If `None`, all the pages are returned.
+
+        Returns:
+            A generator that yields a single page at a time.
+        """
+
+        query = query or {}
+        if self.is_fresh(db.id):
+            try:
+                yield from evaluate(query, self.store.pages(db.id))
+                return
+            except UnsupportedByLibraryError:
+                # Falling back to Notion for conditions which can't
+                # be evaluated locally.
+                pass
+
+        if not db._client:  # type: ignore
+            raise NoClientFoundError("database")
+        if db._client.is_async:  # type: ignore
+            raise UnsupportedByLibraryError("planning queries via the async client")
+        yield from db.query(query)  # type: ignore
+
+
+# ----- Private Helpers -----
+
+
+def _condition(query_filter: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+
+    for key, value in query_filter.items():
+        if key not in ("property", "type"):
+            return key, value
+    raise UnsupportedByLibraryError("filters without a condition")
+
+
+def _prop_value(page: Page, prop_name: str, prop_type: str) -> Any:
+
+    try:
+        prop = page.properties.get(prop_name)
+    except PropertyNotFoundError:
+        # The title isn't part of the properties of a page, so only title
+        # filters are evaluated on it. Notion rejects filters on any other
+        # missing property, so they're left for Notion to answer.
+        if prop_type == "title":
+            return page.title
+        raise UnsupportedByLibraryError(
+            f"local filtering on the missing property '{prop_name}'"
+        )
+
+    prop_value = _PROP_VALUES.get(prop.type, None)
+    if prop_value is None:
+        raise UnsupportedByLibraryError(f"local filtering of '{prop.type}' properties")
+    return prop_value(prop)
+
+
+def _option_name(option: Optional[Option]) -> Optional[str]:
+    return None if option is None else option.name
+
+
+_PROP_VALUES: dict[PropTypes, Callable[[Any], Any]] = {
+    PropTypes.CHECKBOX: lambda prop: prop.checked,
+    PropTypes.CREATED_BY: lambda prop: [prop.created_by.id],
+    PropTypes.CREATED_TIME: lambda prop: prop.created_time,
+    PropTypes.DATE: lambda prop: prop.date,
+    PropTypes.EMAIL: lambda prop: prop.email,
+    PropTypes.FILES: lambda prop: prop.files,
+    PropTypes.FORMULA: lambda prop: prop.value,
+    PropTypes.LAST_EDITED_BY: lambda prop: [prop.last_edited_by.id],
+    PropTypes.LAST_EDITED_TIME: lambda prop: prop.last_edited_time,
+    PropTypes.MULTI_SELECT: lambda prop: [option.name for option in prop.options],
+    PropTypes.NUMBER: lambda prop: prop.number,
+    PropTypes.PEOPLE: lambda prop: [user.id for user in prop.people],
+    PropTypes.PHONE_NUMBER: lambda prop: prop.phone_number,
+    PropTypes.RELATION: lambda prop: prop.relations,
+    PropTypes.RICH_TEXT: lambda prop: prop.text,
+    PropTypes.SELECT: lambda prop: _option_name(prop.option),
+    PropTypes.STATUS: lambda prop: _option_name(prop.status),
+    PropTypes.URL: lambda prop: prop.url,
+}
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _match(prop_type: str, value: Any, conditions: dict[str, Any], now: datetime):
+
+    if prop_type == "formula":
+        # Nested filters are either given directly or under the type of
+        # the filter, as done by `FormulaFilter`.
+        result_type, sub_conditions = next(iter(conditions.items()))
+        if len(sub_conditions) == 1:
+            inner_type, inner = next(iter(sub_conditions.items()))
+            if isinstance(inner, dict) and inner_type in _MATCHERS:
+                sub_conditions = inner
+        return _match(result_type, value, sub_conditions, now)
+
+    matcher = _MATCHERS.get(prop_type, None)
+    if matcher is None:
+        raise UnsupportedByLibraryError(f"local filtering of '{prop_type}' properties")
+    return all(
+        matcher(value, condition, expected, now)
+        for condition, expected in conditions.items()
+    )
+
+
+def _match_empty(value: Any, condition: str) -> Optional[bool]:
+
+    if condition == "is_empty":
+        return _is_empty(value)
+    if condition == "is_not_empty":
+        return not _is_empty(value)
+    return None
+
+
+def _unsupported(condition: str) -> UnsupportedByLibraryError:
+    return UnsupportedByLibraryError(f"local evaluation of '{condition}'")
+
+
+def _match_text(value: Any, condition: str, expected: Any, now: datetime) -> bool:
+
+    empty = _match_empty(value, condition)
+    if empty is not None:
+        return empty
+
+    text = (value or "").lower()
+    expected = str(expected).lower()
+    if condition == "equals":
+        return text == expected
+    if condition == "does_not_equal":
+        return text != expected
+    if condition == "contains":
+        return expected in text
+    if condition == "does_not_contain":
+        return expected not in text
+    if condition == "starts_with":
+        return text.startswith(expected)
+    if condition == "ends_with":
+        return text.endswith(expected)
+    raise _unsupported(condition)
+
+
+def _match_number(value: Any, condition: str, expected: Any, now: datetime) -> bool:
+
+    empty = _match_empty(value, condition)
+    if empty is not None:
+        return empty
+    if condition == "does_not_equal":
+        return value != expected
+    if value is None:
+        return False
+
+    if condition == "equals":
+        return value == expected
+    if condition == "greater_than":
+        return value > expected
+    if condition == "less_than":
+        return value < expected
+    if condition == "greater_than_or_equal_to":
+        return value >= expected
+    if condition == "less_than_or_equal_to":
+        return value <= expected
+    raise _unsupported(condition)
+
+
+def _match_checkbox(value: Any, condition: str, expected: Any, now: datetime) -> bool:
+
+    if condition == "equals":
+        return bool(value) == expected
+    if condition == "does_not_equal":
+        return bool(value) != expected
+    raise _unsupported(condition)
+
+
+def _match_option(value: Any, condition: str, expected: Any, now: datetime) -> bool:
+
+    empty = _match_empty(value, condition)
+    if empty is not None:
+        return empty
+    if condition == "equals":
+        return value == expected
+    if condition == "does_not_equal":
+        return value != expected
+    raise _unsupported(condition)
+
+
+def _match_list(value: Any, condition: str, expected: Any, now: datetime) -> bool:
+
+    empty = _match_empty(value, condition)
+    if empty is not None:
+        return empty
+    values = value or []
+    if condition == "contains":
+        return expected in values
+    # `MultiSelectFilter` names the condition 'does_not_contains'.
+    if condition in ("does_not_contain", "does_not_contains"):
+        return expected not in values
+    raise _unsupported(condition)
+
+
+def _match_date(value: Any, conditions: dict[str, Any], now: datetime) -> bool:
+
+    return all(
+        _match_date_condition(value, condition, expected, now)
+        for condition, expected in conditions.items()
+    )
+
+
+def _match_date_condition(
+    value: Any, condition: str, expected: Any, now: datetime
+) -> bool:
+
+    start = _start(value)
+    empty = _match_empty(start, condition)
+    if empty is not None:
+        return empty
+    if start is None:
+        return False
+
+    if condition in _RELATIVE_DATES:
+        days_from, days_to = _RELATIVE_DATES[condition]
+        today = _aware(now).date()
+        return (
+            today + timedelta(days=days_from)
+            <= start.date()
+            <= today + timedelta(days=days_to)
+        )
+    if condition == "this_week":
+        today = _aware(now).date()
+        monday = today - timedelta(days=today.weekday())
+        return monday <= start.date() < monday + timedelta(days=7)
+
+    bound = _aware(
+        expected if isinstance(expected, datetime) else parse_datetime(expected)
+    )
+    # Dates without a time are compared by the day.
+    if isinstance(expected, str) and "T" not in expected:
+        return _compare_values(start.date(), bound.date(), condition)
+    return _compare_values(start, bound, condition)
+
+
+def _compare_values(
+    value: Union[date, datetime], bound: Union[date, datetime], condition: str
+) -> bool:
+
+    if condition == "equals":
+        return value == bound
+    if condition == "before":
+        return value < bound  # type: ignore
+    if condition == "after":
+        return value > bound  # type: ignore
+    if condition == "on_or_before":
+        return value <= bound  # type: ignore
+    if condition == "on_or_after":
+        return value >= bound  # type: ignore
+    raise _unsupported(condition)
+
+
+def _start(value: Any) -> Optional[datetime]:
+
+    if value is None:
+        return None
+    if isinstance(value, Date):
+        value = value.start
+    elif isinstance(value, dict):
+        value = value.get("start", None)
+        if value is None:
+            return None
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    return _aware(value)
+
+
+def _aware(value: datetime) -> datetime:
+
+    # Naive datetimes are assumed to be in UTC so that they can be
+    # compared with the timestamps returned by Notion.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+_MATCHERS: dict[str, Callable[[Any, str, Any, datetime], bool]] = {
+    "title": _match_text,
+    "rich_text": _match_text,
+    "string": _match_text,
+    "url": _match_text,
+    "email": _match_text,
+    "phone_number": _match_text,
+    "number": _match_number,
+    "checkbox": _match_checkbox,
+    "select": _match_option,
+    "status": _match_option,
+    "multi_select": _match_list,
+    "people": _match_list,
+    "created_by": _match_list,
+    "last_edited_by": _match_list,
+    "relation": _match_list,
+    "files": _match_list,
+    "date": _match_date_condition,
+    "created_time": _match_date_condition,
+    "last_edited_time": _match_date_condition,
+}
+
+
+# ----- Sorting -----
+
+
+def _sort_value(page: Page, sort: dict[str, Any]) -> Any:
+
+    if "timestamp" in sort:
+        value = getattr(page, sort["timestamp"], None)
+        return None if value is None else _aware(value)
+
+    try:
+        prop = page.properties.get(sort["property"])
+    except PropertyNotFoundError:
+        return page.title
+    value = _PROP_VALUES.get(prop.type, lambda _: None)(prop)
+    if isinstance(value, (Date, dict)) or prop.type == PropTypes.DATE:
+        return _start(value)
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, list):
+        return value[0].lower() if value else None
+    return value
+
+
+def _compare(a: Page, b: Page, sorts: list[dict[str, Any]]) -> int:
+
+    for sort in sorts:
+        a_value, b_value = _sort_value(a, sort), _sort_value(b, sort)
+        if a_value == b_value:
+            continue
+        # Empty values are always sorted last regardless of the direction.
+        if _is_empty(a_value):
+            return 1
+        if _is_empty(b_value):
+            return -1
+        result = -1 if a_value < b_value else 1
+        return result if sort.get("direction", "ascending") == "ascending" else -result
+    return 0
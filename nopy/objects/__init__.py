@@ -1,6 +1,7 @@
 # type: ignore
 # flake8: noqa
 
+from .block import Block
 from .database import Database
 from .page import Page
 from .user import User
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Type
+
+from nopy.enums import ObjectTypes
+from nopy.objects.notion_object import NotionObject
+from nopy.props.common import RichText
+from nopy.utils import base_obj_args
+from nopy.utils import rich_text_list
+
+
+@dataclass
+class Block(NotionObject):
+    """A representation of a block in Notion.
+
+    Attributes:
+        block_type: The type of the block such as 'paragraph' or 'to_do'.
+
+        content:
+            The content specific to the type of the block in the
+            Notion format. This is what's sent when the block is
+            serialized.
+
+        rich_text:
+            The text of the block with style information, if any, parsed
+            from the content.
+
+        has_children: Denotes whether the block has nested blocks.
+
+        depth:
+            The nesting level of the block, where the blocks directly
+            under the page or block the traversal started from are at 0.
+
+        id (str): The id of the block.
+
+        parent (Parent): The parent of the block.
+
+        type (ObjectTypes):
+            The type of the Notion object which will always be
+            `ObjectTypes.BLOCK`.
+    """
+
+    block_type: str = ""
+    content: dict[str, Any] = field(default_factory=dict)
+    rich_text: list[RichText] = field(default_factory=list)
+    has_children: bool = False
+    depth: int = 0
+
+    def __post_init__(self):
+
+        super().__post_init__()
+        self._type = ObjectTypes.BLOCK
+
+    @property
+    def plain_text(self) -> str:
+        """The text of the block without any styling."""
+
+        # Read from the content since the parsed rich text is stripped.
+        return "".join(rt["plain_text"] for rt in self.content.get("rich_text", []))
+
+    def serialize(self) -> dict[str, Any]:
+
+        # The content is sent as it was received so that the text of the
+        # block round trips exactly.
+        return {
+            "object": "block",
+            "type": self.block_type,
+            self.block_type: self.content,
+        }
+
+    @classmethod
+    def from_dict(cls: Type[Block], args: dict[str, Any], depth: int = 0) -> Block:
+        """Creates a block from the dictionary returned by Notion.
+
+        Args:
+            args: The block in the Notion format.
+            depth: The nesting level of the block.
+        """
+
+        block_type = args["type"]
+        content = args.get(block_type, None) or {}
+        new_args: dict[str, Any] = {
+            "block_type": block_type,
+            "content": content,
+            "rich_text": rich_text_list(content.get("rich_text", [])),
+            "has_children": args.get("has_children", False),
+            "depth": depth,
+        }
+        new_args.update(base_obj_args(args))
+
+        return Block(**new_args)
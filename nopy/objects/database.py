@@ -2,17 +2,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from dataclasses import field
+from datetime import timedelta
 from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterator
 from typing import ClassVar
 from typing import Generator
+from typing import Iterable
+from typing import Iterator
+from typing import Literal
 from typing import Optional
 from typing import Set
 from typing import Type
 from typing import Union
 
 import nopy.props.db_props as dbp
+from nopy.bulk import BulkReport
+from nopy.bulk import arun_bulk
+from nopy.bulk import run_bulk
+from nopy.columns import Column
+from nopy.columns import Columns
+from nopy.columns import make_column
+from nopy.dates import parse_datetime
 from nopy.enums import ObjectTypes
 from nopy.errors import NoClientFoundError
+from nopy.errors import UnsupportedByNotion
+from nopy.filters import DateFilter
+from nopy.filters import TimestampFilter
 from nopy.objects.notion_object import NotionObject
 from nopy.objects.page import Page
 from nopy.properties import Properties
@@ -22,12 +38,22 @@ from nopy.props.common import Emoji
 from nopy.props.common import File
 from nopy.props.common import RichText
 from nopy.query import Query
+from nopy.relations import aresolve_relations
+from nopy.relations import resolve_relations
+from nopy.slots import copy_state
+from nopy.sorts import TimestampSort
+from nopy.sync import SyncState
 from nopy.types import DBProps
+from nopy.types import SyncAsync
 from nopy.utils import TextDescriptor
+from nopy.utils import ainterleave
+from nopy.utils import apaginate
 from nopy.utils import base_obj_args
 from nopy.utils import get_cover
 from nopy.utils import get_icon
+from nopy.utils import interleave
 from nopy.utils import paginate
+from nopy.utils import resolved
 from nopy.utils import rich_text_list
 
 
@@ -111,11 +137,15 @@ class Database(NotionObject):
         self._type = ObjectTypes.DATABASE
         # Storing the ids of the original properties to handle
         # deleted properties.
-        self._og_props = set(self.properties._ids.keys())  # type: ignore
+        self._og_props = self.properties._all_ids()  # type: ignore
 
     def get_pages(
-        self, max_pages: int = 0, page_size: int = 100
-    ) -> Generator[Page, None, None]:
+        self,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: Optional[bool] = None,
+    ) -> Union[Generator[Page, None, None], AsyncGenerator[Page, None]]:
         """Returns a generator that yields a single page at a time.
 
         Args:
@@ -123,30 +153,236 @@ class Database(NotionObject):
             page_size:
                 The number of pages to get from the Notion API per
                 API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+            lazy:
+                Whether the properties of the pages are only parsed when
+                they're first looked up. If `None`, then the `lazy_pages`
+                option of the client's configuration is used.
 
         Returns:
-            A generator that yields a single page at a time.
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then an async
+            generator is returned instead.
         """
         if not self._client:
             raise NoClientFoundError("database")
 
-        return paginate(
-            self._client._query_db_raw,  # type: ignore
-            Page.from_dict,
+        return self._client.query_db(  # type: ignore
+            self.id,
+            max_pages=max_pages,
             page_size=page_size,
+            prefetch=prefetch,
+            lazy=lazy,
+        )
+
+    def get_raw_pages(
+        self,
+        query: Optional[Union[Query, dict[str, Any]]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+    ) -> Union[
+        Generator[dict[str, Any], None, None], AsyncGenerator[dict[str, Any], None]
+    ]:
+        """Returns a generator that yields the pages as the raw dictionaries
+        returned by Notion without parsing them.
+
+        Args:
+            query: An optional query to apply on the database.
+            max_pages: The maximum number of pages to return.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+
+        Returns:
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then an async
+            generator is returned instead.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("database")
+
+        if isinstance(query, Query):
+            query = query.serialize()
+
+        pagination = apaginate if self._client.is_async else paginate
+        return pagination(
+            self._client._query_db_raw,  # type: ignore
+            _raw_page,
             max_pages=max_pages,
+            prefetch=prefetch,
+            db_id=self.id,
+            query=query,
+            page_size=page_size,
+        )
+
+    def to_columns(
+        self,
+        query: Optional[Union[Query, dict[str, Any]]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+    ) -> SyncAsync[Columns]:
+        """Gets the pages in a column oriented layout without creating
+        `Page` objects.
+
+        The columns are built directly from the raw pages returned by
+        Notion. Every property of the database gets a typed column which
+        can be converted to NumPy arrays, a pandas data frame or a
+        PyArrow table.
+
+        Args:
+            query: An optional query to apply on the database.
+            max_pages: The maximum number of pages to return.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+
+        Returns:
+            The columns. If the database is bound to an
+            `AsyncNotionClient`, then this is an awaitable.
+        """
+
+        pages = self.get_raw_pages(query, max_pages, page_size, prefetch)
+        if self._client.is_async:  # type: ignore
+            return self._to_columns_async(pages)  # type: ignore
+        return Columns.from_raw_pages(pages, self._empty_columns())  # type: ignore
+
+    def parallel_scan(
+        self,
+        shards: int = 4,
+        query: Optional[Union[Query, dict[str, Any]]] = None,
+        page_size: int = 100,
+    ) -> Union[Generator[Page, None, None], AsyncGenerator[Page, None]]:
+        """Scans the database by querying disjoint windows of the creation
+        time of the pages concurrently.
+
+        The time between the first and the last page created in the
+        database is split into `shards` windows which are paginated
+        concurrently. The pages are yielded in the order in which they
+        arrive, so any sorts in the `query` are NOT preserved.
+
+        Args:
+            shards: The number of windows to query concurrently.
+            query: An optional query whose filter is applied on every window.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+
+        Returns:
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then an async
+            generator is returned instead.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("database")
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+
+        if isinstance(query, Query):
+            query = query.serialize()
+        base_filter = (query or {}).get("filter", None)
+
+        if self._client.is_async:
+            return self._parallel_scan_async(shards, base_filter, page_size)
+        return self._parallel_scan(shards, base_filter, page_size)
+
+    def sync_changes(
+        self, state: SyncState, page_size: int = 100, raw: bool = False
+    ) -> Union[Generator[Any, None, None], AsyncGenerator[Any, None]]:
+        """Gets the pages that were created or edited since the last sync.
+
+        Only the pages edited on or after the `watermark` of the `state`
+        are fetched, in the order in which they were edited. The `state`
+        is advanced after each page is consumed, so a sync that's stopped
+        midway can be resumed with the same state.
+
+        Since Notion rounds the last edited time to the minute, pages edited
+        at the watermark are fetched again on the next sync. The pages
+        should be treated as upserts.
+
+        Args:
+            state: The state of the sync which is updated in place.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            raw:
+                Whether to yield the pages as the raw dictionaries returned
+                by Notion instead of `Page` instances.
+
+        Returns:
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then an async
+            generator is returned instead.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("database")
+
+        query = _changes_query(state)
+        if raw:
+            pages = self.get_raw_pages(query, page_size=page_size)
+        else:
+            pages = self._client.query_db(  # type: ignore
+                self.id, query, page_size=page_size
+            )
+        if self._client.is_async:
+            return _track_changes_async(pages, state)
+        return _track_changes(pages, state)
+
+    def reconcile_deletions(
+        self, state: SyncState, page_size: int = 100
+    ) -> SyncAsync[Set[str]]:
+        """Finds the pages that were deleted or archived since the last sync.
+
+        This lists the ids of all the pages in the database without parsing
+        the pages. The ids which were synced before, but are no longer in
+        the database are removed from the `state` and returned.
+
+        Args:
+            state: The state of the sync which is updated in place.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+
+        Returns:
+            The ids of the deleted or archived pages. If the database is
+            bound to an `AsyncNotionClient`, then this is an awaitable.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("database")
+
+        if self._client.is_async:
+            return self._reconcile_deletions_async(state, page_size)
+
+        ids = paginate(
+            self._client._query_db_raw,  # type: ignore
+            _page_id,
             db_id=self.id,
-            client=self._client,
+            page_size=page_size,
         )
+        return _remove_deleted(state, set(ids))
 
-    def create_page(self, page: Union["Page", dict[str, Any]]) -> "Page":
+    def create_page(self, page: Union["Page", dict[str, Any]]) -> SyncAsync["Page"]:
         """Creates a page within this database.
 
         Attributes:
             page (Union[Page, dict[str, Any]]): The page to be created.
 
         Returns:
-            The instance of the created `Page`.
+            The instance of the created `Page`. If the database is bound to
+            an `AsyncNotionClient`, then this is an awaitable.
         """
 
         if not self._client:
@@ -156,52 +392,150 @@ class Database(NotionObject):
             page = page.serialize()
         page["parent"] = DatabaseParent(self.id).serialize()
 
-        return self._client.create_page(page)
+        return self._client.create_page(page)  # type: ignore
+
+    def bulk_create(
+        self, pages: Iterable[Union["Page", dict[str, Any]]], workers: int = 8
+    ) -> SyncAsync[BulkReport["Page"]]:
+        """Creates the pages within this database concurrently.
+
+        The pages are consumed lazily, so they can be a generator of any
+        length. Failed requests are retried according to the
+        `retry_policy` of the client's configuration, or the default
+        `RetryPolicy` if there's none. The requests are rate limited by
+        the `rate_limit` of the client's configuration.
+
+        Creating a page isn't idempotent, so the creates are only retried
+        when rate limited with a 429, which Notion rejects without
+        creating the page. Other failures are recorded in the report.
+
+        Attributes:
+            pages: The pages to be created.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The report holding the created page or the error for every page.
+            The errors are NOT raised. If the database is bound to an
+            `AsyncNotionClient`, then this is an awaitable.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("no client found")
+
+        policy = self._client._bulk_retry_policy  # type: ignore
+        if self._client.is_async:
+            return arun_bulk(pages, self.create_page, workers, policy)  # type: ignore
+        return run_bulk(pages, self.create_page, workers, policy)  # type: ignore
+
+    def resolve_relations(
+        self,
+        pages: Optional[Iterable[Page]] = None,
+        depth: int = 1,
+        workers: int = 8,
+        cache: Optional[dict[str, Page]] = None,
+    ) -> SyncAsync[dict[str, Page]]:
+        """Retrieves the pages related to the pages of this database, and
+        the pages those relate to up to the given depth.
+
+        The related ids of all the pages are collected and deduplicated
+        first, so every related page is retrieved only once, concurrently
+        with the others. The relations holding more ids than returned by
+        Notion are completed along the way.
 
-    def update(self, in_place: bool = False) -> Database:
+        Args:
+            pages:
+                The pages to resolve the relations of, such as the results
+                of a query. If not provided, then all the pages of the
+                database are retrieved.
+            depth:
+                The number of relations to follow. If 1, then only the
+                pages directly related to the pages are retrieved.
+            workers: The maximum number of concurrent requests.
+            cache:
+                The pages retrieved before keyed by their ids, which aren't
+                retrieved again. The retrieved pages are added to it.
+
+        Returns:
+            The related pages keyed by their ids, NOT including the given
+            pages. If the database is bound to an `AsyncNotionClient`, then
+            this is an awaitable.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("no client found")
+
+        if pages is None:
+            pages = self.get_pages()  # type: ignore
+        if self._client.is_async:
+            return aresolve_relations(self._client, pages, depth, workers, cache)  # type: ignore
+        return resolve_relations(self._client, pages, depth, workers, cache)  # type: ignore
+
+    def update(self, in_place: bool = False) -> SyncAsync[Database]:
         """Updates the database.
 
         Attributes:
             in_place (bool):
                 If `True`, then this instance is updated in place.
 
+        Only the properties and fields that were changed since the
+        database was retrieved are sent. If nothing was changed, then no
+        request is made.
+
         Returns:
             The updated Database instance. Returns `self` if `in_place` is
-            `True`.
+            `True` or if nothing was changed. If the database is bound to
+            an `AsyncNotionClient`, then this is an awaitable.
         """
 
         if not self._client:
             raise NoClientFoundError("no client is associated with this instance")
 
-        db = self.serialize()
-        # Parent should not be present when updating
-        db.pop("parent")
+        # Only the changes are sent, and nothing is sent if there are none.
+        db = self._serialize_changes()
+        deleted_props = self._find_deleted_props()
+        if not db and not deleted_props:
+            return resolved(self) if self._client.is_async else self
+
+        if self._client.is_async:
+            return self._update_async(db, deleted_props, in_place)
 
-        updated_db = self._client.update_db(self.id, db)
+        if db:
+            updated_db = self._client.update_db(self.id, db)  # type: ignore
         # Deleted properties have to be sent as a different update
         # request. Sending the deleted properties in one request does NOT
         # work.
-        deleted_props = self._find_deleted_props()
         if deleted_props:
-            db["properties"] = {prop_id: None for prop_id in deleted_props}
-            updated_db = self._client.update_db(self.id, db)
+            deletions = {prop_id: None for prop_id in deleted_props}
+            updated_db = self._client.update_db(  # type: ignore
+                self.id, {"properties": deletions}
+            )
 
-        if not in_place:
-            return updated_db
-        self.__dict__.clear()
-        self.__dict__ = updated_db.__dict__
-        return self
+        return self._apply_update(updated_db, in_place)
 
     def query(
-        self, query: Union[Query, dict[str, Any]], max_pages: int = 0
-    ) -> Generator["Page", None, None]:
+        self,
+        query: Union[Query, dict[str, Any]],
+        max_pages: int = 0,
+        prefetch: int = 0,
+        lazy: Optional[bool] = None,
+    ) -> Union[Generator["Page", None, None], AsyncGenerator["Page", None]]:
         """Query a database.
 
         Attributes:
             query: The query to apply on the database.
+            max_pages: The maximum number of pages to return.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+            lazy:
+                Whether the properties of the pages are only parsed when
+                they're first looked up. If `None`, then the `lazy_pages`
+                option of the client's configuration is used.
 
         Returns:
-            A generator that yields a single page at a time.
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then an async
+            generator is returned instead.
         """
 
         if not self._client:
@@ -210,38 +544,142 @@ class Database(NotionObject):
         if isinstance(query, Query):
             query = query.serialize()
 
-        return paginate(
-            self._client._query_db_raw,  # type: ignore
-            Page.from_dict,
-            max_pages=max_pages,
-            db_id=self.id,
-            client=self._client,
-            query=query,
+        return self._client.query_db(  # type: ignore
+            self.id, query, max_pages=max_pages, prefetch=prefetch, lazy=lazy
         )
 
     def serialize(self) -> dict[str, Any]:
 
-        serialized: dict[str, Any] = {
+        serialized = self._serialize_fields()
+        serialized["properties"] = self.properties.serialize()
+        serialized["parent"] = self.parent.serialize() if self.parent else None
+
+        # Title needs to be added to the properties as well
+        serialized["properties"]["title"] = {"title": {}}
+
+        return serialized
+
+    def _serialize_changes(self) -> dict[str, Any]:
+
+        changes = self._changed_fields()
+        properties = self.properties.serialize_changes()
+        if properties:
+            changes["properties"] = properties
+
+        return changes
+
+    def _serialize_fields(self) -> dict[str, Any]:
+
+        fields: dict[str, Any] = {
             "is_inline": self.is_inline,
             "archived": self.archived,
-            "properties": self.properties.serialize(),
         }
-
-        for attr in ("parent", "icon", "cover"):
+        for attr in ("icon", "cover"):
             value = self.__dict__.get(attr, None)
-            serialized[attr] = value if value is None else value.serialize()
+            try:
+                fields[attr] = value if value is None else value.serialize()
+            except UnsupportedByNotion:
+                # Files uploaded to Notion can't be set via the API, so
+                # they're left as they are.
+                continue
+        fields["title"] = [rt.serialize() for rt in self.rich_title]
+        fields["description"] = [rt.serialize() for rt in self.rich_description]
 
-        serialized["title"] = [rt.serialize() for rt in self.rich_title]
-        serialized["description"] = [rt.serialize() for rt in self.rich_description]
+        return fields
 
-        # Title needs to be added to the properties as well
-        serialized["properties"]["title"] = {"title": {}}
+    def _parallel_scan(
+        self, shards: int, base_filter: Optional[dict[str, Any]], page_size: int
+    ) -> Generator[Page, None, None]:
 
-        return serialized
+        client: Any = self._client
+        first = list(client.query_db(self.id, _bound_query("ascending"), 1, 1))
+        last = list(client.query_db(self.id, _bound_query("descending"), 1, 1))
+        if not first or not last:
+            return
+
+        queries = _shard_queries(first[0], last[0], shards, base_filter)
+        iterators = [
+            client.query_db(self.id, query, page_size=page_size) for query in queries
+        ]
+        yield from _dedupe_pages(interleave(iterators))
+
+    async def _parallel_scan_async(
+        self, shards: int, base_filter: Optional[dict[str, Any]], page_size: int
+    ) -> AsyncGenerator[Page, None]:
+
+        client: Any = self._client
+        first = [
+            p async for p in client.query_db(self.id, _bound_query("ascending"), 1, 1)
+        ]
+        last = [
+            p async for p in client.query_db(self.id, _bound_query("descending"), 1, 1)
+        ]
+        if not first or not last:
+            return
+
+        queries = _shard_queries(first[0], last[0], shards, base_filter)
+        iterators = [
+            client.query_db(self.id, query, page_size=page_size) for query in queries
+        ]
+        async for page in _adedupe_pages(ainterleave(iterators)):
+            yield page
+
+    async def _to_columns_async(
+        self, pages: AsyncGenerator[dict[str, Any], None]
+    ) -> Columns:
+
+        columns = Columns(self._empty_columns())
+        async for page in pages:
+            columns.add_page(page)
+        return columns
+
+    def _empty_columns(self) -> dict[str, Column]:
+
+        # The options known from the schema get the first codes, so the
+        # codes are the same across queries.
+        return {
+            prop.name: make_column(
+                prop.type, [opt.name for opt in getattr(prop, "options", [])]
+            )
+            for prop in self.properties
+        }
+
+    async def _reconcile_deletions_async(
+        self, state: SyncState, page_size: int
+    ) -> Set[str]:
+
+        ids = apaginate(
+            self._client._query_db_raw,  # type: ignore
+            _page_id,
+            db_id=self.id,
+            page_size=page_size,
+        )
+        return _remove_deleted(state, {page_id async for page_id in ids})
+
+    async def _update_async(
+        self, db: dict[str, Any], deleted_props: Set[str], in_place: bool
+    ) -> Database:
+
+        if db:
+            updated_db = await self._client.update_db(self.id, db)  # type: ignore
+        if deleted_props:
+            deletions = {prop_id: None for prop_id in deleted_props}
+            updated_db = await self._client.update_db(  # type: ignore
+                self.id, {"properties": deletions}
+            )
+
+        return self._apply_update(updated_db, in_place)
+
+    def _apply_update(self, updated_db: Database, in_place: bool) -> Database:
+
+        if not in_place:
+            return updated_db
+        copy_state(updated_db, self)
+        return self
 
     def _find_deleted_props(self) -> Set[str]:
 
-        curr_props = set(self.properties._ids.keys())  # type: ignore
+        curr_props = self.properties._all_ids()  # type: ignore
         return self._og_props.difference(curr_props)
 
     @classmethod
@@ -271,4 +709,129 @@ class Database(NotionObject):
         new_args["properties"] = properties
         new_args.update(base_obj_args(args))
 
-        return Database(**new_args)
+        db = Database(**new_args)
+        db._track_changes()
+        return db
+
+
+# ----- Helpers for `parallel_scan` -----
+
+
+def _bound_query(direction: Literal["ascending", "descending"]) -> dict[str, Any]:
+
+    return {"sorts": [TimestampSort("created_time", direction).serialize()]}
+
+
+def _shard_queries(
+    first: Page,
+    last: Page,
+    shards: int,
+    base_filter: Optional[dict[str, Any]],
+) -> list[dict[str, Any]]:
+
+    start, end = first.created_time, last.created_time
+    if start is None or end is None:
+        # Without the bounds, the database is scanned by a single query.
+        return [{"filter": base_filter} if base_filter else {}]
+
+    # Notion rounds the created time to the minute, so there's no point
+    # in having windows smaller than a minute.
+    shards = max(1, min(shards, int((end - start) / timedelta(minutes=1))))
+    step = (end - start) / shards
+    bounds = [start + step * i for i in range(shards)] + [end]
+
+    queries: list[dict[str, Any]] = []
+    for window_start, window_end in zip(bounds, bounds[1:]):
+        # Both the ends of a window are inclusive since the timestamps are
+        # rounded. Pages on the boundaries are deduplicated when merging.
+        # Notion only accepts a single condition per date filter, so the
+        # ends are separate filters.
+        conditions = [
+            TimestampFilter("created_time", DateFilter(on_or_after=window_start)),
+            TimestampFilter("created_time", DateFilter(on_or_before=window_end)),
+        ]
+        window = [condition.serialize() for condition in conditions]
+        query_filter = {"and": window + [base_filter] if base_filter else window}
+        queries.append({"filter": query_filter})
+
+    return queries
+
+
+def _dedupe_pages(pages: Iterator[Page]) -> Generator[Page, None, None]:
+
+    seen: Set[str] = set()
+    for page in pages:
+        if page.id not in seen:
+            seen.add(page.id)
+            yield page
+
+
+async def _adedupe_pages(pages: AsyncIterator[Page]) -> AsyncGenerator[Page, None]:
+
+    seen: Set[str] = set()
+    async for page in pages:
+        if page.id not in seen:
+            seen.add(page.id)
+            yield page
+
+
+# ----- Helpers for incremental syncs -----
+
+
+def _changes_query(state: SyncState) -> dict[str, Any]:
+
+    query: dict[str, Any] = {
+        "sorts": [TimestampSort("last_edited_time").serialize()],
+    }
+    if state.watermark:
+        date_filter = DateFilter(on_or_after=state.watermark)
+        query["filter"] = TimestampFilter("last_edited_time", date_filter).serialize()
+    return query
+
+
+def _advance(state: SyncState, page: Union[Page, dict[str, Any]]):
+
+    if isinstance(page, Page):
+        page_id, last_edited_time = page.id, page.last_edited_time
+    else:
+        page_id, last_edited_time = page["id"], parse_datetime(page["last_edited_time"])
+
+    state.known_ids.add(page_id)
+    if last_edited_time and (
+        state.watermark is None or last_edited_time > state.watermark
+    ):
+        state.watermark = last_edited_time
+
+
+def _track_changes(
+    pages: Iterator[Any], state: SyncState
+) -> Generator[Any, None, None]:
+
+    for page in pages:
+        yield page
+        # Advancing only after the page has been consumed.
+        _advance(state, page)
+
+
+async def _track_changes_async(
+    pages: AsyncIterator[Any], state: SyncState
+) -> AsyncGenerator[Any, None]:
+
+    async for page in pages:
+        yield page
+        _advance(state, page)
+
+
+def _page_id(page: dict[str, Any]) -> str:
+    return page["id"]
+
+
+def _raw_page(page: dict[str, Any]) -> dict[str, Any]:
+    return page
+
+
+def _remove_deleted(state: SyncState, current_ids: Set[str]) -> Set[str]:
+
+    deleted = state.known_ids - current_ids
+    state.known_ids -= deleted
+    return deleted
@@ -8,13 +8,15 @@ from typing import Optional
 from typing import Type
 
 from nopy.enums import ObjectTypes
+from nopy.slots import slotted
 
 if TYPE_CHECKING:
-    from nopy.client import NotionClient
+    from nopy.client import BaseClient
     from nopy.objects.user import User
     from nopy.props.common import Parent
 
 
+@slotted("_type", "_client")
 @dataclass
 class BaseObject:
     """A representation of the base object from which all other objects
@@ -33,9 +35,9 @@ class BaseObject:
     def __post_init__(self):
 
         self._type = ObjectTypes.UNSUPPORTED
-        self._client: Optional["NotionClient"] = None
+        self._client: Optional["BaseClient"] = None
 
-    def set_client(self, client: "NotionClient"):
+    def set_client(self, client: "BaseClient"):
         """Sets the client."""
 
         self._client = client
@@ -61,3 +63,34 @@ class NotionObject(BaseObject):
     created_by: Optional[User] = None
     last_edited_by: Optional[User] = None
     parent: Optional[Parent] = None
+
+    def __post_init__(self):
+
+        super().__post_init__()
+        # The serialized fields from when the changes started being
+        # tracked. If `None`, then the changes aren't tracked.
+        self._snapshot: Optional[dict[str, Any]] = None
+
+    def _serialize_fields(self) -> dict[str, Any]:
+
+        # The fields that can be updated, other than the properties.
+        raise NotImplementedError("to be implemented by subclass")
+
+    def _track_changes(self):
+
+        # Called once the object is parsed from Notion so that updates
+        # only send the changes made afterwards. Both pages and databases
+        # hold their properties in `properties`.
+        self._snapshot = self._serialize_fields()
+        self.properties._track()  # type: ignore
+
+    def _changed_fields(self) -> dict[str, Any]:
+
+        fields = self._serialize_fields()
+        if self._snapshot is None:
+            return fields
+        return {
+            name: value
+            for name, value in fields.items()
+            if name not in self._snapshot or self._snapshot[name] != value
+        }
@@ -4,7 +4,10 @@ from dataclasses import dataclass
 from dataclasses import field
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AsyncGenerator
 from typing import ClassVar
+from typing import Generator
+from typing import Iterable
 from typing import Optional
 from typing import Type
 from typing import Union
@@ -12,17 +15,25 @@ from typing import Union
 import nopy.props.page_props as pgp
 from nopy.enums import ObjectTypes
 from nopy.errors import NoClientFoundError
+from nopy.errors import UnsupportedByNotion
+from nopy.intern import current_pool
+from nopy.objects.block import Block
 from nopy.objects.notion_object import NotionObject
 from nopy.properties import Properties
 from nopy.props.base import ObjectProperty
 from nopy.props.common import Emoji
 from nopy.props.common import File
 from nopy.props.common import RichText
+from nopy.relations import aresolve_relations
+from nopy.relations import resolve_relations
+from nopy.slots import copy_state
 from nopy.types import PageProps
+from nopy.types import SyncAsync
 from nopy.utils import TextDescriptor
 from nopy.utils import base_obj_args
 from nopy.utils import get_cover
 from nopy.utils import get_icon
+from nopy.utils import resolved
 from nopy.utils import rich_text_list
 
 if TYPE_CHECKING:
@@ -98,54 +109,186 @@ class Page(NotionObject):
 
         super().__post_init__()
         self._type = ObjectTypes.PAGE
-        self._og_props = set(self.properties._ids.keys())  # type: ignore
+        self._og_props = self.properties._all_ids()  # type: ignore
 
-    def update(self, in_place: bool = False) -> Page:
+    def update(self, in_place: bool = False) -> SyncAsync[Page]:
         """Updates the page.
 
         Attributes:
             in_place (bool):
                 If `True`, then this instance is updated in place.
 
+        Only the properties and fields that were changed since the page
+        was retrieved are sent. If nothing was changed, then no request is
+        made.
+
         Returns:
             The updated Page instance. Returns `self` if `in_place` is
-                `True`.
+                `True` or if nothing was changed. If the page is bound to
+                an `AsyncNotionClient`, then this is an awaitable.
         """
 
         if not self._client:
             raise NoClientFoundError("no client is associated with this instance")
 
-        page = self.serialize()
-        # Parent should not be present when updating
-        page.pop("parent")
+        # Only the changes are sent, and nothing is sent if there are none.
+        page = self._serialize_changes()
+        if not page:
+            return resolved(self) if self._client.is_async else self
+
+        if self._client.is_async:
+            return self._update_async(page, in_place)
+
+        updated_page = self._client.update_page(self.id, page)  # type: ignore
+        return self._apply_update(updated_page, in_place)
+
+    def get_blocks(
+        self, recursive: bool = True, workers: int = 8, page_size: int = 100
+    ) -> Union[Generator[Block, None, None], AsyncGenerator[Block, None]]:
+        """Returns a generator that yields the blocks of the page in the
+        order they appear in the document.
+
+        Args:
+            recursive:
+                If `True`, then the nested blocks are yielded right after
+                the block they're nested in. The `depth` of each block
+                gives its nesting level.
+            workers:
+                The maximum number of concurrent requests when retrieving
+                the nested blocks.
+            page_size:
+                The number of blocks to get from the Notion API per
+                API call.
 
-        updated_page = self._client.update_page(self.id, page)
+        Returns:
+            A generator that yields a single block at a time. If the page
+            is bound to an `AsyncNotionClient`, then an async generator is
+            returned instead.
+        """
 
-        if not in_place:
-            return updated_page
-        self.__dict__.clear()
-        self.__dict__ = updated_page.__dict__
-        return self
+        if not self._client:
+            raise NoClientFoundError("no client is associated with this instance")
+
+        return self._client.retrieve_block_children(  # type: ignore
+            self.id, recursive=recursive, workers=workers, page_size=page_size
+        )
+
+    def append_blocks(
+        self, blocks: Iterable[Union[Block, dict[str, Any]]], workers: int = 8
+    ) -> SyncAsync[list[Block]]:
+        """Appends the blocks to the end of the page.
+
+        Args:
+            blocks:
+                The blocks or the blocks in the Notion format, including
+                any nested blocks. There's no limit on the number of blocks.
+            workers: The maximum number of concurrent requests.
+
+        Returns:
+            The created blocks that were appended directly to the page. If
+            the page is bound to an `AsyncNotionClient`, then this is an
+            awaitable.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("no client is associated with this instance")
+
+        return self._client.append_block_children(  # type: ignore
+            self.id, blocks, workers=workers
+        )
+
+    def resolve_relations(
+        self,
+        depth: int = 1,
+        workers: int = 8,
+        cache: Optional[dict[str, Page]] = None,
+    ) -> SyncAsync[dict[str, Page]]:
+        """Retrieves the pages this page relates to through its relation
+        properties, and the pages those relate to up to the given depth.
+
+        Every related page is retrieved only once and concurrently with
+        the others. The relations of the page that hold more ids than
+        returned by Notion are completed along the way.
+
+        Args:
+            depth:
+                The number of relations to follow. If 1, then only the
+                pages directly related to this page are retrieved.
+            workers: The maximum number of concurrent requests.
+            cache:
+                The pages retrieved before keyed by their ids, which aren't
+                retrieved again. The retrieved pages are added to it.
+
+        Returns:
+            The related pages keyed by their ids. If the page is bound to
+            an `AsyncNotionClient`, then this is an awaitable.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("no client is associated with this instance")
+
+        if self._client.is_async:
+            return aresolve_relations(self._client, [self], depth, workers, cache)
+        return resolve_relations(self._client, [self], depth, workers, cache)
 
     def serialize(self) -> dict[str, Any]:
 
-        serialized: dict[str, Any] = {
-            "archived": self.archived,
-            "properties": self.properties.serialize(),
-        }
+        serialized = self._serialize_fields()
+        title = serialized.pop("title")
+        serialized["properties"] = self.properties.serialize()
+        serialized["properties"]["title"] = {"title": title}
+        serialized["parent"] = self.parent.serialize() if self.parent else None
+
+        return serialized
+
+    def _serialize_changes(self) -> dict[str, Any]:
+
+        changes = self._changed_fields()
+        properties = self.properties.serialize_changes()
+        if "title" in changes:
+            properties["title"] = {"title": changes.pop("title")}
+        if properties:
+            changes["properties"] = properties
+
+        return changes
+
+    def _serialize_fields(self) -> dict[str, Any]:
 
-        for attr in ("parent", "icon", "cover"):
+        fields: dict[str, Any] = {"archived": self.archived}
+        for attr in ("icon", "cover"):
             value = self.__dict__.get(attr, None)
-            serialized[attr] = value if value is None else value.serialize()
+            try:
+                fields[attr] = value if value is None else value.serialize()
+            except UnsupportedByNotion:
+                # Files uploaded to Notion can't be set via the API, so
+                # they're left as they are.
+                continue
+        fields["title"] = [rt.serialize() for rt in self.rich_title]
 
-        serialized["properties"]["title"] = {
-            "title": [rt.serialize() for rt in self.rich_title]
-        }
+        return fields
 
-        return serialized
+    async def _update_async(self, page: dict[str, Any], in_place: bool) -> Page:
+
+        updated_page = await self._client.update_page(self.id, page)  # type: ignore
+        return self._apply_update(updated_page, in_place)
+
+    def _apply_update(self, updated_page: Page, in_place: bool) -> Page:
+
+        if not in_place:
+            return updated_page
+        copy_state(updated_page, self)
+        return self
 
     @classmethod
-    def from_dict(cls: Type[Page], args: dict[str, Any]) -> Page:
+    def from_dict(cls: Type[Page], args: dict[str, Any], lazy: bool = False) -> Page:
+        """Creates a page from the dictionary returned by Notion.
+
+        Args:
+            args: The page in the Notion format.
+            lazy:
+                If `True`, then the properties are only parsed when they're
+                first looked up by their name or id.
+        """
 
         # This is needed because a Page object returned by Notion
         # doesn't have the page title directly accessible like in a
@@ -164,6 +307,9 @@ class Page(NotionObject):
         }
         # Getting the database properties
         properties = Properties()
+        # Lazy properties are parsed later, so they're bound to the pool
+        # that's active now, if any.
+        pool = current_pool() if lazy else None
         for name, prop in args["properties"].items():
 
             prop_type = prop["type"]
@@ -172,10 +318,15 @@ class Page(NotionObject):
 
             prop_class = cls._REVERSE_MAP.get(prop_type, ObjectProperty)
             prop["name"] = name
-            prop_instance = prop_class.from_dict(prop)
-            properties.add(prop_instance)
+            if lazy:
+                loader = prop_class.from_dict
+                properties.add_lazy(prop, loader if pool is None else pool.wrap(loader))
+            else:
+                properties.add(prop_class.from_dict(prop))
 
         new_args["properties"] = properties
         new_args.update(base_obj_args(args))
 
-        return Page(**new_args)
+        page = Page(**new_args)
+        page._track_changes()
+        return page
@@ -9,12 +9,15 @@ from typing import Type
 
 from nopy.enums import ObjectTypes
 from nopy.enums import UserTypes
+from nopy.intern import interned
 from nopy.objects.notion_object import BaseObject
+from nopy.slots import slotted
 
 if TYPE_CHECKING:
     pass
 
 
+@slotted("_user_type")
 @dataclass
 class User(BaseObject):
     """The base class for a user in Notion."""
@@ -31,19 +34,25 @@ class User(BaseObject):
     def user_type(self):
         return self._user_type
 
+    def serialize(self) -> dict[str, Any]:
+
+        # Notion only needs the id to refer to a user.
+        return {"object": self._type.value, "id": self.id}
+
     @classmethod
     def from_dict(cls: Type[User], args: dict[str, Any]) -> User:
 
         # This means it's a partial user as returned
         # in `created_by` etc.
         if "type" not in args:
-            return User(args["id"])
+            return interned(("user", args["id"]), lambda: User(args["id"]))
 
         if args["type"] == "person":
             return Person.from_dict(args)
         return Bot.from_dict(args)
 
 
+@slotted()
 @dataclass
 class Person(User):
     """A 'person' user in Notion.
@@ -76,9 +85,11 @@ class Person(User):
         if person:
             new_args["email"] = person.get("email", None)
 
-        return Person(**new_args)
+        key = ("person", *new_args.values())
+        return interned(key, lambda: Person(**new_args))
 
 
+@slotted()
 @dataclass
 class Bot(User):
     """A 'bot' user in Notion.
@@ -114,4 +125,5 @@ class Bot(User):
             new_args["owner"] = bot["owner"]["type"]
             new_args["workspace_name"] = bot.get("workspace_name", None)
 
-        return Bot(**new_args)
+        key = ("bot", *new_args.values())
+        return interned(key, lambda: Bot(**new_args))
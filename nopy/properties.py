@@ -1,5 +1,6 @@
 from collections.abc import Collection
 from typing import Any
+from typing import Callable
 from typing import Iterable
 from typing import Iterator
 from typing import Optional
@@ -11,6 +12,18 @@ from nopy.errors import PropertyNotFoundError
 from nopy.errors import UnuspportedError
 from nopy.types import Props
 
+# Stands in for the serialized form of properties that can't be sent to
+# Notion, such as formulas.
+_READ_ONLY = object()
+
+
+def _serialize(prop: Props) -> Any:
+
+    try:
+        return prop.serialize()
+    except UnuspportedError:
+        return _READ_ONLY
+
 
 class Properties(Collection[Props]):
     """Holds the properties of a database/page."""
@@ -23,6 +36,18 @@ class Properties(Collection[Props]):
         self._ids: dict[str, Props] = {}
         # Keeping this set makes handling __len__ and __iter__ easier.
         self._props: Set[Props] = set()
+        # The raw properties that are yet to be parsed mapped by their
+        # names, along with the function to parse them.
+        self._lazy: dict[str, tuple[dict[str, Any], Callable[..., Props]]] = {}
+        # The ids of the unparsed properties mapped to their names.
+        self._lazy_ids: dict[str, str] = {}
+        # The properties present when the changes started being tracked.
+        # If `None`, then the changes aren't tracked.
+        self._original: Optional[Set[Props]] = None
+        # The original properties mapped to their serialized form from
+        # when they were first looked up. The original properties that
+        # were never looked up can't have changed.
+        self._snapshots: dict[Props, Any] = {}
 
         if props is not None:
             for prop in props:
@@ -44,6 +69,8 @@ class Properties(Collection[Props]):
             raise ValueError("either id or name must be provided")
         if prop.name in self._names or prop.id in self._ids or prop in self._props:
             raise PropertyExistsError("'prop' already exists")
+        if prop.name in self._lazy or prop.id in self._lazy_ids:
+            raise PropertyExistsError("'prop' already exists")
 
         if prop.name:
             self._names[prop.name] = prop
@@ -51,6 +78,26 @@ class Properties(Collection[Props]):
             self._ids[prop.id] = prop
         self._props.add(prop)
 
+    def add_lazy(self, raw_prop: dict[str, Any], loader: Callable[..., Props]):
+        """Adds a property that's only parsed when it's first looked up.
+
+        Attributes:
+            raw_prop (dict[str, Any]):
+                The property in the Notion format along with its name.
+            loader (Callable[..., Props]):
+                The function that parses the raw property.
+
+        Raises:
+            PropertyExistsError: Raised if the property already exists.
+        """
+
+        name, prop_id = raw_prop["name"], raw_prop["id"]
+        if name in self or prop_id in self:
+            raise PropertyExistsError("'prop' already exists")
+
+        self._lazy[name] = (raw_prop, loader)
+        self._lazy_ids[prop_id] = name
+
     def get(self, prop_identifier: str) -> Props:
         """Gets the property based on the given identifier.
 
@@ -87,6 +134,7 @@ class Properties(Collection[Props]):
 
     def serialize(self) -> dict[str, Optional[dict[str, Any]]]:
 
+        self._load_all()
         serialized: dict[str, Optional[dict[str, Any]]] = {}
 
         for prop in self._props:
@@ -100,30 +148,105 @@ class Properties(Collection[Props]):
 
         return serialized
 
+    def serialize_changes(self) -> dict[str, Optional[dict[str, Any]]]:
+        """Serializes only the properties that were added or changed since
+        the changes started being tracked.
+
+        If the changes aren't tracked, then all the properties are
+        serialized.
+        """
+
+        if self._original is None:
+            return self.serialize()
+
+        serialized: dict[str, Optional[dict[str, Any]]] = {}
+        for prop in self._props:
+            if prop in self._original and prop not in self._snapshots:
+                continue
+            value = _serialize(prop)
+            if value is _READ_ONLY:
+                continue
+            if prop not in self._original or value != self._snapshots[prop]:
+                serialized[prop.id or prop.name] = value
+
+        return serialized
+
+    def _track(self):
+
+        # The unparsed properties are tracked once they're parsed.
+        self._original = set(self._props)
+        self._snapshots = {}
+
+    def _snapshot(self, prop: Props) -> Props:
+
+        # Taking the snapshot before the property is handed out, since
+        # it may be changed afterwards.
+        if self._original is not None and prop not in self._snapshots:
+            if prop in self._original:
+                self._snapshots[prop] = _serialize(prop)
+        return prop
+
+    def _refresh(self, prop: Props):
+
+        # Retakes the snapshot of a property that was completed with the
+        # values stored in Notion, since those aren't changes to be sent.
+        if prop in self._snapshots:
+            self._snapshots[prop] = _serialize(prop)
+
+    def _load(self, name: str) -> Props:
+
+        raw_prop, loader = self._lazy.pop(name)
+        del self._lazy_ids[raw_prop["id"]]
+        prop = loader(raw_prop)
+        self.add(prop)
+        if self._original is not None:
+            self._original.add(prop)
+        return prop
+
+    def _load_all(self):
+
+        for name in list(self._lazy):
+            self._load(name)
+
+    def _all_ids(self) -> Set[str]:
+
+        return set(self._ids) | set(self._lazy_ids)
+
     # ----- Dunder Methods -----
 
     def __getitem__(self, prop_identifier: str):
 
         if prop := self._names.get(prop_identifier, None):
-            return prop
+            return self._snapshot(prop)
         if prop := self._ids.get(prop_identifier, None):
-            return prop
+            return self._snapshot(prop)
+        if prop_identifier in self._lazy:
+            return self._snapshot(self._load(prop_identifier))
+        if name := self._lazy_ids.get(prop_identifier, None):
+            return self._snapshot(self._load(name))
 
         msg = f"property with name or id '{prop_identifier}' not found"
         raise PropertyNotFoundError(msg)
 
     def __contains__(self, __x: object) -> bool:
 
-        return __x in self._names or __x in self._ids or __x in self._props
+        if __x in self._names or __x in self._ids or __x in self._props:
+            return True
+        return __x in self._lazy or __x in self._lazy_ids
 
     def __len__(self) -> int:
 
-        return len(self._props)
+        return len(self._props) + len(self._lazy)
 
     def __iter__(self) -> Iterator[Props]:
 
+        self._load_all()
+        if self._original is not None:
+            for prop in self._props:
+                self._snapshot(prop)
         return iter(self._props)
 
     def __str__(self) -> str:
 
+        self._load_all()
         return str(self._props)
@@ -12,6 +12,8 @@ from nopy.errors import UnsupportedByLibraryError
 class BaseProperty:
     """The base class from which all properties inherit."""
 
+    __slots__ = ()
+
     def serialize(self) -> dict[str, Any]:
 
         msg = f"serialization of '{self.__class__.__name__}' type properties"
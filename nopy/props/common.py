@@ -8,18 +8,20 @@ from typing import Optional
 from typing import Type
 from zoneinfo import ZoneInfo
 
-from dateutil.parser import parse
-
+from nopy.dates import parse_datetime
 from nopy.enums import Colors
 from nopy.enums import FileTypes
 from nopy.enums import MentionTypes
 from nopy.enums import ParentTypes
 from nopy.enums import RichTextTypes
 from nopy.errors import UnsupportedByNotion
+from nopy.intern import interned
 from nopy.objects.user import User
 from nopy.props.base import BaseProperty
+from nopy.slots import slotted
 
 
+@slotted()
 @dataclass
 class Annotations(BaseProperty):
     """A representation of the annotations.
@@ -42,18 +44,26 @@ class Annotations(BaseProperty):
 
     @classmethod
     def from_dict(cls: Type[Annotations], args: dict[str, Any]) -> Annotations:
+        def create() -> Annotations:
+            new_args: dict[str, Any] = args.copy()
+            new_args["color"] = Colors[new_args["color"].upper()]
+            return Annotations(**new_args)
 
-        new_args: dict[str, Any] = args.copy()
-        new_args["color"] = Colors[new_args["color"].upper()]
-        return Annotations(**new_args)
+        return interned(("annotations", *sorted(args.items())), create)
 
     def serialize(self) -> dict[str, Any]:
 
-        serialized = self.__dict__.copy()
-        serialized["color"] = self.color.value
-        return serialized
+        return {
+            "bold": self.bold,
+            "italic": self.italic,
+            "strikethrough": self.strikethrough,
+            "underline": self.underline,
+            "code": self.code,
+            "color": self.color.value,
+        }
 
 
+@slotted()
 @dataclass
 class Date(BaseProperty):
     """A representation of a date in Notion.
@@ -79,17 +89,18 @@ class Date(BaseProperty):
     @classmethod
     def from_dict(cls: Type[Date], args: dict[str, Any]) -> Date:
 
-        start = parse(args["start"])
+        start = parse_datetime(args["start"])
         end = None
         time_zone = None
         if end_str := args["end"]:
-            end = parse(end_str)
+            end = parse_datetime(end_str)
         if tz := args["time_zone"]:
             time_zone = ZoneInfo(tz)
 
         return Date(start, end, time_zone)
 
 
+@slotted()
 @dataclass
 class Link(BaseProperty):
     """A representation of a link object.
@@ -108,6 +119,7 @@ class Link(BaseProperty):
         return {"url": self.url}
 
 
+@slotted("_type")
 @dataclass
 class RichText(BaseProperty):
     """A represenation of a rich text property.
@@ -154,6 +166,7 @@ class RichText(BaseProperty):
         return RichText(**base)
 
 
+@slotted()
 @dataclass
 class Text(RichText):
     """A represenation of a text type of rich text.
@@ -198,6 +211,7 @@ class Text(RichText):
         return serialized
 
 
+@slotted()
 @dataclass
 class Mention(RichText):
     """A represenation of a mention type of rich text.
@@ -254,6 +268,7 @@ class Mention(RichText):
         return Mention(**new_args)
 
 
+@slotted()
 @dataclass
 class Equation(RichText):
     """A represenation of an equation type of rich text.
@@ -283,6 +298,7 @@ class Equation(RichText):
         return Equation(**new_args)
 
 
+@slotted()
 @dataclass
 class File(BaseProperty):
     """A representation of a File object.
@@ -313,7 +329,7 @@ class File(BaseProperty):
 
         # Only files hosted by Notion have expiry dates
         if file_type == FileTypes.FILE:
-            new_args["expiry_time"] = parse(file_details["expiry_time"])
+            new_args["expiry_time"] = parse_datetime(file_details["expiry_time"])
 
         return File(**new_args)
 
@@ -331,6 +347,7 @@ class File(BaseProperty):
         }
 
 
+@slotted()
 @dataclass
 class Option(BaseProperty):
     """A representation of an Option.
@@ -350,8 +367,11 @@ class Option(BaseProperty):
 
     @classmethod
     def from_dict(cls: Type[Option], args: dict[str, Any]) -> Option:
-        args["color"] = Colors[args["color"].upper()]
-        return Option(**args)
+        def create() -> Option:
+            new_args = {**args, "color": Colors[args["color"].upper()]}
+            return Option(**new_args)
+
+        return interned(("option", *sorted(args.items())), create)
 
     def serialize(self) -> dict[str, Any]:
         return {"name": self.name, "color": self.color.value}
@@ -376,9 +396,9 @@ class StatusGroup(BaseProperty):
     @classmethod
     def from_dict(cls: Type[StatusGroup], args: dict[str, Any]) -> StatusGroup:
 
-        args["color"] = Colors[args["color"].upper()]
+        new_args = {**args, "color": Colors[args["color"].upper()]}
 
-        return StatusGroup(**args)
+        return StatusGroup(**new_args)
 
 
 @dataclass
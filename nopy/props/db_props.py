@@ -337,7 +337,7 @@ class DBRelation(DBProp):
     def from_dict(cls: Type[DBRelation], args: dict[str, Any]) -> DBRelation:
 
         # This is some trash code, but it works.
-        relation = args[DBRelation._type.value]
+        relation = dict(args[DBRelation._type.value])
         relation_type = relation.pop("type")
         details = relation.pop(relation_type)
         relation.update(details)
@@ -399,7 +399,7 @@ class DBRollup(DBProp):
     @classmethod
     def from_dict(cls: Type[DBRollup], args: dict[str, Any]) -> DBRollup:
 
-        rollup_details = args[DBRollup._type.value]
+        rollup_details = dict(args[DBRollup._type.value])
         rollup_details["function"] = RollupFunctions[rollup_details["function"].upper()]
         return DBRollup(id=args["id"], name=args["name"], **rollup_details)
 
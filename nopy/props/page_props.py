@@ -10,8 +10,7 @@ from typing import Optional
 from typing import Type
 from typing import Union
 
-from dateutil.parser import parse
-
+from nopy.dates import parse_datetime
 from nopy.enums import PropTypes
 from nopy.enums import RollupFunctions
 from nopy.errors import UnsupportedByNotion
@@ -110,7 +109,7 @@ class PCreatedTime(ObjectProperty):
     def from_dict(cls: Type[PCreatedTime], args: dict[str, Any]) -> PCreatedTime:
 
         new_args = _get_base_page_args(args)
-        new_args["created_time"] = parse(args[cls._type.value])
+        new_args["created_time"] = parse_datetime(args[cls._type.value])
 
         return PCreatedTime(**new_args)
 
@@ -302,7 +301,7 @@ class PLastEditedTime(ObjectProperty):
     def from_dict(cls: Type[PLastEditedTime], args: dict[str, Any]) -> PLastEditedTime:
 
         new_args = _get_base_page_args(args)
-        new_args["last_edited_time"] = parse(args[cls._type.value])
+        new_args["last_edited_time"] = parse_datetime(args[cls._type.value])
 
         return PLastEditedTime(**new_args)
 
@@ -435,9 +434,9 @@ class PRelation(ObjectProperty):
         name (str): The name of the property.
         relations: The ids of the pages this property relates to.
         has_more:
-            Denotes whether there are more relations. If `True`, to get
-            the rest of the relations, use the `retrieve_prop` method
-            on the instance of a `Page`.
+            Denotes whether there are more relations. If `True`, the
+            rest of the relations are fetched by the `resolve_relations`
+            method on the instance of a `Page`.
         type (PropTypes):
             The type of the property which will always be
             `PropTypes.RELATION`.
@@ -487,7 +486,9 @@ class PRollup(ObjectProperty):
     function: RollupFunctions = RollupFunctions.COUNT
 
     def serialize(self) -> dict[str, Any]:
-        raise NotImplementedError()
+
+        msg = "creation/updation of rollup"
+        raise UnsupportedByNotion(msg)
 
     @classmethod
     def from_dict(cls: Type[PRollup], args: dict[str, Any]) -> PRollup:
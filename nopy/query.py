@@ -4,6 +4,7 @@ from typing import Any
 from typing import Union
 
 from nopy.filters import Filter
+from nopy.filters import TimestampFilter
 from nopy.sorts import PropertySort
 from nopy.sorts import TimestampSort
 
@@ -18,8 +19,8 @@ class Query:
         sorts: The sorts to be applied to the results.
     """
 
-    and_filters: list[Filter] = field(default_factory=list)
-    or_filters: list[Filter] = field(default_factory=list)
+    and_filters: list[Union[Filter, TimestampFilter]] = field(default_factory=list)
+    or_filters: list[Union[Filter, TimestampFilter]] = field(default_factory=list)
     sorts: list[Union[TimestampSort, PropertySort]] = field(default_factory=list)
 
     def serialize(self):
@@ -0,0 +1,109 @@
+import asyncio
+import hashlib
+import threading
+import time
+import warnings
+from typing import ClassVar
+
+
+class RateLimiter:
+    """A token bucket rate limiter.
+
+    The limiter can be shared across threads, async tasks and multiple
+    clients. Every request reserves a token from the bucket and waits
+    until the reservation is due, which means waiting callers are served
+    in the order in which they arrived.
+
+    Attributes:
+        rate: The number of requests allowed per second on average.
+        burst: The maximum number of requests allowed in a single burst.
+    """
+
+    # Limiters shared by all the clients using the same token, keyed by a
+    # hash of the token so that the tokens aren't kept around.
+    _shared: ClassVar[dict[str, "RateLimiter"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, rate: float, burst: int = 1):
+
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_token(cls, token: str, rate: float, burst: int = 1) -> "RateLimiter":
+        """Returns the limiter shared by all the clients using `token`.
+
+        The limiter is created with the given `rate` and `burst` the first
+        time it's requested. Subsequent calls return the same limiter. If
+        they ask for different settings, the stricter of the two are
+        applied to the shared limiter and a warning is issued.
+        """
+
+        key = hashlib.sha256(token.encode()).hexdigest()
+        with cls._shared_lock:
+            limiter = cls._shared.get(key, None)
+            if limiter is None:
+                limiter = cls(rate, burst)
+                cls._shared[key] = limiter
+            elif (limiter.rate, limiter.burst) != (rate, burst):
+                limiter._restrict(rate, burst)
+            return limiter
+
+    def acquire(self):
+        """Blocks until a request can be made."""
+
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Waits without blocking the event loop until a request can be made."""
+
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _restrict(self, rate: float, burst: int):
+
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        with self._lock:
+            old = (self.rate, self.burst)
+            self.rate = min(self.rate, rate)
+            self.burst = min(self.burst, burst)
+            self._tokens = min(self._tokens, self.burst)
+        warnings.warn(
+            f"the rate limit of {rate}/s with a burst of {burst} differs from the "
+            f"{old[0]}/s with a burst of {old[1]} of the clients sharing the token; "
+            f"using {self.rate}/s with a burst of {self.burst}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+    def _reserve(self) -> float:
+        """Takes a token from the bucket and returns the number of seconds
+        to wait before the token may be used."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            # The bucket is allowed to go negative so that the waiting
+            # callers queue up behind each other instead of racing.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
@@ -0,0 +1,162 @@
+"""Resolving the pages that pages relate to through their relation
+properties, fetching every related page only once."""
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import AsyncIterable
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+from nopy.bulk import arun_bulk
+from nopy.bulk import run_bulk
+from nopy.props.page_props import PRelation
+
+if TYPE_CHECKING:
+    from nopy.objects.page import Page
+
+
+def resolve_relations(
+    client: Any,
+    pages: Iterable["Page"],
+    depth: int = 1,
+    workers: int = 8,
+    cache: Optional[dict[str, "Page"]] = None,
+) -> dict[str, "Page"]:
+    """Retrieves the pages related to the given pages, and the pages
+    related to those up to the given depth.
+
+    The related ids of all the pages at a depth are collected and
+    deduplicated before the missing pages are retrieved concurrently.
+    Relations with more ids than Notion returns along with a page are
+    completed by paginating through the property.
+
+    Args:
+        client: The client used to make the requests.
+        pages: The pages to start from.
+        depth:
+            The number of relations to follow. If 1, then only the pages
+            directly related to the given pages are retrieved.
+        workers: The maximum number of concurrent requests.
+        cache:
+            The pages retrieved before keyed by their ids. The pages that
+            are retrieved are added to it, so that it can be shared by
+            several calls.
+
+    Returns:
+        The related pages keyed by their ids, NOT including the given
+        pages.
+    """
+
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+
+    cache = {} if cache is None else cache
+    frontier = list(pages)
+    seen = {page.id for page in frontier}
+    resolved: dict[str, "Page"] = {}
+
+    def fetch(item: tuple["Page", PRelation]) -> list[str]:
+        return list(_relation_ids(client, *item))
+
+    for _ in range(depth):
+        report = run_bulk(_truncated_relations(frontier), fetch, workers)
+        report.raise_for_errors()
+        for result in report:
+            _complete(*result.item, result.result)  # type: ignore
+
+        related = _related_ids(frontier, seen)
+        missing = [page_id for page_id in related if page_id not in cache]
+        report = run_bulk(missing, client.retrieve_page, workers)
+        report.raise_for_errors()
+        for result in report:
+            cache[result.item] = result.result  # type: ignore
+
+        frontier = [cache[page_id] for page_id in related]
+        resolved.update(zip(related, frontier))
+
+    return resolved
+
+
+async def aresolve_relations(
+    client: Any,
+    pages: Union[Iterable["Page"], AsyncIterable["Page"]],
+    depth: int = 1,
+    workers: int = 8,
+    cache: Optional[dict[str, "Page"]] = None,
+) -> dict[str, "Page"]:
+    """The async counterpart of `resolve_relations`, which also accepts
+    the pages as an async iterable."""
+
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+
+    if isinstance(pages, AsyncIterable):
+        frontier = [page async for page in pages]
+    else:
+        frontier = list(pages)
+
+    cache = {} if cache is None else cache
+    seen = {page.id for page in frontier}
+    resolved: dict[str, "Page"] = {}
+
+    async def fetch(item: tuple["Page", PRelation]) -> list[str]:
+        return [page_id async for page_id in _relation_ids(client, *item)]
+
+    for _ in range(depth):
+        report = await arun_bulk(_truncated_relations(frontier), fetch, workers)
+        report.raise_for_errors()
+        for result in report:
+            _complete(*result.item, result.result)  # type: ignore
+
+        related = _related_ids(frontier, seen)
+        missing = [page_id for page_id in related if page_id not in cache]
+        report = await arun_bulk(missing, client.retrieve_page, workers)
+        report.raise_for_errors()
+        for result in report:
+            cache[result.item] = result.result  # type: ignore
+
+        frontier = [cache[page_id] for page_id in related]
+        resolved.update(zip(related, frontier))
+
+    return resolved
+
+
+def _relations(page: "Page") -> list[PRelation]:
+
+    return [prop for prop in page.properties if isinstance(prop, PRelation)]
+
+
+def _truncated_relations(pages: list["Page"]) -> list[tuple["Page", PRelation]]:
+
+    return [
+        (page, prop) for page in pages for prop in _relations(page) if prop.has_more
+    ]
+
+
+def _related_ids(pages: list["Page"], seen: set[str]) -> list[str]:
+
+    # The ids that weren't seen before in the order they were found. The
+    # seen ids include the pages being resolved, so cycles are followed once.
+    related: list[str] = []
+    for page in pages:
+        for prop in _relations(page):
+            for page_id in prop.relations:
+                if page_id not in seen:
+                    seen.add(page_id)
+                    related.append(page_id)
+    return related
+
+
+def _complete(page: "Page", prop: PRelation, relations: list[str]):
+
+    prop.relations = relations
+    prop.has_more = False
+    # The relations fetched from Notion aren't changes to be sent.
+    page.properties._refresh(prop)
+
+
+def _relation_ids(client: Any, page: "Page", prop: PRelation):
+
+    # A generator for sync clients and an async generator for async ones.
+    return client.stream_page_property(page.id, prop.id)
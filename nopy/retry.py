@@ -0,0 +1,174 @@
+import random
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import ClassVar
+from typing import Generator
+from typing import Optional
+
+import httpx
+
+from nopy.constants import APIEndpoints
+from nopy.constants import endpoint_template
+
+
+@dataclass
+class RetryPolicy:
+    """The policy used to retry failed requests.
+
+    Requests are retried with a capped exponential backoff and full jitter,
+    unless the response contains a `Retry-After` header in which case that
+    is honoured instead, up to `backoff_max`.
+
+    Idempotent requests are retried on any of the `retry_statuses` and on
+    transport errors such as timeouts. Non-idempotent requests, such as
+    creating a page, are only retried on a 429 since the request was
+    rejected without being processed.
+
+    Attributes:
+        max_retries: The maximum number of retries per request.
+        backoff_base: The delay in seconds before the first retry.
+        backoff_max:
+            The maximum delay in seconds between retries, including the
+            delays asked for by `Retry-After` headers.
+        jitter: Whether to randomize the delays.
+        retry_statuses: The status codes on which requests are retried.
+        counters:
+            The number of retries made for each endpoint keyed by the method
+            and the endpoint such as 'POST databases/{}/query'.
+    """
+
+    _IDEMPOTENT_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {"GET", "HEAD", "PUT", "PATCH", "DELETE"}
+    )
+    # POST requests that only read data.
+    _READ_ENDPOINTS: ClassVar[frozenset[str]] = frozenset(
+        {APIEndpoints.DB_QUERY.value, APIEndpoints.SEARCH.value}
+    )
+
+    # PATCH requests that add data, so retrying them could duplicate it.
+    _APPEND_ENDPOINTS: ClassVar[frozenset[str]] = frozenset(
+        {APIEndpoints.BLOCK_CHILDREN_APPEND.value}
+    )
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    counters: Counter[str] = field(default_factory=Counter, init=False)
+
+    def __post_init__(self):
+
+        self._lock = threading.Lock()
+
+    def get_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Gets the number of seconds to wait before retrying the request.
+
+        Args:
+            request: The request that failed.
+            attempt: The number of retries already made for the request.
+            response:
+                The response to the request. This is `None` if the request
+                failed due to a transport error.
+
+        Returns:
+            The delay in seconds or `None` if the request should not be
+            retried.
+        """
+
+        if attempt >= self.max_retries:
+            return None
+
+        endpoint = self.endpoint_key(request)
+        idempotent = self._is_idempotent(request.method, endpoint)
+        if response is None:
+            if not idempotent:
+                return None
+        elif response.status_code not in self.retry_statuses:
+            return None
+        elif response.status_code != 429 and not idempotent:
+            return None
+
+        with self._lock:
+            self.counters[f"{request.method} {endpoint}"] += 1
+
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            # A misbehaving or hostile header shouldn't stall the client.
+            return min(self.backoff_max, retry_after)
+
+        delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def endpoint_key(self, request: httpx.Request) -> str:
+        """Gets the endpoint of the request without the ids in it."""
+
+        return endpoint_template(request.url.path)
+
+    def _is_idempotent(self, method: str, endpoint: str) -> bool:
+
+        if method == "PATCH" and endpoint in self._APPEND_ENDPOINTS:
+            return False
+        return method in self._IDEMPOTENT_METHODS or endpoint in self._READ_ENDPOINTS
+
+    def _retry_after(self, response: Optional[httpx.Response]) -> Optional[float]:
+
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After", None)
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # Dates with a '-0000' offset are parsed as naive, but HTTP
+            # dates are always in UTC.
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# The policy used by the clients without a retry policy of their own, set
+# for the requests made by the items of bulk operations.
+_fallback_policy: ContextVar[Optional[RetryPolicy]] = ContextVar(
+    "nopy_fallback_retry_policy", default=None
+)
+
+
+@contextmanager
+def fallback_policy(policy: Optional[RetryPolicy]) -> Generator[None, None, None]:
+    """Retries the requests made within the context according to the
+    policy, if the client making them has no retry policy configured.
+
+    The policy only applies to the current thread or async task.
+    """
+
+    token = _fallback_policy.set(policy)
+    try:
+        yield
+    finally:
+        _fallback_policy.reset(token)
+
+
+def get_fallback_policy() -> Optional[RetryPolicy]:
+    """Gets the policy set by `fallback_policy`, if any."""
+
+    return _fallback_policy.get()
@@ -0,0 +1,81 @@
+from dataclasses import fields
+from dataclasses import is_dataclass
+from typing import Any
+from typing import Callable
+from typing import Type
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def slotted(*extra: str) -> Callable[[Type[T]], Type[T]]:
+    """Recreates a dataclass with `__slots__` so that its instances don't
+    carry a `__dict__`.
+
+    This does what `dataclass(slots=True)` does in Python 3.10+. The
+    decorator must be applied on top of `@dataclass`, and the bases of the
+    class must be slotted as well for the instances to have no `__dict__`.
+
+    Args:
+        extra:
+            The names of the attributes that aren't fields, but are set
+            on the instances, such as the ones set in `__post_init__`.
+    """
+
+    def wrap(cls: Type[T]) -> Type[T]:
+
+        if not is_dataclass(cls):
+            raise TypeError(f"'{cls.__name__}' is not a dataclass")
+
+        inherited = {
+            slot for base in cls.__mro__[1:] for slot in getattr(base, "__slots__", ())
+        }
+        names = [field.name for field in fields(cls)] + list(extra)
+        slots = tuple(name for name in dict.fromkeys(names) if name not in inherited)
+
+        cls_dict = dict(cls.__dict__)
+        for name in slots:
+            # The defaults are already part of the generated `__init__`
+            # and would clash with the slots.
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        cls_dict["__slots__"] = slots
+
+        new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        new_cls.__qualname__ = cls.__qualname__
+        _fix_class_cells(new_cls, cls)
+        return new_cls
+
+    return wrap
+
+
+def copy_state(src: Any, dst: Any):
+    """Copies all the attributes of `src`, including the ones stored in
+    slots, to `dst` which must be of the same class."""
+
+    for cls in type(src).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(src, slot):
+                setattr(dst, slot, getattr(src, slot))
+    if hasattr(src, "__dict__"):
+        dst.__dict__.clear()
+        dst.__dict__.update(src.__dict__)
+
+
+def _fix_class_cells(new_cls: type, old_cls: type):
+
+    # Methods using the zero argument `super()` refer to the class via
+    # the `__class__` closure cell which still points to the old class.
+    for value in new_cls.__dict__.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            value = value.__func__
+        elif isinstance(value, property):
+            value = value.fget
+        for cell in getattr(value, "__closure__", None) or ():
+            try:
+                if cell.cell_contents is old_cls:
+                    cell.cell_contents = new_cls
+            except ValueError:
+                # The cell is empty.
+                continue
@@ -0,0 +1,438 @@
+"""A local SQLite mirror of Notion databases."""
+
+import json
+import sqlite3
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import Union
+
+from nopy.dates import parse_datetime
+from nopy.enums import PropTypes
+from nopy.errors import NoClientFoundError
+from nopy.errors import UnsupportedByLibraryError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.sync import SyncState
+from nopy.utils import plain_text
+
+Extractor = Callable[[Any], Any]
+
+
+def _name(value: Optional[dict[str, Any]]) -> Optional[str]:
+    return None if value is None else value["name"]
+
+
+def _date(value: Optional[dict[str, Any]]) -> Optional[str]:
+    return None if value is None else value["start"]
+
+
+def _json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _formula(value: dict[str, Any]) -> Any:
+    result = value[value["type"]]
+    return _date(result) if value["type"] == "date" else result
+
+
+# The SQLite type and the function to get the column value from the raw
+# property value for each of the supported property types.
+_COLUMNS: dict[PropTypes, tuple[str, Extractor]] = {
+    PropTypes.CHECKBOX: ("INTEGER", int),
+    PropTypes.CREATED_BY: ("TEXT", lambda user: user["id"]),
+    PropTypes.CREATED_TIME: ("TEXT", str),
+    PropTypes.DATE: ("TEXT", _date),
+    PropTypes.EMAIL: ("TEXT", str),
+    PropTypes.FILES: ("TEXT", lambda files: _json([f["name"] for f in files])),
+    PropTypes.FORMULA: ("", _formula),
+    PropTypes.LAST_EDITED_BY: ("TEXT", lambda user: user["id"]),
+    PropTypes.LAST_EDITED_TIME: ("TEXT", str),
+    PropTypes.MULTI_SELECT: ("TEXT", lambda opts: _json([o["name"] for o in opts])),
+    PropTypes.NUMBER: ("REAL", float),
+    PropTypes.PEOPLE: ("TEXT", lambda people: _json([p["id"] for p in people])),
+    PropTypes.PHONE_NUMBER: ("TEXT", str),
+    PropTypes.RELATION: ("TEXT", lambda rels: _json([r["id"] for r in rels])),
+    PropTypes.RICH_TEXT: ("TEXT", plain_text),
+    PropTypes.ROLLUP: ("TEXT", _json),
+    PropTypes.SELECT: ("TEXT", _name),
+    PropTypes.STATUS: ("TEXT", _name),
+    PropTypes.URL: ("TEXT", str),
+}
+
+# The property types whose columns are indexed.
+_INDEXED = {PropTypes.SELECT, PropTypes.STATUS, PropTypes.DATE, PropTypes.NUMBER}
+
+# The columns present in every table. These are prefixed with an
+# underscore to avoid clashing with the property names.
+_BASE_COLUMNS = (
+    '"_id" TEXT PRIMARY KEY',
+    '"_title" TEXT',
+    '"_created_time" TEXT',
+    '"_last_edited_time" TEXT',
+    '"_archived" INTEGER',
+    '"_raw" TEXT NOT NULL',
+)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SQLiteStore:
+    """A local SQLite mirror of Notion databases.
+
+    Every mirrored database gets its own table with one typed column per
+    supported property, named after the property. Columns of select,
+    status, date and number properties are indexed. The columns follow
+    the properties by their ids, so the column of a property that's
+    renamed in Notion is renamed too. The raw page is stored as well,
+    so `Page` objects can be rebuilt from the rows.
+
+    The store can also be used as a context manager which closes the
+    connection on exit.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Args:
+            path: The path to the SQLite file. By default, an in-memory
+                database is used.
+        """
+
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS "_nopy_databases" (
+                "id" TEXT PRIMARY KEY,
+                "table_name" TEXT NOT NULL,
+                "title" TEXT,
+                "synced_at" TEXT
+            );
+            CREATE TABLE IF NOT EXISTS "_nopy_columns" (
+                "db_id" TEXT NOT NULL,
+                "prop_id" TEXT NOT NULL,
+                "prop_name" TEXT NOT NULL,
+                "prop_type" TEXT NOT NULL,
+                PRIMARY KEY ("db_id", "prop_id")
+            );
+            """
+        )
+
+    # ----- Writing -----
+
+    def mirror(self, db: Database, page_size: int = 100, prefetch: int = 1) -> int:
+        """Replaces the mirror of the database with all of its current pages.
+
+        Args:
+            db: The database to mirror.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead while the
+                current batch is being written.
+
+        Returns:
+            The number of pages mirrored.
+        """
+
+        raw_pages = self._raw_pages(db, page_size=page_size, prefetch=prefetch)
+        with self._conn:
+            self._ensure_table(db)
+            self._conn.execute(f"DELETE FROM {_quote(self._table_name(db.id))}")
+            count = self._write(db, raw_pages)
+            self._mark_synced(db)
+        return count
+
+    def sync(
+        self,
+        db: Database,
+        state: SyncState,
+        page_size: int = 100,
+        reconcile: bool = True,
+    ) -> int:
+        """Updates the mirror with the pages edited since the last sync and
+        removes the pages that were deleted or archived.
+
+        The changed pages are fetched before they're written in a single
+        transaction, so other connections aren't locked out while waiting
+        for Notion. The `state` is only updated once the changes are
+        committed, so a sync that fails midway leaves both the mirror and
+        the `state` as they were.
+
+        Args:
+            db: The database to sync.
+            state: The state of the incremental sync which is updated in place.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            reconcile:
+                Whether to list the ids of all the pages in the database to
+                find the deleted or archived pages. This costs a full scan
+                of the database, so it can be skipped on most syncs.
+
+        Returns:
+            The number of pages that were written.
+        """
+
+        # The sync advances a copy of the state which replaces the given
+        # state only if the transaction is committed.
+        new_state = SyncState(state.watermark, set(state.known_ids))
+        # The changes are fetched before the transaction is started, so
+        # the database isn't locked while waiting for Notion.
+        raw_pages = list(self._raw_pages(db, state=new_state, page_size=page_size))
+        deleted: Iterable[str] = ()
+        if reconcile:
+            deleted = db.reconcile_deletions(new_state, page_size=page_size)  # type: ignore
+
+        with self._conn:
+            self._ensure_table(db)
+            count = self._write(db, raw_pages)
+            self._delete(db.id, deleted)
+            self._mark_synced(db)
+
+        state.watermark = new_state.watermark
+        state.known_ids = new_state.known_ids
+        return count
+
+    def upsert_pages(self, db: Database, raw_pages: Iterable[dict[str, Any]]) -> int:
+        """Inserts or replaces the given pages in the mirror of the database.
+
+        Args:
+            db: The database the pages belong to.
+            raw_pages: The pages as the raw dictionaries returned by Notion.
+
+        Returns:
+            The number of pages written.
+        """
+
+        with self._conn:
+            self._ensure_table(db)
+            return self._write(db, raw_pages)
+
+    def delete_pages(self, db_id: str, page_ids: Iterable[str]):
+        """Deletes the pages with the given ids from the mirror."""
+
+        with self._conn:
+            self._delete(db_id, page_ids)
+
+    # ----- Reading -----
+
+    def synced_at(self, db_id: str) -> Optional[datetime]:
+        """Gets the time the database was last written to the mirror, if ever."""
+
+        row = self._conn.execute(
+            'SELECT "synced_at" FROM "_nopy_databases" WHERE "id" = ?', (db_id,)
+        ).fetchone()
+        if not row or not row[0]:
+            return None
+        return parse_datetime(row[0])
+
+    def columns(self, db_id: str) -> dict[str, PropTypes]:
+        """Gets the names of the property columns mapped to the property type."""
+
+        rows = self._conn.execute(
+            'SELECT "prop_name", "prop_type" FROM "_nopy_columns" WHERE "db_id" = ?',
+            (db_id,),
+        )
+        return {name: PropTypes(prop_type) for name, prop_type in rows}
+
+    def pages(
+        self, db_id: str, where: str = "", params: Sequence[Any] = ()
+    ) -> Generator[Page, None, None]:
+        """Rebuilds the pages of a mirrored database.
+
+        The rows are read and converted to `Page` instances one at a time.
+        The properties of the pages are only parsed when they're first
+        looked up.
+
+        Args:
+            db_id: The id of the database.
+            where:
+                An optional SQL condition on the columns of the table
+                such as `"Priority" > ?`.
+            params: The parameters for the placeholders in `where`.
+
+        Returns:
+            A generator that yields a single page at a time.
+        """
+
+        sql = f'SELECT "_raw" FROM {_quote(self._table_name(db_id))}'
+        if where:
+            sql += f" WHERE {where}"
+
+        for (raw,) in self._conn.execute(sql, params):
+            yield Page.from_dict(json.loads(raw), lazy=True)
+
+    def get_page(self, db_id: str, page_id: str) -> Optional[Page]:
+        """Rebuilds a single page from the mirror, if it exists."""
+
+        table = _quote(self._table_name(db_id))
+        row = self._conn.execute(
+            f'SELECT "_raw" FROM {table} WHERE "_id" = ?', (page_id,)
+        ).fetchone()
+        return None if row is None else Page.from_dict(json.loads(row[0]), lazy=True)
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Executes raw SQL on the mirror, such as analytical queries."""
+
+        return self._conn.execute(sql, params)
+
+    def table_name(self, db_id: str) -> str:
+        """Gets the name of the table holding the mirror of the database."""
+
+        return self._table_name(db_id)
+
+    def close(self):
+        """Closes the connection to the SQLite database."""
+
+        self._conn.close()
+
+    # ----- Private Methods -----
+
+    def _table_name(self, db_id: str) -> str:
+        return "db_" + db_id.replace("-", "")
+
+    def _raw_pages(
+        self, db: Database, state: Optional[SyncState] = None, **kwargs: Any
+    ) -> Iterable[dict[str, Any]]:
+
+        if not db._client:  # type: ignore
+            raise NoClientFoundError("database")
+        if db._client.is_async:  # type: ignore
+            raise UnsupportedByLibraryError("mirroring databases via the async client")
+        if state is not None:
+            return db.sync_changes(state, raw=True, **kwargs)  # type: ignore
+        return db.get_raw_pages(**kwargs)  # type: ignore
+
+    def _delete(self, db_id: str, page_ids: Iterable[str]):
+
+        self._conn.executemany(
+            f'DELETE FROM {_quote(self._table_name(db_id))} WHERE "_id" = ?',
+            ((page_id,) for page_id in page_ids),
+        )
+
+    def _ensure_table(self, db: Database):
+
+        table = _quote(self._table_name(db.id))
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(_BASE_COLUMNS)})"
+        )
+        existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+        # The names of the columns when the properties were last mirrored.
+        known: dict[str, str] = dict(
+            self._conn.execute(
+                'SELECT "prop_id", "prop_name" FROM "_nopy_columns" WHERE "db_id" = ?',
+                (db.id,),
+            )
+        )
+
+        for prop in db.properties:
+            if prop.type not in _COLUMNS:
+                continue
+
+            column = _quote(prop.name)
+            old_name = known.get(prop.id, prop.name)
+            if old_name in existing and prop.name not in existing:
+                # The property was renamed in Notion, so its column is
+                # renamed as well instead of starting a new one.
+                self._conn.execute(
+                    f"ALTER TABLE {table} RENAME COLUMN {_quote(old_name)} TO {column}"
+                )
+                existing.discard(old_name)
+                existing.add(prop.name)
+            if prop.name not in existing:
+                sql_type = _COLUMNS[prop.type][0]
+                self._conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}"
+                )
+            if prop.type in _INDEXED:
+                index = _quote(f"idx_{self._table_name(db.id)}_{prop.id}")
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({column})"
+                )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO "_nopy_columns" VALUES (?, ?, ?, ?)',
+                (db.id, prop.id, prop.name, prop.type.value),
+            )
+
+    def _write(self, db: Database, raw_pages: Iterable[dict[str, Any]]) -> int:
+
+        props = [prop for prop in db.properties if prop.type in _COLUMNS]
+        columns = ["_id", "_title", "_created_time", "_last_edited_time"]
+        columns += ["_archived", "_raw"] + [prop.name for prop in props]
+        placeholders = ", ".join("?" for _ in columns)
+        sql = (
+            f"INSERT OR REPLACE INTO {_quote(self._table_name(db.id))} "
+            f"({', '.join(_quote(c) for c in columns)}) VALUES ({placeholders})"
+        )
+
+        count = 0
+        rows: list[tuple[Any, ...]] = []
+        for raw in raw_pages:
+            rows.append(self._row(raw, props))
+            count += 1
+            if len(rows) >= 100:
+                self._conn.executemany(sql, rows)
+                rows.clear()
+        if rows:
+            self._conn.executemany(sql, rows)
+        return count
+
+    def _row(self, raw: dict[str, Any], props: list[Any]) -> tuple[Any, ...]:
+
+        # The properties of pages are keyed by the property name.
+        raw_props: dict[str, Any] = {
+            prop["id"]: prop for prop in raw["properties"].values()
+        }
+        title = next(
+            (p["title"] for p in raw_props.values() if p["type"] == "title"), []
+        )
+
+        row: list[Any] = [
+            raw["id"],
+            plain_text(title),
+            raw.get("created_time", None),
+            raw.get("last_edited_time", None),
+            int(raw.get("archived", False)),
+            _json(raw),
+        ]
+        for prop in props:
+            raw_prop = raw_props.get(prop.id, None)
+            value = None if raw_prop is None else raw_prop[prop.type.value]
+            row.append(None if value is None else _COLUMNS[prop.type][1](value))
+        return tuple(row)
+
+    def _mark_synced(self, db: Database):
+
+        self._conn.execute(
+            'INSERT OR REPLACE INTO "_nopy_databases" VALUES (?, ?, ?, ?)',
+            (
+                db.id,
+                self._table_name(db.id),
+                db.title,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+
+    # ----- Context Managers -----
+
+    def __enter__(self):
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_value: BaseException,
+        traceback: TracebackType,
+    ):
+        self.close()
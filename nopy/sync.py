@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import Any
+from typing import Optional
+from typing import Set
+from typing import Type
+
+from nopy.dates import parse_datetime
+
+
+@dataclass
+class SyncState:
+    """The state of an incremental sync of a database.
+
+    The state can be persisted between syncs by storing the serialized
+    dictionary and recreating the state via `SyncState.from_dict`.
+
+    Attributes:
+        watermark:
+            The last edited time of the most recently edited page that was
+            synced. If `None`, then the next sync fetches every page.
+        known_ids:
+            The ids of all the pages that have been synced. These are used
+            to find the pages that were deleted or archived.
+    """
+
+    watermark: Optional[datetime] = None
+    known_ids: Set[str] = field(default_factory=set)
+
+    def serialize(self) -> dict[str, Any]:
+
+        return {
+            "watermark": None if self.watermark is None else self.watermark.isoformat(),
+            "known_ids": sorted(self.known_ids),
+        }
+
+    @classmethod
+    def from_dict(cls: Type[SyncState], args: dict[str, Any]) -> SyncState:
+
+        watermark = args.get("watermark", None)
+        return SyncState(
+            watermark=parse_datetime(watermark) if watermark else None,
+            known_ids=set(args.get("known_ids", [])),
+        )
@@ -1,5 +1,7 @@
 """All the composite types used within the package."""
 
+from typing import Awaitable
+from typing import TypeVar
 from typing import Union
 
 import nopy.props.db_props as dbp
@@ -55,3 +57,8 @@ PageProps = Union[
 # This is going to include page properties when they're implemented as well.
 Props = Union[DBProps, PageProps, ObjectProperty]
 """All the properties."""
+
+T = TypeVar("T")
+
+SyncAsync = Union[T, Awaitable[T]]
+"""The result of a call which is an awaitable when made via the async client."""
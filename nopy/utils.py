@@ -1,14 +1,21 @@
+import asyncio
 import logging
+import queue
+import threading
 from logging import getLogger
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterator
+from typing import Awaitable
 from typing import Callable
 from typing import Generator
+from typing import Iterator
 from typing import Optional
 from typing import TypeVar
 from typing import Union
 
-from dateutil.parser import parse
+from nopy.dates import parse_datetime
 
 # from nopy.constants import DB_PROPS_REVERSE_MAP
 from nopy.objects.user import User
@@ -19,11 +26,12 @@ from nopy.props.common import RichText
 from nopy.props.common import Text
 
 if TYPE_CHECKING:
-    from nopy.client import NotionClient
+    from nopy.client import BaseClient
 
 
 # ----- TYPES ------
 API_CALL = Callable[..., dict[str, Any]]
+ASYNC_API_CALL = Callable[..., Awaitable[dict[str, Any]]]
 T = TypeVar("T")
 
 
@@ -44,7 +52,8 @@ def paginate(
     map_func: Callable[..., T],
     max_pages: int = 0,
     map_args: Optional[dict[str, Any]] = None,
-    client: Optional["NotionClient"] = None,
+    client: Optional["BaseClient"] = None,
+    prefetch: int = 0,
     **kwargs: Any,
 ) -> Generator[T, None, None]:
     """Handles calls that require pagination to get the full results.
@@ -54,31 +63,275 @@ def paginate(
 
     All `map_args` are passed to the `map_func` when calling it along with the
     result. The result is the first argument that's passed in.
+
+    If a `start_cursor` keyword argument is given, then the pagination
+    starts from that cursor instead of the first result.
+
+    If `prefetch` is greater than 0, then the following batches of results
+    are fetched on a background thread while the current batch is being
+    consumed. At most `prefetch` batches are buffered at any time.
     """
 
     pages = 0
-    next_cursor = None
     map_args = map_args or {}
 
-    while True:
+    if prefetch > 0:
+        batches = _prefetch_batches(api_call, prefetch, kwargs)
+    else:
+        batches = _fetch_batches(api_call, kwargs)
+
+    try:
+        for results in batches:
+            for res in results["results"]:
+                notion_obj = map_func(res, **map_args)
+                if hasattr(notion_obj, "set_client"):
+                    notion_obj.set_client(client)  # type: ignore
+                yield notion_obj
+                pages += 1
+                # Early exit if specified.
+                if max_pages and pages >= max_pages:
+                    return
+    finally:
+        batches.close()
+
+
+async def apaginate(
+    api_call: ASYNC_API_CALL,
+    map_func: Callable[..., T],
+    max_pages: int = 0,
+    map_args: Optional[dict[str, Any]] = None,
+    client: Optional["BaseClient"] = None,
+    prefetch: int = 0,
+    **kwargs: Any,
+) -> AsyncGenerator[T, None]:
+    """The async counterpart of `paginate` for coroutine based API calls.
+
+    The arguments are handled the same way as in `paginate` except that
+    prefetching is done on a background task instead of a thread.
+    """
+
+    pages = 0
+    map_args = map_args or {}
+
+    if prefetch > 0:
+        batches = _aprefetch_batches(api_call, prefetch, kwargs)
+    else:
+        batches = _afetch_batches(api_call, kwargs)
 
+    try:
+        async for results in batches:
+            for res in results["results"]:
+                notion_obj = map_func(res, **map_args)
+                if hasattr(notion_obj, "set_client"):
+                    notion_obj.set_client(client)  # type: ignore
+                yield notion_obj
+                pages += 1
+                # Early exit if specified.
+                if max_pages and pages >= max_pages:
+                    return
+    finally:
+        await batches.aclose()
+
+
+async def resolved(value: T) -> T:
+    """Wraps the value in an awaitable, for methods that return an
+    awaitable when bound to an async client but have nothing to await."""
+
+    return value
+
+
+# ----- Pagination Helpers -----
+
+# Marks the end of the batches put in the prefetch buffer.
+_DONE = object()
+
+
+def _fetch_batches(
+    api_call: API_CALL, kwargs: dict[str, Any]
+) -> Generator[dict[str, Any], None, None]:
+
+    # The pagination starts from the given cursor, if any.
+    kwargs = dict(kwargs)
+    next_cursor = kwargs.pop("start_cursor", None)
+    while True:
         results = api_call(**kwargs, start_cursor=next_cursor)
+        yield results
+        if not results["has_more"]:
+            return
+        next_cursor = results["next_cursor"]
 
-        for res in results["results"]:
-            notion_obj = map_func(res, **map_args)
-            if hasattr(notion_obj, "set_client"):
-                notion_obj.set_client(client)  # type: ignore
-            yield notion_obj
-            pages += 1
-            # Early exit if specified.
-            if max_pages and pages > max_pages:
+
+def _prefetch_batches(
+    api_call: API_CALL, prefetch: int, kwargs: dict[str, Any]
+) -> Generator[dict[str, Any], None, None]:
+
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Waiting in short intervals so that the worker notices when
+        # the consumer stops iterating while the buffer is full.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        try:
+            for results in _fetch_batches(api_call, kwargs):
+                if not put(results):
+                    return
+        except Exception as error:
+            put(error)
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=worker, name="nopy-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
                 return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+async def _afetch_batches(
+    api_call: ASYNC_API_CALL, kwargs: dict[str, Any]
+) -> AsyncGenerator[dict[str, Any], None]:
 
+    # The pagination starts from the given cursor, if any.
+    kwargs = dict(kwargs)
+    next_cursor = kwargs.pop("start_cursor", None)
+    while True:
+        results = await api_call(**kwargs, start_cursor=next_cursor)
+        yield results
         if not results["has_more"]:
             return
         next_cursor = results["next_cursor"]
 
 
+async def _aprefetch_batches(
+    api_call: ASYNC_API_CALL, prefetch: int, kwargs: dict[str, Any]
+) -> AsyncGenerator[dict[str, Any], None]:
+
+    buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=prefetch)
+
+    async def worker():
+        try:
+            async for results in _afetch_batches(api_call, kwargs):
+                await buffer.put(results)
+        except Exception as error:
+            await buffer.put(error)
+            return
+        await buffer.put(_DONE)
+
+    task = asyncio.ensure_future(worker())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+
+
+def interleave(
+    iterators: list[Iterator[T]], buffer_size: int = 100
+) -> Generator[T, None, None]:
+    """Consumes each of the iterators on its own thread and yields the items
+    in the order in which they arrive.
+
+    At most `buffer_size` items are buffered before the threads wait for
+    the consumer to catch up.
+    """
+
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker(iterator: Iterator[T]):
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except Exception as error:
+            put(error)
+            return
+        put(_DONE)
+
+    threads = [
+        threading.Thread(target=worker, args=(it,), name="nopy-worker", daemon=True)
+        for it in iterators
+    ]
+    for thread in threads:
+        thread.start()
+
+    remaining = len(threads)
+    try:
+        while remaining:
+            item = buffer.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+async def ainterleave(
+    iterators: list[AsyncIterator[T]], buffer_size: int = 100
+) -> AsyncGenerator[T, None]:
+    """The async counterpart of `interleave` which consumes each of the
+    async iterators on its own task."""
+
+    buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=buffer_size)
+
+    async def worker(iterator: AsyncIterator[T]):
+        try:
+            async for item in iterator:
+                await buffer.put(item)
+        except Exception as error:
+            await buffer.put(error)
+            return
+        await buffer.put(_DONE)
+
+    tasks = [asyncio.ensure_future(worker(it)) for it in iterators]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await buffer.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 # ----- Mapping Utilities -----
 
 
@@ -103,7 +356,7 @@ def base_obj_args(args: dict[str, Any]) -> dict[str, Any]:
     # Getting time
     for key in ("created_time", "last_edited_time"):
         if value := args.get(key, None):
-            new_args[key] = parse(value)
+            new_args[key] = parse_datetime(value)
 
     return new_args
 
@@ -114,6 +367,17 @@ def rich_text_list(rich_texts: list[dict[str, Any]]) -> list[RichText]:
     return [RichText.from_dict(rt) for rt in rich_texts]
 
 
+def plain_text(rich_texts: list[dict[str, Any]]) -> str:
+    """Joins the plain text of the list of dictionaries without parsing
+    them, giving the same text as the `TextDescriptor` of the parsed list.
+
+    Like in `RichText`, the spaces Notion adds around each plain text are
+    stripped before the texts are joined.
+    """
+
+    return " ".join(rt["plain_text"].strip() for rt in rich_texts)
+
+
 def get_icon(icon: Optional[dict[str, Any]]) -> Optional[Union[File, Emoji]]:
 
     if not icon:
@@ -2,10 +2,14 @@ import json
 import socket
 from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import Optional
 
+import httpx
 import pytest
 from dotenv import load_dotenv  # type: ignore
 
+from nopy.client import ClientConfig
 from nopy.client import NotionClient
 
 ENV_PATH = Path(__file__).parent / "../.env"
@@ -15,7 +19,14 @@ DATA_DIR = Path(__file__).parent / "data"
 
 
 # Disabling network access
-def block_network(*args: Any):
+_socket = socket.socket
+
+
+def block_network(family: int = -1, *args: Any, **kwargs: Any):
+
+    # The asyncio event loop needs a local socket pair to run.
+    if family == socket.AF_UNIX:
+        return _socket(family, *args, **kwargs)
     raise Exception("no network access allowed")
 
 
@@ -31,6 +42,30 @@ def client():
     client.close()
 
 
+@pytest.fixture
+def mock_client():
+    """Returns a factory for clients whose requests are handled by `handler`."""
+
+    clients: list[NotionClient] = []
+
+    def factory(
+        handler: Callable[[httpx.Request], httpx.Response],
+        config: Optional[ClientConfig] = None,
+    ) -> NotionClient:
+
+        client = NotionClient("token", config)
+        client._client = httpx.Client(  # type: ignore
+            transport=httpx.MockTransport(handler),
+            base_url=client._config.base_url,  # type: ignore
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
 @pytest.fixture
 def full_db():
 
@@ -0,0 +1,97 @@
+import asyncio
+import copy
+import json
+from typing import Any
+
+import httpx
+
+from nopy.async_client import AsyncNotionClient
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+
+
+def make_client(handler: Any) -> AsyncNotionClient:
+
+    client = AsyncNotionClient("token")
+    client._client = httpx.AsyncClient(  # type: ignore
+        transport=httpx.MockTransport(handler),
+        base_url=client._config.base_url,  # type: ignore
+    )
+    return client
+
+
+def test_retrieve_db(full_db: dict[str, Any]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/databases/db-id"
+        return httpx.Response(200, json=full_db)
+
+    async def run():
+        client = make_client(handler)
+        db = await client.retrieve_db("db-id")
+        await client.aclose()
+        return db, client
+
+    db, client = asyncio.run(run())
+
+    assert isinstance(db, Database)
+    assert db._client is client  # type: ignore
+
+
+def test_query_db_paginates(normal_page: dict[str, Any]):
+
+    cursors: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        cursors.append(body.get("start_cursor"))
+        has_more = len(cursors) == 1
+        return httpx.Response(
+            200,
+            json={
+                "results": [copy.deepcopy(normal_page)],
+                "has_more": has_more,
+                "next_cursor": "next" if has_more else None,
+            },
+        )
+
+    async def run():
+        client = make_client(handler)
+        pages = [page async for page in client.query_db("db-id")]
+        await client.aclose()
+        return pages
+
+    pages = asyncio.run(run())
+
+    assert cursors == [None, "next"]
+    assert len(pages) == 2
+    assert all(isinstance(page, Page) for page in pages)
+
+
+def test_bound_objects_are_awaitable(
+    full_db: dict[str, Any], normal_page: dict[str, Any]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/query"):
+            return httpx.Response(
+                200,
+                json={
+                    "results": [copy.deepcopy(normal_page)],
+                    "has_more": False,
+                    "next_cursor": None,
+                },
+            )
+        return httpx.Response(200, json=copy.deepcopy(normal_page))
+
+    async def run():
+        client = make_client(handler)
+        db = Database.from_dict(full_db)
+        db.set_client(client)
+        pages = [page async for page in db.query({})]
+        updated = await pages[0].update(in_place=True)
+        await client.aclose()
+        return pages[0], updated
+
+    page, updated = asyncio.run(run())
+
+    assert updated is page
+    assert page.title == "Trial Root Page"
@@ -0,0 +1,222 @@
+import asyncio
+import copy
+import json
+import threading
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.objects.block import Block
+from nopy.objects.page import Page
+from tests.test_async_client import make_client
+
+# The children of every block, keyed by the id of the parent.
+TREE = {
+    "page": ["a", "b", "c"],
+    "a": ["a1", "a2"],
+    "a1": ["a11"],
+    "c": ["c1", "c2", "c3"],
+}
+DOCUMENT_ORDER = ["a", "a1", "a11", "a2", "b", "c", "c1", "c2", "c3"]
+
+
+def make_block(block_id: str) -> dict[str, Any]:
+
+    return {
+        "object": "block",
+        "id": block_id,
+        "type": "paragraph",
+        "archived": False,
+        "has_children": block_id in TREE,
+        "paragraph": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {"content": block_id, "link": None},
+                    "plain_text": block_id,
+                    "href": None,
+                    "annotations": {
+                        "bold": False,
+                        "italic": False,
+                        "strikethrough": False,
+                        "underline": False,
+                        "code": False,
+                        "color": "default",
+                    },
+                }
+            ],
+            "color": "default",
+        },
+    }
+
+
+def make_handler(paths: list[str], delay: float = 0):
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        block_id = request.url.path.split("/")[-2]
+        children = TREE[block_id]
+        start = int(request.url.params.get("start_cursor", 0))
+        end = start + int(request.url.params["page_size"])
+        time.sleep(delay)
+        return httpx.Response(
+            200,
+            json={
+                "results": [make_block(child) for child in children[start:end]],
+                "has_more": end < len(children),
+                "next_cursor": str(end),
+            },
+        )
+
+    return handler
+
+
+def test_block_from_dict():
+
+    block = Block.from_dict(make_block("a"), depth=2)
+
+    assert block.block_type == "paragraph"
+    assert block.plain_text == "a"
+    assert block.has_children
+    assert block.depth == 2
+    serialized = block.serialize()
+    assert serialized["type"] == "paragraph"
+    assert serialized["paragraph"]["rich_text"][0]["text"]["content"] == "a"
+
+
+def test_get_blocks(mock_client: Any, normal_page: dict[str, Any]):
+
+    paths: list[str] = []
+    page = Page.from_dict(copy.deepcopy(normal_page))
+    page.id = "page"
+    page.set_client(mock_client(make_handler(paths)))
+
+    blocks = list(page.get_blocks(page_size=2))
+    assert [block.id for block in blocks] == DOCUMENT_ORDER
+    assert [block.depth for block in blocks] == [0, 1, 2, 1, 0, 0, 1, 1, 1]
+    # The children of 'c' are paginated.
+    assert paths.count("/v1/blocks/c/children") == 2
+
+    top_level = list(page.get_blocks(recursive=False))
+    assert [block.id for block in top_level] == ["a", "b", "c"]
+
+
+def test_siblings_fetched_concurrently(mock_client: Any):
+
+    lock = threading.Lock()
+    running, peak = 0, 0
+    handler = make_handler([], delay=0.02)
+
+    def counting_handler(request: httpx.Request) -> httpx.Response:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        try:
+            return handler(request)
+        finally:
+            with lock:
+                running -= 1
+
+    client = mock_client(counting_handler)
+    blocks = client.retrieve_block_children("page", recursive=True, workers=2)
+
+    assert [block.id for block in blocks] == DOCUMENT_ORDER
+    assert peak == 2
+
+
+def test_async_get_blocks():
+
+    paths: list[str] = []
+
+    async def run():
+        client = make_client(make_handler(paths))
+        children = client.retrieve_block_children("page", recursive=True, workers=3)
+        blocks = [block async for block in children]
+        await client.aclose()
+        return blocks
+
+    blocks = asyncio.run(run())
+
+    assert [block.id for block in blocks] == DOCUMENT_ORDER
+    assert len(paths) == len(TREE)
+
+
+def test_invalid_workers(mock_client: Any):
+
+    client = mock_client(make_handler([]))
+    with pytest.raises(ValueError):
+        list(client.retrieve_block_children("page", recursive=True, workers=0))
+
+
+def paragraph(text: str, children: Any = None) -> dict[str, Any]:
+
+    block: dict[str, Any] = {
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+    if children:
+        block["paragraph"]["children"] = children
+    return block
+
+
+def make_append_handler(appended: list[tuple[str, list[str]]]):
+
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "PATCH"
+        parent_id = request.url.path.split("/")[-2]
+        children = json.loads(request.content)["children"]
+        texts = [
+            child["paragraph"]["rich_text"][0]["text"]["content"] for child in children
+        ]
+        assert all("children" not in child["paragraph"] for child in children)
+        with lock:
+            appended.append((parent_id, texts))
+        # The created blocks are given their text as the id.
+        results = [{**make_block(text), "has_children": False} for text in texts]
+        return httpx.Response(200, json={"results": results, "has_more": False})
+
+    return handler
+
+
+def test_append_blocks(mock_client: Any, normal_page: dict[str, Any]):
+
+    appended: list[tuple[str, list[str]]] = []
+    page = Page.from_dict(copy.deepcopy(normal_page))
+    page.id = "page"
+    page.set_client(mock_client(make_append_handler(appended)))
+
+    nested = paragraph("n", [paragraph("n1", [paragraph("n11")]), paragraph("n2")])
+    blocks = [paragraph(str(i)) for i in range(250)]
+    blocks[1] = nested
+    created = page.append_blocks(iter(blocks), workers=4)
+
+    assert [block.id for block in created] == ["0", "n", *map(str, range(2, 250))]
+    top_level = [texts for parent, texts in appended if parent == "page"]
+    assert [len(texts) for texts in top_level] == [100, 100, 50]
+    assert sum(top_level, []) == [block.id for block in created]
+    # The nested blocks are appended to the created blocks, level by level.
+    nested_appends = [item for item in appended if item[0] != "page"]
+    assert nested_appends == [("n", ["n1", "n2"]), ("n1", ["n11"])]
+
+
+def test_async_append_blocks():
+
+    appended: list[tuple[str, list[str]]] = []
+
+    async def run():
+        client = make_client(make_append_handler(appended))
+        created = await client.append_block_children(
+            "page",
+            [paragraph("a", [paragraph("a1")]), Block.from_dict(make_block("b"))],
+        )
+        await client.aclose()
+        return created
+
+    created = asyncio.run(run())
+
+    assert [block.id for block in created] == ["a", "b"]
+    assert appended == [("page", ["a", "b"]), ("a", ["a1"])]
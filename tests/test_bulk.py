@@ -0,0 +1,184 @@
+import asyncio
+import copy
+import json
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.bulk import arun_bulk
+from nopy.bulk import run_bulk
+from nopy.errors import APIResponseError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from tests.test_async_client import make_client
+
+
+def test_run_bulk_is_bounded_and_ordered():
+
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def func(item: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.005 * (item % 3))
+        with lock:
+            running -= 1
+        if item == 5:
+            raise ValueError("bad item")
+        return item * 2
+
+    report = run_bulk(iter(range(20)), func, workers=4)
+
+    assert peak <= 4
+    assert [result.index for result in report] == list(range(20))
+    assert [result.result for result in report.succeeded][:3] == [0, 2, 4]
+    assert [result.item for result in report.failed] == [5]
+    assert len(report.latencies) == 20
+    with pytest.raises(ValueError):
+        report.raise_for_errors()
+
+
+def test_arun_bulk():
+
+    running, peak = 0, 0
+
+    async def func(item: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return item
+
+    report = asyncio.run(arun_bulk(range(10), func, workers=3))
+
+    assert peak == 3
+    assert [result.result for result in report] == list(range(10))
+
+
+def test_bulk_create(
+    mock_client: Any, full_db: dict[str, Any], normal_page: dict[str, Any]
+):
+
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        if body["properties"].get("fail", None):
+            return httpx.Response(400, json={"code": "validation_error", "message": ""})
+        return httpx.Response(200, json=normal_page)
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler))
+    pages = [{"properties": {}}, {"properties": {"fail": True}}, {"properties": {}}]
+    report = db.bulk_create(pages, workers=2)
+
+    assert len(report) == 3
+    assert [result.ok for result in report] == [True, False, True]  # type: ignore
+    assert isinstance(report.failed[0].error, APIResponseError)  # type: ignore
+    assert all(body["parent"]["database_id"] == db.id for body in bodies)
+
+
+def test_bulk_update_and_archive(mock_client: Any, normal_page: dict[str, Any]):
+
+    requests: list[tuple[str, dict[str, Any]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json=normal_page)
+
+    client = mock_client(handler)
+    pages = [Page.from_dict(copy.deepcopy(normal_page)) for _ in range(3)]
+    pages[1].archived = True
+
+    report = client.bulk_update(pages)
+    # Only the changed page is sent.
+    assert requests == [(f"/v1/pages/{normal_page['id']}", {"archived": True})]
+    assert report.results[0].result is pages[0]
+
+    requests.clear()
+    client.bulk_archive([pages[0], "other-id"])
+    assert {path for path, _ in requests} == {
+        f"/v1/pages/{normal_page['id']}",
+        "/v1/pages/other-id",
+    }
+
+
+def test_async_bulk_archive(normal_page: dict[str, Any]):
+
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json=normal_page)
+
+    async def run():
+        client = make_client(handler)
+        report = await client.bulk_archive(["a", "b", "c"], workers=2)
+        await client.aclose()
+        return report
+
+    report = asyncio.run(run())
+
+    assert sorted(paths) == ["/v1/pages/a", "/v1/pages/b", "/v1/pages/c"]
+    assert all(isinstance(result.result, Page) for result in report)
+
+
+def flaky_handler(page: dict[str, Any], status: int, failures: int):
+
+    # Every request path fails `failures` times before succeeding.
+    attempts: Counter[str] = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts[request.url.path] += 1
+        if attempts[request.url.path] <= failures:
+            error = {"code": "service_unavailable", "message": ""}
+            return httpx.Response(status, json=error, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=page)
+
+    return handler
+
+
+def test_bulk_retries_by_default(mock_client: Any, normal_page: dict[str, Any]):
+
+    client = mock_client(flaky_handler(normal_page, 503, failures=1))
+
+    report = client.bulk_archive(["a", "b"])
+    assert all(result.ok for result in report)
+    # Requests outside of bulk operations follow the client's configuration.
+    with pytest.raises(APIResponseError):
+        client.update_page("c", {"archived": True})
+
+
+def test_bulk_create_retries_only_rate_limits(
+    mock_client: Any, full_db: dict[str, Any], normal_page: dict[str, Any]
+):
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(flaky_handler(normal_page, 503, failures=1)))
+    report = db.bulk_create([{"properties": {}}])
+    assert isinstance(report.results[0].error, APIResponseError)
+
+    db.set_client(mock_client(flaky_handler(normal_page, 429, failures=2)))
+    report = db.bulk_create([{"properties": {}}])
+    assert report.results[0].ok
+
+
+def test_async_bulk_retries_by_default(normal_page: dict[str, Any]):
+    async def run():
+        client = make_client(flaky_handler(normal_page, 502, failures=2))
+        report = await client.bulk_archive(["a", "b", "c"], workers=2)
+        await client.aclose()
+        return report
+
+    report = asyncio.run(run())
+
+    assert all(result.ok for result in report)
@@ -0,0 +1,216 @@
+import copy
+import json
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from nopy.cache import QueryCache
+from nopy.cache import ResponseCache
+from nopy.client import ClientConfig
+from nopy.constants import APIEndpoints
+from nopy.objects.database import Database
+from nopy.query import Query
+
+
+def response(n: int) -> dict[str, Any]:
+    return {"results": [{"id": str(i)} for i in range(n)], "has_more": False}
+
+
+def test_key_is_canonical():
+
+    cache = QueryCache()
+    cache.put("db-id", {"filter": {}, "sorts": []}, response(1))
+
+    assert cache.get("dbid", {"sorts": [], "filter": {}}) == response(1)
+    assert cache.get("db-id", {"sorts": []}) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_returns_copies():
+
+    cache = QueryCache()
+    cache.put("db", {}, response(1))
+    cache.get("db", {})["results"].clear()  # type: ignore
+
+    assert cache.get("db", {}) == response(1)
+
+
+def test_ttl():
+
+    cache = QueryCache(ttl=60)
+    cache.put("db", {"a": 1}, response(1), ttl=0.01)
+    cache.put("db", {"a": 2}, response(1))
+    time.sleep(0.02)
+
+    assert cache.get("db", {"a": 1}) is None
+    assert cache.get("db", {"a": 2}) is not None
+    assert len(cache) == 1
+
+
+def test_lru_eviction():
+
+    size = len(json.dumps(response(10), separators=(",", ":")))
+    cache = QueryCache(max_bytes=size * 2)
+    cache.put("db", {"a": 1}, response(10))
+    cache.put("db", {"a": 2}, response(10))
+    # Using the first entry makes the second one the least recently used.
+    cache.get("db", {"a": 1})
+    cache.put("db", {"a": 3}, response(10))
+
+    assert cache.get("db", {"a": 2}) is None
+    assert cache.get("db", {"a": 1}) is not None
+    assert cache.size <= cache.max_bytes
+
+
+def test_invalidate():
+
+    cache = QueryCache()
+    cache.put("db-1", {}, response(1))
+    cache.put("db-2", {}, response(1))
+    version = cache.version("db-1")
+    cache.invalidate("db-1")
+
+    assert cache.get("db-1", {}) is None
+    assert cache.get("db-2", {}) is not None
+
+    # Responses to requests made before the invalidation are discarded.
+    cache.put("db-1", {}, response(1), version=version)
+    assert cache.get("db-1", {}) is None
+
+
+def test_client_uses_cache(
+    mock_client: Any, full_db: dict[str, Any], normal_page: dict[str, Any]
+):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/query"):
+            return httpx.Response(
+                200,
+                json={
+                    "results": [copy.deepcopy(normal_page)],
+                    "has_more": False,
+                    "next_cursor": None,
+                },
+            )
+        page = copy.deepcopy(normal_page)
+        page["parent"] = {"type": "database_id", "database_id": full_db["id"]}
+        return httpx.Response(200, json=page)
+
+    cache = QueryCache()
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler, ClientConfig(query_cache=cache)))
+
+    first = list(db.query(Query()))
+    second = list(db.query(Query()))
+    assert len(requests) == 1
+    assert [page.id for page in first] == [page.id for page in second]
+
+    first[0].title = "Changed"
+    first[0].update()
+    assert len(cache) == 0
+    list(db.query(Query()))
+    assert len(requests) == 3
+
+
+def test_response_cache_ttls():
+
+    cache = ResponseCache(ttls={APIEndpoints.PAGE_RETRIEVE: 0.01})
+    cache.put("/v1/pages/page-id", "", {"id": "page"})
+    cache.put("/v1/databases/db-id", "", {"id": "db"})
+    # Endpoints without a TTL aren't cached.
+    cache.put("/v1/pages/page-id/properties/prop", "", {"id": "prop"})
+    time.sleep(0.02)
+
+    assert cache.get("/v1/pages/page-id") is None
+    assert cache.get("/v1/databases/dbid") == ({"id": "db"}, False)
+    assert cache.get("/v1/pages/page-id/properties/prop") is None
+
+
+def test_response_cache_stale_while_revalidate():
+
+    cache = ResponseCache(
+        ttls={APIEndpoints.PAGE_RETRIEVE: 0.01}, stale_while_revalidate=60
+    )
+    cache.put("/v1/pages/page-id", "", {"id": "page"})
+    time.sleep(0.02)
+
+    # Only the first caller is asked to revalidate the stale response.
+    assert cache.get("/v1/pages/page-id") == ({"id": "page"}, True)
+    assert cache.get("/v1/pages/page-id") == ({"id": "page"}, False)
+
+    cache.put("/v1/pages/page-id", "", {"id": "new"})
+    assert cache.get("/v1/pages/page-id") == ({"id": "new"}, False)
+
+
+def test_response_cache_invalidate():
+
+    cache = ResponseCache(ttls={APIEndpoints.PAGE_PROP: 60})
+    cache.put("/v1/pages/page-id", "", {"id": "page"})
+    cache.put("/v1/pages/page-id/properties/prop", "", {"id": "prop"})
+    cache.put("/v1/pages/other", "", {"id": "other"})
+    version = cache.version
+    cache.invalidate("pages/pageid")
+
+    assert len(cache) == 1
+    cache.put("/v1/pages/page-id", "", {"id": "page"}, version=version)
+    assert cache.get("/v1/pages/page-id") is None
+
+
+def test_client_uses_response_cache(mock_client: Any, full_db: dict[str, Any]):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=full_db)
+
+    config = ClientConfig(response_cache=ResponseCache())
+    client = mock_client(handler, config)
+
+    client.retrieve_db(full_db["id"])
+    db = client.retrieve_db(full_db["id"])
+    assert len(requests) == 1
+    assert db._client is client  # type: ignore
+
+    client.update_db(full_db["id"], {})
+    client.retrieve_db(full_db["id"])
+    assert [r.method for r in requests] == ["GET", "PATCH", "GET"]
+
+
+def test_client_revalidates_stale_responses(
+    mock_client: Any, normal_page: dict[str, Any]
+):
+
+    titles = iter(["first", "second"])
+    revalidated = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = copy.deepcopy(normal_page)
+        page["properties"]["title"]["title"][0]["plain_text"] = next(titles)
+        return httpx.Response(200, json=page)
+
+    cache = ResponseCache(
+        ttls={APIEndpoints.PAGE_RETRIEVE: 0.01}, stale_while_revalidate=60
+    )
+    put = cache.put
+
+    def tracked_put(*args: Any, **kwargs: Any):
+        put(*args, **kwargs)
+        revalidated.set()
+
+    cache.put = tracked_put  # type: ignore
+    client = mock_client(handler, ClientConfig(response_cache=cache))
+
+    assert client.retrieve_page("page-id").title == "first"
+    revalidated.clear()
+    time.sleep(0.02)
+
+    # The stale page is returned while the new one is fetched.
+    assert client.retrieve_page("page-id").title == "first"
+    assert revalidated.wait(1)
+    assert client.retrieve_page("page-id").title == "second"
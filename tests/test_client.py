@@ -1,7 +1,12 @@
 import os
+import sys
+from typing import Any
 
+import httpx
 import pytest
 
+from nopy.async_client import AsyncNotionClient
+from nopy.client import ClientConfig
 from nopy.client import NotionClient
 from nopy.errors import TokenNotFoundError
 
@@ -12,3 +17,59 @@ def test_client_without_token():
     with pytest.raises(TokenNotFoundError):
 
         NotionClient()
+
+
+def record_transport(monkeypatch: pytest.MonkeyPatch, name: str) -> dict[str, Any]:
+
+    # Records the arguments the client passes to the httpx transport.
+    kwargs: dict[str, Any] = {}
+    transport = getattr(httpx, name)
+
+    def make_transport(**given: Any) -> Any:
+        kwargs.update(given)
+        return transport(**given)
+
+    monkeypatch.setattr(httpx, name, make_transport)
+    return kwargs
+
+
+def test_transport_config(monkeypatch: pytest.MonkeyPatch):
+
+    transport = record_transport(monkeypatch, "HTTPTransport")
+    config = ClientConfig(
+        timeout=10,
+        connect_timeout=2,
+        max_connections=4,
+        max_keepalive_connections=2,
+        keepalive_expiry=30,
+    )
+    client = NotionClient("token", config)
+
+    assert client._client.timeout == httpx.Timeout(10, connect=2)
+    assert transport["limits"] == httpx.Limits(
+        max_connections=4, max_keepalive_connections=2, keepalive_expiry=30
+    )
+    assert transport["http2"] is False
+    client.close()
+
+
+def test_async_transport_config(monkeypatch: pytest.MonkeyPatch):
+
+    transport = record_transport(monkeypatch, "AsyncHTTPTransport")
+    client = AsyncNotionClient("token", {"read_timeout": 60, "max_connections": None})
+
+    assert client._client.timeout == httpx.Timeout(5, read=60)
+    assert transport["limits"] == httpx.Limits(
+        max_connections=None, max_keepalive_connections=20, keepalive_expiry=5
+    )
+
+
+def test_http2_without_h2(monkeypatch: pytest.MonkeyPatch):
+
+    # A missing module makes the import fail whether `h2` is installed or not.
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with pytest.raises(ImportError, match=r"httpx\[http2\]"):
+        NotionClient("token", {"http2": True})
+    with pytest.raises(ImportError, match=r"httpx\[http2\]"):
+        AsyncNotionClient("token", {"http2": True})
@@ -0,0 +1,72 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.client import ClientConfig
+from nopy.codec import get_codec
+from nopy.errors import APIResponseError
+from nopy.errors import HTTPError
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+def test_round_trip(name: str, full_page: dict[str, Any]):
+
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+
+    encoded = codec.dumps(full_page)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == full_page
+    assert codec.loads(encoded.decode()) == full_page
+    assert codec.dumps({"a": "ü/"}) == b'{"a":"\xc3\xbc/"}'
+
+
+def test_auto():
+
+    expected = next(name for name in ("orjson", "ujson", "json") if _installed(name))
+    assert get_codec().name == expected
+
+
+def test_unknown_codec():
+
+    with pytest.raises(ValueError):
+        get_codec("simplejson")
+
+
+@pytest.mark.parametrize("name", ["json", "auto"])
+def test_client_uses_codec(mock_client: Any, name: str):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("bad"):
+            return httpx.Response(400, json={"code": "invalid", "message": "bad"})
+        if request.url.path.endswith("html"):
+            return httpx.Response(502, text="<html></html>")
+        return httpx.Response(200, json={"results": [], "has_more": False})
+
+    client = mock_client(handler, ClientConfig(json_codec=name))
+    assert client._make_request("databases/id/query", "post", {"a": 1}) == {
+        "results": [],
+        "has_more": False,
+    }
+    assert json.loads(requests[0].content) == {"a": 1}
+    assert requests[0].headers["Content-Type"] == "application/json"
+
+    with pytest.raises(APIResponseError):
+        client._make_request("bad")
+    with pytest.raises(HTTPError):
+        client._make_request("html")
+
+
+def _installed(module: str) -> bool:
+
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
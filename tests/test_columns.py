@@ -0,0 +1,121 @@
+import copy
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.columns import NAT
+from nopy.columns import CategoricalColumn
+from nopy.columns import Columns
+from nopy.columns import DateColumn
+from nopy.columns import MultiCategoricalColumn
+from nopy.columns import NumberColumn
+from nopy.columns import ObjectColumn
+from nopy.objects.database import Database
+
+
+def test_columns_from_raw_pages(full_page: dict[str, Any]):
+
+    other = copy.deepcopy(full_page)
+    other["id"] = "other-id"
+    other["properties"]["Created number"]["number"] = None
+    other["properties"]["Date"]["date"] = None
+    other["properties"]["Status"]["status"] = None
+    other["properties"]["Multi select"]["multi_select"] = []
+    columns = Columns.from_raw_pages([full_page, other])
+
+    assert len(columns) == 2
+    assert columns.ids == [full_page["id"], "other-id"]
+    assert columns.titles == ["Page title", "Page title"]
+
+    number = columns["Created number"]
+    assert isinstance(number, NumberColumn)
+    assert number.to_list() == [123, None]
+
+    date = columns["Date"]
+    assert isinstance(date, DateColumn)
+    expected = datetime(2022, 12, 29, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+    assert date.to_list() == [expected, None]
+    assert date.values[1] == NAT
+
+    status = columns["Status"]
+    assert isinstance(status, CategoricalColumn)
+    assert list(status.codes) == [0, -1]
+    assert status.categories == ["Not started"]
+
+    multi = columns["Multi select"]
+    assert isinstance(multi, MultiCategoricalColumn)
+    assert list(multi.offsets) == [0, 2, 2]
+    assert multi.to_list() == [multi.categories, []]
+
+    data = columns.to_dict()
+    assert data["Relate me"] == [["page-id"], ["page-id"]]
+    assert data["Created text"] == ["some text", "some text"]
+    assert data["calculate"] == [3, 3]
+    assert data["Checkbox"] == [False, False]
+
+
+def test_missing_properties_are_padded(full_page: dict[str, Any]):
+
+    first = copy.deepcopy(full_page)
+    del first["properties"]["Created number"]
+    second = copy.deepcopy(full_page)
+    del second["properties"]["Multi select"]
+    columns = Columns.from_raw_pages([first, second])
+
+    assert columns["Created number"].to_list() == [None, 123]
+    assert columns["Multi select"].to_list()[1] == []
+    assert all(len(column) == 2 for column in columns.columns.values())
+
+
+def test_unknown_property_types(full_page: dict[str, Any]):
+
+    first = copy.deepcopy(full_page)
+    first["properties"]["ID"] = {
+        "id": "uid",
+        "type": "unique_id",
+        "unique_id": {"prefix": "TASK", "number": 1},
+    }
+    second = copy.deepcopy(full_page)
+    second["id"] = "second-id"
+    del second["properties"]["New DB"]
+    columns = Columns.from_raw_pages([first, second])
+
+    # Unknown property types get a column of the raw values.
+    assert isinstance(columns["ID"], ObjectColumn)
+    assert columns["ID"].to_list() == [{"prefix": "TASK", "number": 1}, None]
+    # Pages without a title are padded like the other columns.
+    assert columns.titles == ["Page title", None]
+
+
+def test_database_to_columns(
+    mock_client: Any, full_db: dict[str, Any], full_page: dict[str, Any]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"results": [full_page], "has_more": False, "next_cursor": None}
+        )
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler))
+    columns = db.to_columns()
+
+    assert columns.ids == [full_page["id"]]
+    # The codes follow the order of the options in the schema.
+    status = columns["Status"]
+    assert isinstance(status, CategoricalColumn)
+    schema = db.properties["Status"]
+    assert status.categories[: len(schema.options)] == [o.name for o in schema.options]  # type: ignore
+
+
+def test_to_numpy(full_page: dict[str, Any]):
+
+    np = pytest.importorskip("numpy")
+    columns = Columns.from_raw_pages([full_page]).to_numpy()
+
+    assert columns["Created number"].dtype == np.float64
+    assert columns["Date"].dtype == np.dtype("datetime64[us]")
+    assert columns["Status"].dtype == np.int32
@@ -0,0 +1,38 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+from dateutil.parser import parse
+
+from nopy.dates import parse_datetime
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2022-12-06T04:52:00.000Z",
+        "2022-12-06T04:52:00Z",
+        "2022-12-06T10:22:00.000+05:30",
+        "2022-12-06T04:52:00.123456+00:00",
+        "2022-12-06",
+    ],
+)
+def test_matches_dateutil(value: str):
+
+    parsed = parse_datetime(value)
+
+    assert parsed == parse(value)
+    assert parsed.utcoffset() == parse(value).utcoffset()
+
+
+def test_utc():
+
+    expected = datetime(2022, 12, 6, 4, 52, tzinfo=timezone.utc)
+    assert parse_datetime("2022-12-06T04:52:00.000Z") == expected
+    assert parse_datetime("2022-12-06T04:52:00.000Z").utcoffset() == timedelta(0)
+
+
+def test_falls_back_to_dateutil():
+
+    assert parse_datetime("December 6, 2022") == datetime(2022, 12, 6)
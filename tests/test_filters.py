@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from nopy.filters import DateFilter
+from nopy.filters import TimestampFilter
+
+
+def test_date_filter_serialize():
+
+    date = datetime(2023, 1, 1, 12, 30)
+    serialized = DateFilter(on_or_after=date, past_week=True).serialize()
+
+    assert serialized == {
+        "date": {"on_or_after": "2023-01-01T12:30:00", "past_week": {}}
+    }
+
+
+def test_timestamp_filter_serialize():
+
+    date = datetime(2023, 1, 1)
+    serialized = TimestampFilter("created_time", DateFilter(before=date)).serialize()
+
+    assert serialized == {
+        "timestamp": "created_time",
+        "created_time": {"before": "2023-01-01T00:00:00"},
+    }
@@ -0,0 +1,112 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+from dataclasses import replace
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.client import ClientConfig
+from nopy.intern import InternPool
+from nopy.objects.page import Page
+from nopy.objects.user import Person
+from nopy.objects.user import User
+from nopy.props.common import Annotations
+from nopy.props.common import Option
+
+PERSON = {"id": "user-id", "type": "person", "name": "Me", "person": {"email": "a@b.c"}}
+OPTION = {"id": "opt-id", "name": "Done", "color": "green"}
+
+
+def test_no_pool():
+
+    assert Option.from_dict(OPTION) is not Option.from_dict(OPTION)
+
+
+def test_shared_instances():
+
+    pool = InternPool()
+    with pool.activate():
+        first = User.from_dict(PERSON)
+        second = User.from_dict(PERSON)
+        other = User.from_dict({**PERSON, "name": "Other"})
+        partial = User.from_dict({"id": "user-id"})
+
+    assert first is second
+    assert first is not other and first is not partial
+    assert isinstance(first, Person)
+    assert (pool.hits, pool.misses, len(pool)) == (1, 3, 3)
+
+
+def test_shared_instances_are_frozen():
+
+    with InternPool().activate():
+        option = Option.from_dict(OPTION)
+        annotations = Annotations.from_dict({"bold": True, "color": "red"})
+
+    with pytest.raises(FrozenInstanceError):
+        option.name = "Changed"
+    with pytest.raises(FrozenInstanceError):
+        del annotations.bold
+
+    # Copies can be modified and compare equal to the shared instance.
+    for modifiable in (
+        copy.copy(option),
+        copy.deepcopy(option),
+        pickle.loads(pickle.dumps(option)),
+    ):
+        assert modifiable == option and option == modifiable
+        assert type(modifiable) is Option
+        modifiable.name = "Changed"
+        assert option.name == "Done"
+
+    changed = replace(annotations, bold=False)
+    assert type(changed) is Annotations and not changed.bold
+    assert repr(annotations) == repr(copy.copy(annotations))
+    assert {annotations, annotations} == {annotations}
+
+
+def test_bounded():
+
+    pool = InternPool(max_size=2)
+    with pool.activate():
+        first = Option.from_dict(OPTION)
+        Option.from_dict({**OPTION, "id": "2"})
+        # Using the first option makes the second one the least recently used.
+        Option.from_dict(OPTION)
+        Option.from_dict({**OPTION, "id": "3"})
+
+        assert len(pool) == 2
+        assert Option.from_dict(OPTION) is first
+
+
+def test_client_interns_pages(mock_client: Any, normal_page: dict[str, Any]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=normal_page)
+
+    pool = InternPool()
+    client = mock_client(handler, ClientConfig(intern_pool=pool))
+    first = client.retrieve_page("page-id")
+    second = client.retrieve_page("page-id")
+
+    assert first is not second
+    assert first.created_by is second.created_by
+    assert first.rich_title[0].annotations is second.rich_title[0].annotations
+
+    # The pool is only active while the client parses the responses.
+    assert User.from_dict({"id": "user-id"}) is not User.from_dict({"id": "user-id"})
+
+
+def test_lazy_properties_use_pool(full_page: dict[str, Any]):
+
+    pool = InternPool()
+    with pool.activate():
+        page = Page.from_dict(copy.deepcopy(full_page), lazy=True)
+        other = Page.from_dict(copy.deepcopy(full_page), lazy=True)
+
+    misses = pool.misses
+    page.properties._load_all()
+    other.properties._load_all()
+    assert pool.misses > misses
+    assert pool.hits > 0
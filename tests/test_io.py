@@ -0,0 +1,130 @@
+import copy
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.errors import NoClientFoundError
+from nopy.io import dump_pages
+from nopy.io import export_db
+from nopy.io import import_pages
+from nopy.io import load_pages
+from nopy.io import read_pages
+from nopy.objects.database import Database
+
+
+def make_pages(normal_page: dict[str, Any], n: int) -> list[dict[str, Any]]:
+
+    pages: list[dict[str, Any]] = []
+    for i in range(n):
+        page = copy.deepcopy(normal_page)
+        page["id"] = f"page-{i}"
+        pages.append(page)
+    return pages
+
+
+@pytest.mark.parametrize("name", ["pages.jsonl", "pages.jsonl.gz"])
+def test_dump_and_read(tmp_path: Path, normal_page: dict[str, Any], name: str):
+
+    pages = make_pages(normal_page, 3)
+    assert dump_pages(iter(pages), tmp_path / name) == 3
+
+    assert list(read_pages(tmp_path / name)) == pages
+    assert [page.id for page in load_pages(str(tmp_path / name))] == [
+        "page-0",
+        "page-1",
+        "page-2",
+    ]
+
+
+def test_file_objects(normal_page: dict[str, Any]):
+
+    buffer = io.StringIO()
+    dump_pages(make_pages(normal_page, 2), buffer)
+
+    assert len(buffer.getvalue().splitlines()) == 2
+    buffer.seek(0)
+    assert [page["id"] for page in read_pages(buffer)] == ["page-0", "page-1"]
+
+
+def test_export_db(
+    tmp_path: Path,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+):
+
+    pages = make_pages(normal_page, 3)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        start = int(body.get("start_cursor", 0))
+        end = start + 2
+        return httpx.Response(
+            200,
+            json={
+                "results": pages[start:end],
+                "has_more": start + 2 < len(pages),
+                "next_cursor": str(start + 2),
+            },
+        )
+
+    db = Database.from_dict(full_db)
+    with pytest.raises(NoClientFoundError):
+        export_db(db, tmp_path / "db.jsonl")
+
+    db.set_client(mock_client(handler))
+    assert export_db(db, tmp_path / "db.jsonl", page_size=2) == 3
+    assert list(read_pages(tmp_path / "db.jsonl")) == pages
+
+
+def test_import_pages(
+    tmp_path: Path,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    full_page: dict[str, Any],
+):
+
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=full_page)
+
+    dump_pages([full_page], tmp_path / "pages.jsonl")
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler))
+    created = list(import_pages(db, tmp_path / "pages.jsonl"))
+
+    assert len(created) == 1
+    assert bodies[0]["parent"] == {"type": "database_id", "database_id": db.id}
+    # The page is from another database, so the properties are keyed by
+    # the ids of the properties with the same names in `db`.
+    assert sorted(bodies[0]["properties"]) == sorted(
+        ["title", "K~Bk", "S%60%5Es", "SOCX", "%3CxiG", "%3BIa%40"]
+    )
+    assert bodies[0]["properties"]["K~Bk"] == {"checkbox": False}
+    # Read only properties such as rollups and formulas are skipped, as
+    # well as the properties that aren't in `db`.
+    assert "%7C%3Fd%3A" not in bodies[0]["properties"]
+    assert "sXRE" not in bodies[0]["properties"]
+
+
+def test_import_mismatched_type(
+    tmp_path: Path,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    full_page: dict[str, Any],
+):
+
+    page = copy.deepcopy(full_page)
+    page["properties"]["Number"] = page["properties"].pop("Created text")
+    dump_pages([page], tmp_path / "pages.jsonl")
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(lambda _: httpx.Response(200, json=full_page)))
+
+    with pytest.raises(ValueError):
+        list(import_pages(db, tmp_path / "pages.jsonl"))
@@ -0,0 +1,199 @@
+import copy
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.errors import UnsupportedByLibraryError
+from nopy.filters import CheckboxFilter
+from nopy.filters import DateFilter
+from nopy.filters import Filter
+from nopy.filters import MultiSelectFilter
+from nopy.filters import NumberFilter
+from nopy.filters import SelectFilter
+from nopy.filters import TextFilter
+from nopy.filters import TimestampFilter
+from nopy.local_query import QueryPlanner
+from nopy.local_query import evaluate
+from nopy.local_query import matches
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.query import Query
+from nopy.sorts import PropertySort
+from nopy.sorts import TimestampSort
+from nopy.store import SQLiteStore
+
+NOW = datetime(2023, 3, 15, 12, tzinfo=timezone.utc)
+
+
+def make_raw(normal_page: dict[str, Any], i: int) -> dict[str, Any]:
+
+    page = copy.deepcopy(normal_page)
+    page["id"] = f"page-{i}"
+    page["created_time"] = (NOW - timedelta(days=i)).isoformat()
+    page["properties"]["title"]["title"][0]["plain_text"] = f"Task {i}"
+    page["properties"]["Number"] = {
+        "id": "TqZn",
+        "type": "number",
+        "number": None if i == 4 else i,
+    }
+    page["properties"]["Select"] = {
+        "id": "ewCq",
+        "type": "select",
+        "select": {"id": "o", "name": "odd" if i % 2 else "even", "color": "red"},
+    }
+    page["properties"]["Multi-select"] = {
+        "id": "%3BFCu",
+        "type": "multi_select",
+        "multi_select": [
+            {"id": "t", "name": f"tag-{j}", "color": "red"} for j in range(i)
+        ],
+    }
+    page["properties"]["Checkbox"] = {
+        "id": "K~Bk",
+        "type": "checkbox",
+        "checkbox": i < 2,
+    }
+    page["properties"]["Date"] = {
+        "id": "S%60%5Es",
+        "type": "date",
+        "date": {"start": f"2023-03-{10 + i:02d}", "end": None, "time_zone": None},
+    }
+    return page
+
+
+@pytest.fixture
+def pages(normal_page: dict[str, Any]) -> list[Page]:
+
+    return [Page.from_dict(make_raw(normal_page, i)) for i in range(5)]
+
+
+def ids(pages: list[Page]) -> list[str]:
+    return [page.id for page in pages]
+
+
+def test_prop_filters(pages: list[Page]):
+
+    query = Query(
+        and_filters=[
+            Filter("Number", NumberFilter(greater_than_or_equal_to=1)),
+            Filter("Select", SelectFilter(equals="odd")),
+        ]
+    )
+    assert ids(evaluate(query, pages)) == ["page-1", "page-3"]
+
+    query = Query(
+        or_filters=[
+            Filter("Number", NumberFilter(is_empty=True)),
+            Filter("Checkbox", CheckboxFilter(equals=True)),
+        ]
+    )
+    assert ids(evaluate(query, pages)) == ["page-0", "page-1", "page-4"]
+
+    query = Query(
+        and_filters=[Filter("Multi-select", MultiSelectFilter(contains="tag-2"))]
+    )
+    assert ids(evaluate(query, pages)) == ["page-3", "page-4"]
+
+    query = Query(and_filters=[Filter("Name", {"title": {"contains": "TASK 2"}})])
+    assert ids(evaluate(query, pages)) == ["page-2"]
+
+    # Notion rejects filters on missing properties, so they can't be
+    # evaluated locally.
+    query = Query(and_filters=[Filter("Missing", TextFilter(is_empty=True))])
+    with pytest.raises(UnsupportedByLibraryError):
+        evaluate(query, pages)
+    query = Query(
+        or_filters=[
+            Filter("Checkbox", CheckboxFilter(equals=True)),
+            Filter("Missing", TextFilter(is_empty=True)),
+        ]
+    )
+    with pytest.raises(UnsupportedByLibraryError):
+        evaluate(query, pages)
+
+
+def test_date_filters(pages: list[Page]):
+
+    query = {"filter": {"property": "Date", "date": {"on_or_after": "2023-03-12"}}}
+    assert ids(evaluate(query, pages)) == ["page-2", "page-3", "page-4"]
+
+    query = Query(and_filters=[Filter("Date", DateFilter(past_week=True))])
+    later = NOW + timedelta(days=5)
+    assert ids(evaluate(query, pages, now=later)) == ["page-3", "page-4"]
+
+    created = TimestampFilter(
+        "created_time", DateFilter(before=NOW - timedelta(days=2))
+    )
+    assert ids(evaluate(Query(and_filters=[created]), pages)) == ["page-3", "page-4"]
+
+
+def test_sorts(pages: list[Page]):
+
+    query = Query(sorts=[PropertySort("Number", "descending")])
+    # Empty values are sorted last in both directions.
+    assert ids(evaluate(query, pages)) == [f"page-{i}" for i in (3, 2, 1, 0, 4)]
+
+    query = Query(
+        sorts=[PropertySort("Select"), TimestampSort("created_time", "ascending")]
+    )
+    assert ids(evaluate(query, pages)) == [f"page-{i}" for i in (4, 2, 0, 3, 1)]
+
+
+def test_missing_property(normal_page: dict[str, Any]):
+
+    page = Page.from_dict(normal_page)
+
+    assert matches(page, {"property": "Name", "title": {"contains": "Tri"}})
+    for condition in ({"contains": "Tri"}, {"is_empty": True}):
+        with pytest.raises(UnsupportedByLibraryError):
+            matches(page, {"property": "DoesNotExist", "rich_text": condition})
+
+
+def test_unsupported_condition(pages: list[Page]):
+
+    query = {"filter": {"property": "Number", "number": {"between": 1}}}
+    with pytest.raises(UnsupportedByLibraryError):
+        evaluate(query, pages)
+
+
+def test_planner(mock_client: Any, full_db: dict[str, Any], normal_page: Any):
+
+    raw_pages = [make_raw(normal_page, i) for i in range(5)]
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200, json={"results": raw_pages, "has_more": False, "next_cursor": None}
+        )
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler))
+    query = Query(and_filters=[Filter("Select", SelectFilter(equals="odd"))])
+
+    with SQLiteStore() as store:
+        planner = QueryPlanner(store, max_age=timedelta(minutes=5))
+
+        # Nothing is mirrored yet, so the query is sent to Notion.
+        assert len(list(planner.run(db, query))) == 5
+        assert "filter" in requests[-1]
+
+        store.mirror(db)
+        requests.clear()
+        assert ids(list(planner.run(db, query))) == ["page-1", "page-3"]
+        assert requests == []
+
+        # Filters on missing properties are sent to Notion.
+        missing = Query(and_filters=[Filter("Missing", TextFilter(is_empty=True))])
+        list(planner.run(db, missing))
+        assert len(requests) == 1
+        requests.clear()
+
+        planner.max_age = timedelta(0)
+        list(planner.run(db, query))
+        assert len(requests) == 1
@@ -1,11 +1,15 @@
+import copy
+import json
 from typing import Any
 
+import httpx
 from dateutil.parser import parse
 
 from nopy.enums import ObjectTypes
 from nopy.objects.database import Database
 from nopy.objects.user import User
 from nopy.props.common import Emoji
+from nopy.props.common import Option
 from nopy.props.common import PageParent
 
 
@@ -71,3 +75,29 @@ def test_no_title(full_db: dict[str, Any]):
 
     assert db.title == ""
     assert len(db.rich_title) == 0
+
+
+def test_update_sends_only_changes(mock_client: Any, full_db: dict[str, Any]):
+
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=full_db)
+
+    db = Database.from_dict(copy.deepcopy(full_db))
+    db.set_client(mock_client(handler))
+    assert db.update() is db
+    assert bodies == []
+
+    select = db.properties["Select"]
+    select.options.append(Option("New"))  # type: ignore
+    db.properties.pop("Number")
+    db.is_inline = not db.is_inline
+    db.update()
+
+    assert bodies[0] == {
+        "is_inline": db.is_inline,
+        "properties": {select.id: select.serialize()},
+    }
+    assert bodies[1] == {"properties": {full_db["properties"]["Number"]["id"]: None}}
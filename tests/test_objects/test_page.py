@@ -1,13 +1,18 @@
+import copy
+import json
 from typing import Any
 
+import httpx
 from dateutil.parser import parse
 
 from nopy.enums import ObjectTypes
 from nopy.objects.page import Page
 from nopy.objects.user import User
+from nopy.properties import Properties
 from nopy.props.common import Emoji
 from nopy.props.common import File
 from nopy.props.common import PageParent
+from nopy.props.page_props import PNumber
 
 
 def test_normal_page(normal_page: dict[str, Any]):
@@ -65,3 +70,69 @@ def test_no_icon(normal_page: dict[str, Any]):
     page = Page.from_dict(normal_page)
 
     assert page.icon is None
+
+
+def test_lazy_page_properties(full_page: dict[str, Any]):
+
+    eager = Page.from_dict(copy.deepcopy(full_page))
+    page = Page.from_dict(full_page, lazy=True)
+
+    assert len(page.properties) == len(eager.properties)
+    assert page.properties._props == set()  # type: ignore
+    assert "Peeps" in page.properties
+
+    people = page.properties["Peeps"]
+    assert people is page.properties[people.id]
+    assert len(page.properties._props) == 1  # type: ignore
+
+    # Iterating and serializing parse all the remaining properties.
+    assert {prop.name for prop in page.properties} == {
+        prop.name for prop in eager.properties
+    }
+    assert page._og_props == eager._og_props  # type: ignore
+
+
+def test_update_sends_only_changes(mock_client: Any, full_page: dict[str, Any]):
+
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=full_page)
+
+    client = mock_client(handler)
+    page = Page.from_dict(copy.deepcopy(full_page), lazy=True)
+    page.set_client(client)
+
+    # Looking up properties without changing them doesn't send anything.
+    assert page.properties["Created number"].number == 123  # type: ignore
+    list(page.properties)
+    assert page.update() is page
+    assert bodies == []
+
+    number = page.properties["Created number"]
+    number.number = 7  # type: ignore
+    page.title = "New title"
+    page.update()
+
+    assert bodies[0].keys() == {"properties"}
+    assert bodies[0]["properties"][number.id] == {"number": 7}
+    title = [rt.serialize() for rt in page.rich_title]
+    assert bodies[0]["properties"]["title"] == {"title": title}
+    assert len(bodies[0]["properties"]) == 2
+
+
+def test_new_pages_send_everything(mock_client: Any, full_page: dict[str, Any]):
+
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=full_page)
+
+    page = Page(id="page-id", properties=Properties([PNumber(name="Number", number=1)]))
+    page.set_client(mock_client(handler))
+    page.update()
+
+    assert bodies[0]["properties"]["Number"] == {"number": 1}
+    assert bodies[0]["archived"] is False
@@ -0,0 +1,146 @@
+# pyright: reportPrivateUsage=false
+
+import asyncio
+import copy
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+
+import httpx
+from dateutil.parser import parse
+
+from nopy.objects.database import Database
+from nopy.objects.database import _shard_queries
+from nopy.objects.page import Page
+from tests.test_async_client import make_client
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def make_pages(normal_page: dict[str, Any], count: int) -> list[dict[str, Any]]:
+
+    pages: list[dict[str, Any]] = []
+    for i in range(count):
+        page = copy.deepcopy(normal_page)
+        page["id"] = f"page-{i}"
+        page["created_time"] = (START + timedelta(hours=i)).isoformat()
+        pages.append(page)
+    return pages
+
+
+def in_window(page: dict[str, Any], window: dict[str, Any]) -> bool:
+
+    created_time = parse(page["created_time"])
+    return parse(window["on_or_after"]) <= created_time <= parse(window["on_or_before"])
+
+
+def parse_window(query_filter: dict[str, Any]) -> dict[str, Any]:
+
+    # Every end of the window is a separate filter since Notion rejects
+    # date filters with more than one condition.
+    window: dict[str, Any] = {}
+    for condition in query_filter["and"]:
+        if condition.get("timestamp", None) != "created_time":
+            continue
+        ((operator, value),) = condition["created_time"].items()
+        window[operator] = value
+    assert set(window) == {"on_or_after", "on_or_before"}
+    return window
+
+
+def make_handler(pages: list[dict[str, Any]], windows: list[dict[str, Any]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if "sorts" in body:
+            ascending = body["sorts"][0]["direction"] == "ascending"
+            results = [pages[0] if ascending else pages[-1]]
+        else:
+            window = parse_window(body["filter"])
+            windows.append(window)
+            results = [page for page in pages if in_window(page, window)]
+        return httpx.Response(
+            200, json={"results": results, "has_more": False, "next_cursor": None}
+        )
+
+    return handler
+
+
+def test_parallel_scan(mock_client: Any, full_db: dict[str, Any], normal_page: Any):
+
+    # 20 hours split in 4 windows puts the pages 5, 10 and 15 exactly on
+    # the inner window boundaries.
+    pages = make_pages(normal_page, 21)
+    windows: list[dict[str, Any]] = []
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(make_handler(pages, windows)))
+    scanned = [page.id for page in db.parallel_scan(shards=4)]
+
+    assert len(windows) == 4
+    boundaries = [p["id"] for p in pages if sum(in_window(p, w) for w in windows) == 2]
+    assert boundaries == ["page-5", "page-10", "page-15"]
+    # The boundary pages are returned by two windows, but yielded once.
+    assert sorted(scanned) == sorted(p["id"] for p in pages)
+
+
+def test_async_parallel_scan(full_db: dict[str, Any], normal_page: Any):
+
+    pages = make_pages(normal_page, 21)
+    windows: list[dict[str, Any]] = []
+
+    async def run():
+        client = make_client(make_handler(pages, windows))
+        db = Database.from_dict(full_db)
+        db.set_client(client)
+        scanned = [page.id async for page in db.parallel_scan(shards=4)]
+        await client.aclose()
+        return scanned
+
+    scanned = asyncio.run(run())
+
+    assert len(windows) == 4
+    assert sorted(scanned) == sorted(p["id"] for p in pages)
+
+
+def test_shard_queries(normal_page: dict[str, Any]):
+
+    first, last = (Page.from_dict(page) for page in make_pages(normal_page, 2))
+    base_filter = {"property": "Checkbox", "checkbox": {"equals": True}}
+
+    queries = _shard_queries(first, last, 1, base_filter)
+    assert queries == [
+        {
+            "filter": {
+                "and": [
+                    {
+                        "timestamp": "created_time",
+                        "created_time": {"on_or_after": first.created_time.isoformat()},
+                    },
+                    {
+                        "timestamp": "created_time",
+                        "created_time": {"on_or_before": last.created_time.isoformat()},
+                    },
+                    base_filter,
+                ]
+            }
+        }
+    ]
+
+    # Without the created time of either end, a single query is made.
+    last.created_time = None
+    assert _shard_queries(first, last, 4, base_filter) == [{"filter": base_filter}]
+    assert _shard_queries(first, last, 4, None) == [{}]
+
+
+def test_parallel_scan_empty_db(mock_client: Any, full_db: dict[str, Any]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"results": [], "has_more": False, "next_cursor": None}
+        )
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler))
+
+    assert list(db.parallel_scan(shards=4)) == []
@@ -0,0 +1,142 @@
+import asyncio
+from typing import Any
+
+import httpx
+
+from nopy.objects.user import User
+from nopy.props.common import RichText
+from nopy.props.page_props import PNumber
+from nopy.props.page_props import PPeople
+from nopy.props.page_props import PRelation
+from nopy.props.page_props import PRichtext
+from nopy.props.page_props import PRollup
+from tests.test_async_client import make_client
+
+
+def text(content: str) -> dict[str, Any]:
+
+    return {
+        "type": "text",
+        "text": {"content": content, "link": None},
+        "plain_text": content,
+        "href": None,
+        "annotations": {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+        },
+    }
+
+
+# The values of every paginated property along with the property item.
+VALUES = {
+    "text": [{"rich_text": text(word)} for word in ("a", "b", "c")],
+    "title": [{"title": text("Title")}],
+    "rel": [{"relation": {"id": f"page-{i}"}} for i in range(5)],
+    "peeps": [{"people": {"object": "user", "id": "user-id"}}],
+    "roll": [{"number": i} for i in range(3)],
+}
+PROP_ITEMS = {
+    "text": {"id": "text", "type": "rich_text", "rich_text": {}},
+    "title": {"id": "title", "type": "title", "title": {}},
+    "rel": {"id": "rel", "type": "relation", "relation": {}},
+    "peeps": {"id": "peeps", "type": "people", "people": {}},
+    "roll": {
+        "id": "roll",
+        "type": "rollup",
+        "rollup": {"type": "array", "array": [], "function": "show_original"},
+    },
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+
+    prop_id = request.url.path.split("/")[-1]
+    if prop_id == "num":
+        item = {"object": "property_item", "id": "num", "type": "number", "number": 3}
+        return httpx.Response(200, json=item)
+
+    prop_item = PROP_ITEMS[prop_id]
+    start = int(request.url.params.get("start_cursor", 0))
+    end = start + int(request.url.params["page_size"])
+    results = [
+        {"object": "property_item", "id": prop_id, "type": prop_item["type"], **value}
+        for value in VALUES[prop_id][start:end]
+    ]
+    if prop_id == "roll":
+        results = [{**result, "type": "number"} for result in results]
+    return httpx.Response(
+        200,
+        json={
+            "object": "list",
+            "results": results,
+            "has_more": end < len(VALUES[prop_id]),
+            "next_cursor": str(end),
+            "property_item": prop_item,
+        },
+    )
+
+
+def test_retrieve_page_property(mock_client: Any):
+
+    client = mock_client(handler)
+
+    rich_text = client.retrieve_page_property("page-id", "text", page_size=2)
+    assert isinstance(rich_text, PRichtext)
+    assert [rt.plain_text for rt in rich_text.rich_text] == ["a", "b", "c"]
+
+    relation = client.retrieve_page_property("page-id", "rel", page_size=2)
+    assert isinstance(relation, PRelation)
+    assert relation.relations == [f"page-{i}" for i in range(5)]
+    assert not relation.has_more
+
+    people = client.retrieve_page_property("page-id", "peeps")
+    assert isinstance(people, PPeople)
+    assert [user.id for user in people.people] == ["user-id"]
+
+    rollup = client.retrieve_page_property("page-id", "roll", page_size=1)
+    assert isinstance(rollup, PRollup)
+    assert rollup.value_type == "array"
+    assert [item["number"] for item in rollup.value] == [0, 1, 2]  # type: ignore
+
+    title = client.retrieve_page_property("page-id", "title")
+    assert [rt.plain_text for rt in title] == ["Title"]
+
+    number = client.retrieve_page_property("page-id", "num")
+    assert isinstance(number, PNumber)
+    assert number.number == 3
+
+
+def test_stream_page_property(mock_client: Any):
+
+    client = mock_client(handler)
+
+    values = list(client.stream_page_property("page-id", "rel", page_size=2))
+    assert values == [f"page-{i}" for i in range(5)]
+
+    values = list(client.stream_page_property("page-id", "text", page_size=2))
+    assert all(isinstance(value, RichText) for value in values)
+    values = list(client.stream_page_property("page-id", "peeps"))
+    assert all(isinstance(value, User) for value in values)
+    values = list(client.stream_page_property("page-id", "roll", page_size=2))
+    assert [value.number for value in values] == [0, 1, 2]
+    values = list(client.stream_page_property("page-id", "num"))
+    assert [value.number for value in values] == [3]
+
+
+def test_async_retrieve_page_property():
+    async def run():
+        client = make_client(handler)
+        relation = await client.retrieve_page_property("page-id", "rel", page_size=2)
+        stream = client.stream_page_property("page-id", "text", page_size=1)
+        values = [value async for value in stream]
+        await client.aclose()
+        return relation, values
+
+    relation, values = asyncio.run(run())
+
+    assert relation.relations == [f"page-{i}" for i in range(5)]  # type: ignore
+    assert [value.plain_text for value in values] == ["a", "b", "c"]
@@ -0,0 +1,85 @@
+# pyright: reportPrivateUsage=false
+
+import asyncio
+import warnings
+
+import pytest
+
+from nopy.async_client import AsyncNotionClient
+from nopy.client import ClientConfig
+from nopy.client import NotionClient
+from nopy.rate_limit import RateLimiter
+
+
+def test_burst_then_wait():
+
+    limiter = RateLimiter(rate=10, burst=2)
+
+    assert limiter._reserve() == 0
+    assert limiter._reserve() == 0
+    assert limiter._reserve() == pytest.approx(0.1, abs=0.01)
+    # Waiting callers queue up behind each other.
+    assert limiter._reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_acquire_async():
+
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+    asyncio.run(run())
+    assert limiter._tokens < 0.5
+
+
+def test_invalid_config():
+
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+
+def test_shared_across_clients():
+
+    config = ClientConfig(rate_limit=3)
+    sync_client = NotionClient("shared-token", config)
+    async_client = AsyncNotionClient("shared-token", config)
+    other_client = NotionClient("other-token", config)
+
+    assert sync_client._rate_limiter is not None
+    assert sync_client._rate_limiter is async_client._rate_limiter
+    assert sync_client._rate_limiter is not other_client._rate_limiter
+
+
+def test_token_not_stored():
+
+    RateLimiter.for_token("secret-token", 5)
+    assert "secret-token" not in RateLimiter._shared
+
+
+def test_shared_with_different_settings():
+
+    first = RateLimiter.for_token("strict-token", rate=5, burst=3)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert RateLimiter.for_token("strict-token", rate=5, burst=3) is first
+
+    with pytest.warns(RuntimeWarning):
+        second = RateLimiter.for_token("strict-token", rate=2, burst=4)
+    # The stricter rate and burst apply to every client using the token.
+    assert second is first
+    assert (first.rate, first.burst) == (2, 3)
+
+    with pytest.warns(RuntimeWarning):
+        RateLimiter.for_token("strict-token", rate=10, burst=1)
+    assert (first.rate, first.burst) == (2, 1)
+    assert first._tokens <= 1
+
+
+def test_disabled_by_default():
+
+    client = NotionClient("token")
+    assert client._rate_limiter is None
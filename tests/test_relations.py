@@ -0,0 +1,133 @@
+import asyncio
+import copy
+from collections import Counter
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from tests.test_async_client import make_client
+
+# The ids each page relates to.
+GRAPH = {
+    "root": ["a", "b", "c"],
+    "a": ["b", "root"],
+    "b": ["d"],
+    "c": [],
+    "d": [],
+}
+
+
+def make_page(normal_page: dict[str, Any], page_id: str) -> dict[str, Any]:
+
+    page = copy.deepcopy(normal_page)
+    page["id"] = page_id
+    relations = GRAPH[page_id]
+    # Notion only returns the first relations along with the page.
+    page["properties"]["Related"] = {
+        "id": "rel",
+        "type": "relation",
+        "relation": [{"id": related} for related in relations[:2]],
+        "has_more": len(relations) > 2,
+    }
+    return page
+
+
+def make_handler(normal_page: dict[str, Any], requests: Counter[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requests[path] += 1
+        parts = path.split("/")
+        if "properties" not in parts:
+            return httpx.Response(200, json=make_page(normal_page, parts[-1]))
+
+        relations = GRAPH[parts[-3]]
+        start = int(request.url.params.get("start_cursor", 0))
+        end = start + 2
+        items = [
+            {"object": "property_item", "type": "relation", "relation": {"id": id}}
+            for id in relations[start:end]
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "results": items,
+                "has_more": end < len(relations),
+                "next_cursor": str(end),
+            },
+        )
+
+    return handler
+
+
+def test_resolve_relations(mock_client: Any, normal_page: dict[str, Any]):
+
+    requests: Counter[str] = Counter()
+    client = mock_client(make_handler(normal_page, requests))
+    root = Page.from_dict(make_page(normal_page, "root"))
+    root.set_client(client)
+
+    resolved = root.resolve_relations()
+    assert list(resolved) == ["a", "b", "c"]
+    assert root.properties["Related"].relations == ["a", "b", "c"]
+    assert not root.properties["Related"].has_more
+    # Completing the relation isn't a change to be sent.
+    assert root._serialize_changes() == {}
+    assert requests["/v1/pages/root/properties/rel"] == 2
+
+    cache: dict[str, Page] = {}
+    resolved = root.resolve_relations(depth=3, cache=cache)
+    assert sorted(resolved) == ["a", "b", "c", "d"]
+    assert sorted(cache) == ["a", "b", "c", "d"]
+    # Every page is retrieved once per call, and the root is never retrieved.
+    assert requests["/v1/pages/b"] == 2
+    assert requests["/v1/pages/d"] == 1
+    assert requests["/v1/pages/root"] == 0
+
+    requests.clear()
+    root.resolve_relations(depth=3, cache=cache)
+    assert sum(requests.values()) == 0
+
+    with pytest.raises(ValueError):
+        root.resolve_relations(depth=0)
+
+
+def test_db_resolve_relations(
+    mock_client: Any, full_db: dict[str, Any], normal_page: dict[str, Any]
+):
+
+    requests: Counter[str] = Counter()
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(make_handler(normal_page, requests)))
+    pages = [Page.from_dict(make_page(normal_page, id)) for id in ("a", "c")]
+    for page in pages:
+        page.set_client(db._client)  # type: ignore
+
+    resolved = db.resolve_relations(pages, depth=2)
+
+    assert sorted(resolved) == ["b", "d", "root"]
+    retrieved = [path for path in requests if "properties" not in path]
+    assert sorted(retrieved) == ["/v1/pages/b", "/v1/pages/d", "/v1/pages/root"]
+    assert all(requests[path] == 1 for path in retrieved)
+
+
+def test_async_resolve_relations(normal_page: dict[str, Any]):
+
+    requests: Counter[str] = Counter()
+
+    async def run():
+        client = make_client(make_handler(normal_page, requests))
+        root = Page.from_dict(make_page(normal_page, "root"))
+        root.set_client(client)
+        resolved = await root.resolve_relations(depth=2)
+        await client.aclose()
+        return root, resolved
+
+    root, resolved = asyncio.run(run())
+
+    assert sorted(resolved) == ["a", "b", "c", "d"]
+    assert root.properties["Related"].relations == ["a", "b", "c"]
+    assert requests["/v1/pages/b"] == 1
@@ -0,0 +1,132 @@
+# pyright: reportPrivateUsage=false
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.client import ClientConfig
+from nopy.client import NotionClient
+from nopy.errors import APIResponseError
+from nopy.retry import RetryPolicy
+
+BASE_URL = "https://api.notion.com/v1/"
+
+
+def make_client(handler: Any, policy: RetryPolicy) -> NotionClient:
+
+    client = NotionClient("token", ClientConfig(retry_policy=policy))
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(handler), base_url=BASE_URL
+    )
+    return client
+
+
+def error_response(status: int, headers: Any = None) -> httpx.Response:
+
+    body = {"object": "error", "code": "error", "message": "error"}
+    return httpx.Response(status, json=body, headers=headers)
+
+
+def test_endpoint_key():
+
+    policy = RetryPolicy()
+    request = httpx.Request("POST", BASE_URL + "databases/db-id/query")
+    assert policy.endpoint_key(request) == "databases/{}/query"
+
+    request = httpx.Request("GET", BASE_URL + "users/me")
+    assert policy.endpoint_key(request) == "users/me"
+
+    request = httpx.Request("GET", BASE_URL + "pages/page-id/properties/prop-id")
+    assert policy.endpoint_key(request) == "pages/{}/properties/{}"
+
+
+def test_backoff_is_capped():
+
+    policy = RetryPolicy(max_retries=10, backoff_base=1, backoff_max=5, jitter=False)
+    request = httpx.Request("GET", BASE_URL + "users/me")
+    resp = error_response(503)
+
+    assert policy.get_delay(request, 0, resp) == 1
+    assert policy.get_delay(request, 2, resp) == 4
+    assert policy.get_delay(request, 6, resp) == 5
+
+
+def test_retry_after_is_honoured():
+
+    policy = RetryPolicy(jitter=False)
+    request = httpx.Request("GET", BASE_URL + "users/me")
+    resp = error_response(429, {"Retry-After": "7"})
+
+    assert policy.get_delay(request, 0, resp) == 7
+
+
+def test_retry_after_is_capped():
+
+    policy = RetryPolicy(backoff_max=10, jitter=False)
+    request = httpx.Request("GET", BASE_URL + "users/me")
+
+    resp = error_response(429, {"Retry-After": "3600"})
+    assert policy.get_delay(request, 0, resp) == 10
+    retry_at = datetime.now(timezone.utc) + timedelta(days=1)
+    resp = error_response(429, {"Retry-After": format_datetime(retry_at)})
+    assert policy.get_delay(request, 0, resp) == 10
+
+
+def test_retry_after_without_timezone():
+
+    policy = RetryPolicy(backoff_max=10, jitter=False)
+    request = httpx.Request("GET", BASE_URL + "users/me")
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+    header = retry_at.strftime("%a, %d %b %Y %H:%M:%S -0000")
+    delay = policy.get_delay(request, 0, error_response(429, {"Retry-After": header}))
+    assert delay is not None and 3 <= delay <= 5
+
+
+def test_non_idempotent_requests():
+
+    policy = RetryPolicy(jitter=False)
+    request = httpx.Request("POST", BASE_URL + "pages")
+
+    assert policy.get_delay(request, 0, error_response(503)) is None
+    assert policy.get_delay(request, 0, error_response(429)) is not None
+    assert policy.get_delay(request, 0) is None
+
+    # Appending blocks twice would duplicate them.
+    request = httpx.Request("PATCH", BASE_URL + "blocks/block-id/children")
+    assert policy.get_delay(request, 0, error_response(503)) is None
+    request = httpx.Request("PATCH", BASE_URL + "blocks/block-id")
+    assert policy.get_delay(request, 0, error_response(503)) is not None
+
+
+def test_client_retries_transient_errors(normal_page: dict[str, Any]):
+
+    responses = [error_response(502), error_response(429), None]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resp = responses.pop(0)
+        return resp or httpx.Response(200, json=normal_page)
+
+    policy = RetryPolicy(backoff_base=0, jitter=False)
+    client = make_client(handler, policy)
+    page = client.retrieve_page("page-id")
+
+    assert page.id == "page-id"
+    assert policy.counters["GET pages/{}"] == 2
+
+
+def test_client_gives_up():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return error_response(503)
+
+    policy = RetryPolicy(max_retries=2, backoff_base=0, jitter=False)
+    client = make_client(handler, policy)
+
+    with pytest.raises(APIResponseError):
+        client.retrieve_page("page-id")
+    assert policy.counters["GET pages/{}"] == 2
@@ -0,0 +1,97 @@
+import asyncio
+import copy
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from tests.test_async_client import make_client
+
+
+def make_handler(results: list[dict[str, Any]], bodies: list[dict[str, Any]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/search"
+        body = json.loads(request.content)
+        bodies.append(body)
+        start = int(body.get("start_cursor", 0))
+        end = start + body["page_size"]
+        return httpx.Response(
+            200,
+            json={
+                "results": results[start:end],
+                "has_more": end < len(results),
+                "next_cursor": str(end),
+            },
+        )
+
+    return handler
+
+
+@pytest.fixture
+def results(full_db: dict[str, Any], normal_page: dict[str, Any]):
+
+    db = copy.deepcopy(full_db)
+    db["id"] = "db-id"
+    db["title"] = [{**db["title"][0], "plain_text": "Tasks"}]
+    return [copy.deepcopy(normal_page), db, copy.deepcopy(normal_page)]
+
+
+def test_search(mock_client: Any, results: list[dict[str, Any]]):
+
+    bodies: list[dict[str, Any]] = []
+    client = mock_client(make_handler(results, bodies))
+
+    found = list(client.search("task", sort="descending", page_size=2))
+    assert [type(obj) for obj in found] == [Page, Database, Page]
+    assert all(obj._client is client for obj in found)
+    assert bodies[0] == {
+        "query": "task",
+        "sort": {"direction": "descending", "timestamp": "last_edited_time"},
+        "page_size": 2,
+    }
+    assert bodies[1]["start_cursor"] == "2"
+
+    bodies.clear()
+    assert len(list(client.search(max_results=1, page_size=1))) == 1
+    assert len(bodies) == 1
+
+
+def test_search_invalid_args(mock_client: Any):
+
+    client = mock_client(make_handler([], []))
+    with pytest.raises(ValueError):
+        client.search(filter="block")
+    with pytest.raises(ValueError):
+        client.search(sort="newest")
+
+
+def test_index_dbs(mock_client: Any, results: list[dict[str, Any]]):
+
+    bodies: list[dict[str, Any]] = []
+    client = mock_client(make_handler(results[1:2], bodies))
+
+    assert client.index_dbs() == {"db-id": "Tasks"}
+    assert bodies[0]["filter"] == {"property": "object", "value": "database"}
+
+
+def test_async_search(results: list[dict[str, Any]]):
+
+    bodies: list[dict[str, Any]] = []
+
+    async def run():
+        client = make_client(make_handler(results, bodies))
+        found = [obj async for obj in client.search(filter="page", page_size=1)]
+        await client.aclose()
+        client = make_client(make_handler(results[1:2], []))
+        index = await client.index_dbs()
+        await client.aclose()
+        return found, index
+
+    found, index = asyncio.run(run())
+
+    assert len(found) == 3
+    assert bodies[0]["filter"] == {"property": "object", "value": "page"}
+    assert index == {"db-id": "Tasks"}
@@ -0,0 +1,65 @@
+import copy
+import pickle
+from dataclasses import dataclass
+
+import pytest
+
+from nopy.objects.user import Bot
+from nopy.objects.user import Person
+from nopy.props.common import Annotations
+from nopy.props.common import Mention
+from nopy.props.common import Option
+from nopy.props.common import Text
+from nopy.slots import copy_state
+from nopy.slots import slotted
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Annotations(bold=True),
+        Text("text"),
+        Mention("mention"),
+        Option("opt"),
+        Person("id"),
+    ],
+)
+def test_no_instance_dict(obj: object):
+
+    assert not hasattr(obj, "__dict__")
+    assert copy.copy(obj) == obj
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_zero_arg_super():
+
+    # `Bot.__post_init__` calls `super().__post_init__()`.
+    bot = Bot("bot-id")
+    assert bot.type.value == "user"
+    assert bot.user_type.value == "bot"
+
+
+def test_slotted_subclass():
+    @slotted("_extra")
+    @dataclass
+    class Base:
+        a: int = 1
+
+        def __post_init__(self):
+            self._extra = self.a * 2
+
+    @slotted()
+    @dataclass
+    class Child(Base):
+        b: int = 2
+
+        def __post_init__(self):
+            super().__post_init__()
+
+    child = Child(3)
+    assert (child.a, child.b, child._extra) == (3, 2, 6)  # type: ignore
+    assert Child.__slots__ == ("b",)
+
+    other = Child(5)
+    copy_state(other, child)
+    assert (child.a, child._extra) == (5, 10)  # type: ignore
@@ -0,0 +1,215 @@
+# pyright: reportPrivateUsage=false
+
+import copy
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+
+import httpx
+import pytest
+
+from nopy.enums import PropTypes
+from nopy.errors import APIResponseError
+from nopy.errors import NoClientFoundError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.store import SQLiteStore
+from nopy.sync import SyncState
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def make_page(normal_page: dict[str, Any], i: int) -> dict[str, Any]:
+
+    page = copy.deepcopy(normal_page)
+    page["id"] = f"page-{i}"
+    page["last_edited_time"] = (START + timedelta(minutes=i)).isoformat()
+    page["properties"]["Number"] = {"id": "TqZn", "type": "number", "number": i}
+    page["properties"]["Select"] = {
+        "id": "ewCq",
+        "type": "select",
+        "select": {"id": "opt", "name": "odd" if i % 2 else "even", "color": "red"},
+    }
+    page["properties"]["Checkbox"] = {
+        "id": "K~Bk",
+        "type": "checkbox",
+        "checkbox": bool(i % 2),
+    }
+    return page
+
+
+def make_handler(pages: list[dict[str, Any]], bodies: list[dict[str, Any]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200, json={"results": pages, "has_more": False, "next_cursor": None}
+        )
+
+    return handler
+
+
+@pytest.fixture
+def store():
+
+    store = SQLiteStore()
+    yield store
+    store.close()
+
+
+def test_mirror(
+    store: SQLiteStore,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+):
+
+    pages = [make_page(normal_page, i) for i in range(5)]
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(make_handler(pages, [])))
+
+    assert store.mirror(db) == 5
+    assert store.synced_at(db.id) is not None
+    assert store.columns(db.id)["Number"] == PropTypes.NUMBER
+
+    table = store.table_name(db.id)
+    rows = store.execute(
+        f'SELECT "_id", "Select", "Checkbox" FROM "{table}" WHERE "Number" >= ?', (3,)
+    ).fetchall()
+    assert sorted(rows) == [("page-3", "odd", 1), ("page-4", "even", 0)]
+
+    indexes = {row[1] for row in store.execute(f'PRAGMA index_list("{table}")')}
+    assert f"idx_{table}_TqZn" in indexes
+    assert f"idx_{table}_ewCq" in indexes
+
+    odd = list(store.pages(db.id, '"Select" = ?', ("odd",)))
+    assert sorted(page.id for page in odd) == ["page-1", "page-3"]
+    assert all(isinstance(page, Page) for page in odd)
+    assert odd[0].title == "Trial Root Page"
+
+    page = store.get_page(db.id, "page-2")
+    assert page is not None and page.id == "page-2"
+    assert store.get_page(db.id, "missing") is None
+    # The properties are only parsed when they're looked up.
+    assert page.properties._lazy
+    assert page.properties["Number"].number == 2
+
+
+def test_mirror_replaces_pages(
+    store: SQLiteStore,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+):
+
+    pages = [make_page(normal_page, i) for i in range(3)]
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(make_handler(pages, [])))
+
+    store.mirror(db)
+    del pages[0]
+    store.mirror(db)
+
+    assert sorted(page.id for page in store.pages(db.id)) == ["page-1", "page-2"]
+
+
+def test_renamed_property(
+    store: SQLiteStore,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+):
+
+    pages = [make_page(normal_page, i) for i in range(2)]
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(make_handler(pages, [])))
+    store.mirror(db)
+
+    renamed_db = copy.deepcopy(full_db)
+    prop = renamed_db["properties"].pop("Number")
+    renamed_db["properties"]["Amount"] = {**prop, "name": "Amount"}
+    store.upsert_pages(Database.from_dict(renamed_db), [])
+
+    table = store.table_name(db.id)
+    columns = {row[1] for row in store.execute(f'PRAGMA table_info("{table}")')}
+    assert "Amount" in columns and "Number" not in columns
+    assert store.columns(db.id)["Amount"] == PropTypes.NUMBER
+    rows = store.execute(f'SELECT "Amount" FROM "{table}" ORDER BY "_id"')
+    assert rows.fetchall() == [(0,), (1,)]
+
+
+def test_sync(
+    store: SQLiteStore,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+):
+
+    pages = [make_page(normal_page, i) for i in range(3)]
+    bodies: list[dict[str, Any]] = []
+    handler = make_handler(pages, bodies)
+
+    def checking_handler(request: httpx.Request) -> httpx.Response:
+        # The mirror isn't locked while the pages are fetched.
+        assert not store._conn.in_transaction
+        return handler(request)
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(checking_handler))
+    state = SyncState()
+
+    assert store.sync(db, state) == 3
+    assert state.watermark == START + timedelta(minutes=2)
+    assert state.known_ids == {"page-0", "page-1", "page-2"}
+
+    bodies.clear()
+    pages[:] = pages[1:]
+    store.sync(db, state)
+
+    assert "filter" in bodies[0]
+    assert sorted(page.id for page in store.pages(db.id)) == ["page-1", "page-2"]
+
+
+def test_sync_failure_keeps_state(
+    store: SQLiteStore,
+    mock_client: Any,
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+):
+
+    pages = [make_page(normal_page, i) for i in range(3)]
+    handler = make_handler(pages, [])
+
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        # Only the query listing the ids to reconcile has no filter.
+        if "filter" not in json.loads(request.content):
+            return httpx.Response(
+                400, json={"code": "validation_error", "message": "Bad request."}
+            )
+        return handler(request)
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(failing_handler))
+    state = SyncState(watermark=START, known_ids={"page-0"})
+
+    with pytest.raises(APIResponseError):
+        store.sync(db, state)
+
+    assert state.watermark == START
+    assert state.known_ids == {"page-0"}
+    assert store.synced_at(db.id) is None
+    # Nothing is written since the pages are fetched first.
+    tables = store.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    assert store.table_name(db.id) not in {row[0] for row in tables}
+
+    # Without reconciling, only the filtered query is made.
+    assert store.sync(db, state, reconcile=False) == 3
+    assert state.watermark == START + timedelta(minutes=2)
+    assert state.known_ids == {"page-0", "page-1", "page-2"}
+
+
+def test_mirror_without_client(store: SQLiteStore, full_db: dict[str, Any]):
+
+    with pytest.raises(NoClientFoundError):
+        store.mirror(Database.from_dict(full_db))
@@ -0,0 +1,101 @@
+import copy
+import json
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+
+import httpx
+
+from nopy.objects.database import Database
+from nopy.sync import SyncState
+
+
+def query_response(results: list[dict[str, Any]]) -> httpx.Response:
+
+    return httpx.Response(
+        200, json={"results": results, "has_more": False, "next_cursor": None}
+    )
+
+
+def make_page(normal_page: dict[str, Any], id: str, edited: str) -> dict[str, Any]:
+
+    page = copy.deepcopy(normal_page)
+    page["id"] = id
+    page["last_edited_time"] = edited
+    return page
+
+
+def test_state_round_trip():
+
+    state = SyncState(datetime(2023, 1, 1, tzinfo=timezone.utc), {"b", "a"})
+    serialized = state.serialize()
+
+    assert serialized == {
+        "watermark": "2023-01-01T00:00:00+00:00",
+        "known_ids": ["a", "b"],
+    }
+    assert SyncState.from_dict(serialized) == state
+
+
+def test_sync_changes(mock_client: Any, full_db: dict[str, Any], normal_page: Any):
+
+    bodies: list[dict[str, Any]] = []
+    pages = [
+        make_page(normal_page, "page-1", "2023-01-01T10:00:00.000Z"),
+        make_page(normal_page, "page-2", "2023-01-02T10:00:00.000Z"),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return query_response(pages)
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(handler))
+    state = SyncState()
+
+    assert [page.id for page in db.sync_changes(state)] == ["page-1", "page-2"]
+    assert "filter" not in bodies[0]
+    assert state.watermark == datetime(2023, 1, 2, 10, tzinfo=timezone.utc)
+    assert state.known_ids == {"page-1", "page-2"}
+
+    list(db.sync_changes(state))
+    assert bodies[1]["filter"] == {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"on_or_after": "2023-01-02T10:00:00+00:00"},
+    }
+
+
+def test_sync_changes_stopped_midway(
+    mock_client: Any, full_db: dict[str, Any], normal_page: Any
+):
+
+    pages = [
+        make_page(normal_page, "page-1", "2023-01-01T10:00:00.000Z"),
+        make_page(normal_page, "page-2", "2023-01-02T10:00:00.000Z"),
+    ]
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(lambda _: query_response(pages)))
+    state = SyncState()
+
+    changes = db.sync_changes(state)
+    next(changes)
+    next(changes)
+    changes.close()
+
+    # The second page was never fully consumed.
+    assert state.known_ids == {"page-1"}
+
+
+def test_reconcile_deletions(
+    mock_client: Any, full_db: dict[str, Any], normal_page: Any
+):
+
+    pages = [make_page(normal_page, "page-1", "2023-01-01T10:00:00.000Z")]
+
+    db = Database.from_dict(full_db)
+    db.set_client(mock_client(lambda _: query_response(pages)))
+    state = SyncState(known_ids={"page-1", "page-2"})
+
+    assert db.reconcile_deletions(state) == {"page-2"}
+    assert state.known_ids == {"page-1"}
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+import pytest
+
+from nopy.utils import apaginate
+from nopy.utils import paginate
+from nopy.utils import plain_text
+from nopy.utils import rich_text_list
+
+
+class FakeAPI:
+    """Returns `batches` batches of `size` results each."""
+
+    def __init__(self, batches: int = 3, size: int = 2, fail_on: int = -1):
+
+        self.batches = batches
+        self.size = size
+        self.fail_on = fail_on
+        self.calls: list[Optional[str]] = []
+        self.threads: set[str] = set()
+
+    def __call__(self, start_cursor: Optional[str] = None) -> dict[str, Any]:
+
+        self.calls.append(start_cursor)
+        self.threads.add(threading.current_thread().name)
+        index = int(start_cursor or 0)
+        if index == self.fail_on:
+            raise RuntimeError("request failed")
+
+        has_more = index + 1 < self.batches
+        return {
+            "results": [index * self.size + i for i in range(self.size)],
+            "has_more": has_more,
+            "next_cursor": str(index + 1) if has_more else None,
+        }
+
+    async def call_async(self, start_cursor: Optional[str] = None) -> dict[str, Any]:
+
+        return self(start_cursor)
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_paginate(prefetch: int):
+
+    api = FakeAPI()
+    results = list(paginate(api, identity, prefetch=prefetch))
+
+    assert results == list(range(6))
+    assert api.calls == [None, "1", "2"]
+
+
+def test_paginate_prefetches_on_worker_thread():
+
+    api = FakeAPI()
+    list(paginate(api, identity, prefetch=1))
+
+    assert api.threads == {"nopy-prefetch"}
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_paginate_max_pages(prefetch: int):
+
+    api = FakeAPI(batches=10)
+    results = list(paginate(api, identity, max_pages=3, prefetch=prefetch))
+
+    assert results == [0, 1, 2]
+
+
+def test_prefetch_is_bounded():
+
+    api = FakeAPI(batches=50)
+    pages = paginate(api, identity, prefetch=2)
+    next(pages)
+    time.sleep(0.2)
+
+    # One batch being consumed, two buffered and one waiting to be buffered.
+    assert len(api.calls) <= 4
+    pages.close()
+
+
+def test_prefetch_propagates_errors():
+
+    api = FakeAPI(fail_on=1)
+    with pytest.raises(RuntimeError):
+        list(paginate(api, identity, prefetch=1))
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_apaginate(prefetch: int):
+
+    api = FakeAPI()
+
+    async def run():
+        pages = apaginate(api.call_async, identity, prefetch=prefetch)
+        return [page async for page in pages]
+
+    assert asyncio.run(run()) == list(range(6))
+    assert api.calls == [None, "1", "2"]
+
+
+def test_plain_text(normal_page: dict[str, Any]):
+
+    rich_text = [
+        {**rt, "type": "text", "plain_text": text, "text": {"content": text}}
+        for rt, text in zip(
+            normal_page["properties"]["title"]["title"] * 2, [" a ", "b "]
+        )
+    ]
+
+    assert plain_text(rich_text) == "a b"
+    assert plain_text(rich_text) == " ".join(
+        rt.plain_text for rt in rich_text_list(rich_text)
+    )